@@ -19,6 +19,8 @@ Analise a complexidade do algoritmo proposto."""
 
 import math
 import heapq
+from dfs import dfs_visit
+from heuristicas import euclidean_heuristic
 
 def distancia(a, b):
     return math.sqrt((a[0]-b[0])**2 + (a[1]-b[1])**2)
@@ -50,15 +52,22 @@ def construir_grafo(sensores):
 
 # Implementação clássica do Dijkstra com min-heap (heapq)
 # Retorna o caminho mínimo entre 'start' e 'end'
-def dijkstra(adj, start, end):
+#
+# Se as coordenadas dos sensores forem passadas, vira A*: a heap é
+# ordenada por dist[v] + h(v), com h(v) = distância em linha reta de v
+# até 'end' (heuristicas.euclidean_heuristic). Como o peso de cada aresta
+# é o próprio comprimento do segmento, h nunca superestima o que falta,
+# o caminho continua mínimo e a busca anda "na direção" de 'end'.
+def dijkstra(adj, start, end, sensores=None):
     n = len(adj)
     dist = [float('inf')] * n                # distâncias mínimas
     parent = [-1] * n                        # para reconstruir caminho
     dist[start] = 0                          # distância do início é 0
-    pq = [(0, start)]                        # heap (distância, vértice)
+    h = euclidean_heuristic(sensores, end) if sensores is not None else (lambda v: 0)
+    pq = [(h(start), start)]                 # heap (distância + heurística, vértice)
     while pq:
-        d, u = heapq.heappop(pq)             # pega vértice de menor distância atual
-        if d > dist[u]:                     
+        chave, u = heapq.heappop(pq)         # pega vértice de menor estimativa atual
+        if chave > dist[u] + h(u):
             continue
         if u == end:                         # se chegou ao destino, pode parar
             break
@@ -67,7 +76,7 @@ def dijkstra(adj, start, end):
             if dist[u] + w < dist[v]:
                 dist[v] = dist[u] + w
                 parent[v] = u
-                heapq.heappush(pq, (dist[v], v))
+                heapq.heappush(pq, (dist[v] + h(v), v))
     # se não alcança o destino
     if dist[end] == float('inf'):
         return None
@@ -83,8 +92,8 @@ def dijkstra(adj, start, end):
 
 def rota_completa(sensores, si, sf):
     adj = construir_grafo(sensores)          # constrói o grafo
-    ida = dijkstra(adj, si, sf)              # caminho de ida
-    volta = dijkstra(adj, sf, si)            # caminho de volta
+    ida = dijkstra(adj, si, sf, sensores)    # caminho de ida (A* euclidiano)
+    volta = dijkstra(adj, sf, si, sensores)  # caminho de volta
     if ida is None or volta is None:         # se qualquer lado for impossível
         return None
     return ida + volta[1:]                  # remove duplicação do vértice central (sf)
@@ -123,51 +132,50 @@ def eh_ponte(adj, u, v):
     """
 
     n = len(adj)                       # quantidade de vértices
-    visited = [False] * n              # marca se vértice já foi visitado
-    tin = [-1] * n                     # tempo de descoberta do vértice
+    tin = [-1] * n                     # tempo de descoberta do vértice (-1 = não visitado)
+    post = [-1] * n                    # tempo de finalização (exigido pelo motor da DFS)
+    parents = [-1] * n                 # pai de cada vértice na árvore DFS
     low = [-1] * n                     # menor tempo alcançável via ancestrais ou back-edges
-    timer = [0]                        # contador mutável usado dentro da DFS
+    timer = [0]                        # contador de descoberta
+    post_timer = [0]                   # contador de finalização
     is_bridge = [False]                # será marcado como True se (u, v) for ponte
 
-    # DFS para calcular tin[x] e low[x]
-    # parent: pai no DFS (para não contar aresta de retorno
-    # como aresta de árvore)
-    def dfs(x, parent):
-        visited[x] = True
-        tin[x] = low[x] = timer[0]     # tanto tin quanto low começam iguais
-        timer[0] += 1                  # incrementa tempo global
-
-        # percorre todos os vizinhos de x
-        for y in adj[x]:
+    # A DFS usa o motor iterativo de dfs.py (pilha explícita);
+    # os callbacks calculam tin[x] e low[x]
+    def on_discover(x):
+        low[x] = tin[x]                # tanto tin quanto low começam iguais
 
-            # ignora a aresta que volta para o pai
-            if y == parent:
-                continue
+    def on_nontree_edge(x, y):
+        # ignora a aresta que volta para o pai
+        if y == parents[x]:
+            return
+        # caso de aresta de retorno (back-edge)
+        # atualiza low[x] usando tin[y]
+        low[x] = min(low[x], tin[y])
 
-            if not visited[y]:
-                # seguimos na árvore DFS
-                dfs(y, x)
+    def on_finish(y):
+        x = parents[y]
+        if x == y:                     # raiz não tem aresta de árvore acima
+            return
 
-                # atualiza low[x] baseado no filho y
-                low[x] = min(low[x], low[y])
+        # atualiza low[x] baseado no filho y
+        low[x] = min(low[x], low[y])
 
-                # condição clássica de ponte:
-                # se low[y] > tin[x], então a aresta (x, y) é ponte
-                if low[y] > tin[x]:
+        # condição clássica de ponte:
+        # se low[y] > tin[x], então a aresta (x, y) é ponte
+        if low[y] > tin[x]:
 
-                    # verifica se justamente a aresta testada é (u, v)
-                    if (x == u and y == v) or (x == v and y == u):
-                        is_bridge[0] = True
-
-            else:
-                # caso de aresta de retorno (back-edge)
-                # atualiza low[x] usando tin[y]
-                low[x] = min(low[x], tin[y])
+            # verifica se justamente a aresta testada é (u, v)
+            if (x == u and y == v) or (x == v and y == u):
+                is_bridge[0] = True
 
     # Chamamos a DFS a partir do vértice 0
     # (assume-se grafo conectado, ou ao menos que
     # a aresta buscada está no mesmo componente)
-    dfs(0, -1)
+    parents[0] = 0
+    dfs_visit(adj.__getitem__, 0, tin, timer, post, post_timer, parents,
+              on_discover=on_discover, on_nontree_edge=on_nontree_edge,
+              on_finish=on_finish)
 
     return is_bridge[0]
 
@@ -188,8 +196,8 @@ def eh_ponte(adj, u, v):
 # pois são apenas acessos O(1) durante o DFS.
 #
 # Complexidade espacial:
-#   Arrays visited, tin, low → O(V)
-#   Pilha recursiva da DFS → O(V) no pior caso
+#   Arrays tin, post, parents, low → O(V)
+#   Pilha explícita da DFS → O(V) no pior caso
 
 """ 3) Uma empresa está projetando a infraestrutura de comunicação para sua nova planta industrial.
 A planta possui diversos prédios que precisam ser conectados através de fibra óptica.
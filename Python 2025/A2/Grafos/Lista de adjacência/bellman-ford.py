@@ -1,6 +1,15 @@
+import time
 from graph_list import GraphList
+from instrumentacao import current_stats
+
+def bellman_ford(graph: GraphList, v0: int, stats=None):
+    """
+    stats: AlgoStats opcional (ver instrumentacao.py); registra rounds,
+           relaxations e o tempo das fases "relaxamento" e "ciclo_negativo".
+    """
+    stats = current_stats(stats)
+    inicio = time.perf_counter()
 
-def bellman_ford(graph: GraphList, v0: int):
     num_vertices = graph.num_vertices
     parent = [-1] * num_vertices
     distance = [float('inf')] * num_vertices
@@ -9,6 +18,8 @@ def bellman_ford(graph: GraphList, v0: int):
     parent[v0] = v0
     distance[v0] = 0
 
+    relaxations = 0
+
     # Relaxa todas as arestas V-1 vezes
     for _ in range(num_vertices - 1):
         for v1 in range(num_vertices):
@@ -16,12 +27,25 @@ def bellman_ford(graph: GraphList, v0: int):
                 if distance[v1] != float('inf') and distance[v1] + cost < distance[v2]:
                     distance[v2] = distance[v1] + cost
                     parent[v2] = v1
+                    relaxations += 1
+
+    fim_relaxamento = time.perf_counter()
+    sem_ciclo = True
 
     # Verifica se há ciclo negativo
     for v1 in range(num_vertices):
         for v2, cost in graph.adj_list[v1]:
             if distance[v1] != float('inf') and distance[v1] + cost < distance[v2]:
                 print("Ciclo negativo detectado!")
-                return parent, distance, False
+                sem_ciclo = False
+                break
+        if not sem_ciclo:
+            break
+
+    if stats is not None:
+        stats.record("bellman_ford",
+                     {"rounds": max(num_vertices - 1, 0), "relaxations": relaxations},
+                     {"relaxamento": fim_relaxamento - inicio,
+                      "ciclo_negativo": time.perf_counter() - fim_relaxamento})
 
-    return parent, distance, True
+    return parent, distance, sem_ciclo
@@ -0,0 +1,158 @@
+import time
+
+import numpy as np
+
+from conversoes import csr_numpy
+from instrumentacao import current_stats
+
+# Bellman-Ford vetorizado sobre vetores paralelos de arestas
+# ================================================================
+#
+# As arestas ficam em três vetores paralelos (origem, destino, peso),
+# ordenados por destino uma única vez. Cada rodada é feita inteira com
+# operações NumPy, sem laço em Python sobre vértices ou arestas:
+#
+#   1. candidato = dist[origem] + peso              (gather, uma posição por aresta)
+#   2. melhor[v] = min dos candidatos que chegam em v
+#      (np.minimum.reduceat nas faixas de cada destino — as arestas estão
+#       agrupadas por destino, então cada faixa é contígua)
+#   3. melhora   = melhor < dist[v]; se nenhuma, as distâncias convergiram
+#   4. o pai de cada v que melhorou é a primeira aresta da faixa que
+#      atinge o mínimo
+#
+# As rodadas são "síncronas" (Jacobi): todas usam a distância do fim da
+# rodada anterior, então depois de k rodadas dist[v] é o menor custo com
+# até k arestas. Se a V-ésima rodada ainda melhora alguma distância, há
+# ciclo negativo alcançável a partir de v0 — o mesmo critério do
+# bellman_ford. Sem ciclo, para assim que uma rodada não muda nada
+# (tipicamente bem antes de V-1 rodadas).
+#
+# Com ciclo negativo as distâncias nunca convergem e seriam V rodadas.
+# Para não pagar isso, a cada log2(V) rodadas procura-se um ciclo no
+# grafo dos pais (como em spfa.py), agora com saltos de ponteiro
+# vetorizados: depois de log2(V) quadraturas de parent, todo vértice
+# aponta para dentro de um ciclo (ou para v0). Se o ciclo achado tem
+# peso negativo, a busca para.
+
+
+def edge_arrays(graph):
+    """
+    Vetores paralelos (origens, destinos, pesos) de todas as arestas,
+    ordenados por destino.
+    """
+    csr, offsets, targets, weights = csr_numpy(graph)
+    origens = np.repeat(np.arange(csr.num_vertices, dtype=np.int64), np.diff(offsets))
+    ordem = np.argsort(targets, kind="stable")
+    return origens[ordem], targets[ordem].astype(np.int64), weights[ordem]
+
+
+def _ciclo_negativo_de_pais(parent, peso_pai, v0):
+    # True se o grafo dos pais tem um ciclo de peso negativo
+    pai = np.where(parent == -1, v0, parent)
+    if pai[v0] == v0:
+        ancestral = pai
+        for _ in range(pai.size.bit_length()):
+            ancestral = ancestral[ancestral]
+        suspeitos = np.flatnonzero(ancestral != v0)
+        if not suspeitos.size:
+            return False
+        x = int(ancestral[suspeitos[0]])
+    else:
+        # v0 foi relaxado: ele mesmo está num ciclo ou abaixo de um
+        x = v0
+        for _ in range(pai.size):
+            x = int(pai[x])
+
+    # x está no ciclo: dá a volta somando os pesos das arestas dos pais
+    soma, y = peso_pai[x], int(pai[x])
+    while y != x:
+        soma += peso_pai[y]
+        y = int(pai[y])
+    return soma < 0
+
+
+def bellman_ford_vectorized(graph, v0: int, stats=None, como_lista: bool = True):
+    """
+    Mesmo contrato de bellman_ford (bellman-ford.py). Aceita GraphList,
+    GraphCSR ou as matrizes (convertidas por conversoes.to_csr).
+
+    Parâmetros:
+        como_lista: True → parent e distance como listas Python, igual ao
+                    bellman_ford; False → os vetores NumPy, sem conversão
+
+    Retorna:
+        (parent, distance, sem_ciclo)
+            parent   → parent[v0] = v0, -1 se inalcançável (int64 no NumPy)
+            distance → inf se inalcançável (float64 no NumPy)
+            sem_ciclo → bool; False se há ciclo negativo alcançável a partir de v0
+    Com empates, o pai escolhido pode ser outro vértice de mesma distância.
+    """
+    stats = current_stats(stats)
+    inicio = time.perf_counter()
+
+    origens, destinos, pesos = edge_arrays(graph)
+    num_vertices = graph.num_vertices
+
+    parent = np.full(num_vertices, -1, dtype=np.int64)
+    distance = np.full(num_vertices, np.inf)
+    peso_pai = np.zeros(num_vertices)   # peso da aresta parent[v] → v
+    parent[v0] = v0
+    distance[v0] = 0
+
+    # Faixa de cada destino dentro dos vetores ordenados
+    alvos, comeco = np.unique(destinos, return_index=True)
+    tamanhos = np.diff(np.append(comeco, destinos.size))
+    fim_preparo = time.perf_counter()
+
+    rounds = relaxations = 0
+    sem_ciclo = True
+    intervalo_checagem = max(1, num_vertices.bit_length())
+
+    while destinos.size:
+        candidato = distance[origens] + pesos
+        melhor = np.minimum.reduceat(candidato, comeco)
+
+        melhora = melhor < distance[alvos]
+        if not melhora.any():
+            break
+        if rounds == num_vertices - 1:
+            # A V-ésima rodada ainda melhora: ciclo negativo
+            sem_ciclo = False
+            break
+        rounds += 1
+
+        # Arestas que atingem o novo mínimo do seu destino; como as faixas
+        # são contíguas, a primeira de cada destino é a que não repete o anterior
+        # (destinos que não melhoraram recebem -inf, que nenhum candidato atinge)
+        melhor_da_aresta = np.repeat(np.where(melhora, melhor, -np.inf), tamanhos)
+        vencedoras = np.flatnonzero(candidato == melhor_da_aresta)
+        v = destinos[vencedoras]
+        primeira = np.ones(v.size, dtype=bool)
+        primeira[1:] = v[1:] != v[:-1]
+        vencedoras, v = vencedoras[primeira], v[primeira]
+
+        distance[v] = candidato[vencedoras]
+        parent[v] = origens[vencedoras]
+        peso_pai[v] = pesos[vencedoras]
+        relaxations += v.size
+
+        if rounds % intervalo_checagem == 0 and _ciclo_negativo_de_pais(parent, peso_pai, v0):
+            sem_ciclo = False
+            break
+
+    if stats is not None:
+        stats.record("bellman_ford_vectorized",
+                     {"rounds": rounds, "relaxations": relaxations},
+                     {"preparo": fim_preparo - inicio,
+                      "relaxamento": time.perf_counter() - fim_preparo})
+
+    if como_lista:
+        return parent.tolist(), distance.tolist(), sem_ciclo
+    return parent, distance, sem_ciclo
+
+# Complexidade:
+#   Tempo: O(E log E) para ordenar as arestas + O(E) vetorizado por rodada,
+#          com até V rodadas (O(V · E) no pior caso, como o original), mas só
+#          O(k) iterações em Python, k = maior número de arestas num caminho mínimo
+#   Checagem do grafo dos pais: O(V log V) a cada log2(V) rodadas
+#   Espaço: O(V + E)
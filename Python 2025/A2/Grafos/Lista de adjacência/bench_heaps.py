@@ -0,0 +1,59 @@
+import random
+import time
+
+from graph_list import GraphList
+from dijkstra import dijkstra
+from prim import prim
+from instrumentacao import AlgoStats
+
+# Comparação: heapq com remoção preguiçosa × heap d-ário indexado
+# ================================================================
+#
+# Para grafos esparsos e densos, roda dijkstra e prim nas duas versões
+# e mostra o melhor tempo, os pops, os pops obsoletos e o pico do heap.
+#
+#   python bench_heaps.py
+
+
+def grafo_aleatorio(num_vertices: int, num_arestas: int, seed: int = 0) -> GraphList:
+    rng = random.Random(seed)
+    us = [rng.randrange(num_vertices) for _ in range(num_arestas)]
+    vs = [rng.randrange(num_vertices) for _ in range(num_arestas)]
+    ws = [rng.random() for _ in range(num_arestas)]
+    return GraphList.from_edges(num_vertices, us, vs, ws, direcionado=False)
+
+
+def medir(funcao, repeticoes: int = 3):
+    # Melhor tempo entre as repetições + estatísticas de uma execução
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao(None)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    stats = AlgoStats()
+    funcao(stats)
+    return melhor, stats
+
+
+def main():
+    casos = [
+        ("esparso", 50_000, 200_000),
+        ("denso", 1_500, 600_000),
+    ]
+    print(f"{'grafo':8} {'algoritmo':9} {'heap':8} {'tempo(s)':>9} "
+          f"{'pops':>9} {'obsoletos':>9} {'pico':>8}")
+    for nome, n, m in casos:
+        graph = grafo_aleatorio(n, m)
+        for algoritmo, rodar in (
+            ("dijkstra", lambda s, idx: dijkstra(graph, 0, stats=s, indexed=idx)),
+            ("prim", lambda s, idx: prim(graph, stats=s, indexed=idx)),
+        ):
+            for heap, indexed in (("heapq", False), ("indexado", True)):
+                tempo, stats = medir(lambda s: rodar(s, indexed))
+                c = stats.counters
+                print(f"{nome:8} {algoritmo:9} {heap:8} {tempo:9.3f} "
+                      f"{c['heap_pop']:9} {c['stale_skip']:9} {stats.peak_heap:8}")
+
+
+if __name__ == "__main__":
+    main()
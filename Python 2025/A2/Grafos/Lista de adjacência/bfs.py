@@ -1,7 +1,22 @@
 from graph_list import GraphList
+from graph_csr import reverse_adjacency
+from dfs import Visitados, neighbors_of
 from collections import deque
+from array import array
+import time
+
+def bfs(graph: GraphList, v0: int, direction_optimizing: bool = False, reverse=None):
+    """
+    Parâmetros:
+        direction_optimizing: usa bfs_direction_optimizing (mesmo retorno)
+        reverse: visão reversa do grafo, repassada a bfs_direction_optimizing;
+                 se None, é montada com reverse_adjacency(graph) a cada
+                 chamada. Para muitas buscas no mesmo grafo, monte uma vez
+                 e repasse.
+    """
+    if direction_optimizing:
+        return bfs_direction_optimizing(graph, v0, reverse)
 
-def bfs(graph: GraphList, v0: int):
     num_vertices = graph.num_vertices
     order = [-1] * num_vertices    
     parent = [-1] * num_vertices    
@@ -34,8 +49,417 @@ def reconstruir_caminho(parent, origem, destino):
     return caminho
 
 
+def iter_bfs(graph, v0: int, max_depth=None, num_vertices=None):
+    """
+    BFS preguiçosa a partir de v0, na mesma ordem da bfs.
+
+    Parâmetros:
+        graph: GraphList/GraphCSR, ou uma função v → iterável de vizinhos
+        max_depth: se dado, não desce além desta profundidade
+        num_vertices: só usado com função (ver Visitados em dfs.py)
+
+    Gera:
+        (v, pai, profundidade), com pai = v0 e profundidade 0 para a raiz.
+    """
+    neighbors, num_vertices = neighbors_of(graph, num_vertices)
+    visitados = Visitados(num_vertices)
+
+    visitados.add(v0)
+    yield v0, v0, 0
+    queue = deque([(v0, 0)])
+
+    while queue:
+        v1, profundidade = queue.popleft()
+        if profundidade == max_depth:
+            continue
+        for v2 in neighbors(v1):
+            if v2 not in visitados:
+                visitados.add(v2)
+                yield v2, v1, profundidade + 1
+                queue.append((v2, profundidade + 1))
+
+# Complexidade:
+#   Tempo: O(vértices e arestas efetivamente explorados) — O(V + E) no máximo
+#   Espaço: O(explorados), ou O(V) bytes depois da troca para o vetor
+
+
+# BFS 0-1: menor caminho quando todo peso é 0 ou 1
+# ================================================================
+#
+# Troca o heap do Dijkstra por uma deque: quem chega por aresta de peso 0
+# tem a mesma distância do vértice atual e entra na FRENTE; quem chega por
+# peso 1 entra no FIM. A deque fica sempre ordenada por distância, com no
+# máximo dois valores (d e d + 1), então a frente é sempre o menor —
+# o mesmo que o heap garantiria, sem o custo de log.
+#
+# Retorna (parent, distance) como dijkstra. dijkstra(graph, v0) passa
+# para cá sozinho quando o grafo está congelado e só tem pesos 0 e 1.
+
+def bfs_01(graph: GraphList, v0: int, stats=None):
+    inicio = time.perf_counter()
+
+    num_vertices = graph.num_vertices
+    parent = [-1] * num_vertices
+    distance = [float('inf')] * num_vertices
+    checked = [False] * num_vertices
+
+    parent[v0] = v0
+    distance[v0] = 0
+    deq = deque([v0])
+    pushes, stale = 1, 0
+
+    while deq:
+        v1 = deq.popleft()
+        if checked[v1]:
+            stale += 1      # já saiu antes com distância menor
+            continue
+        checked[v1] = True
+
+        for v2, peso in graph.adj_list[v1]:
+            nova = distance[v1] + peso
+            if nova < distance[v2]:
+                distance[v2] = nova
+                parent[v2] = v1
+                if peso:
+                    deq.append(v2)
+                else:
+                    deq.appendleft(v2)
+                pushes += 1
+
+    if stats is not None:
+        stats.record("bfs_01",
+                     {"heap_push": pushes, "heap_pop": pushes, "stale_skip": stale,
+                      "relaxations": pushes - 1},
+                     {"busca": time.perf_counter() - inicio})
+
+    return parent, distance
+
+# Complexidade:
+#   Tempo: O(V + E) — cada vértice entra na deque no máximo uma vez por melhora
+#          (≤ 2 vezes), contra O((V + E) log E) do dijkstra com heap
+#   Espaço: O(V)
+
+
+# Menor caminho (em número de arestas) entre s e t por BFS bidirecional
+# ================================================================
+#
+# Uma busca sai de s pelas arestas de saída e outra sai de t pelas
+# arestas de entrada (grafo reverso). A cada passo expande-se um nível
+# inteiro da MENOR das duas fronteiras. Quando um vértice descoberto já
+# foi visitado pela outra busca, os caminhos se encontram; o nível é
+# terminado para escolher o encontro de menor soma de distâncias e o
+# caminho é costurado com os dois dicionários de pais.
+#
+# Em vez de visitar todo o grafo como bfs + reconstruir_caminho, cada
+# lado só cresce até mais ou menos metade da distância.
+
+def shortest_path_bfs(graph: GraphList, s: int, t: int, reverse=None):
+    """
+    Parâmetros:
+        reverse: visão reversa do grafo; se None, é montada com
+                 reverse_adjacency(graph) (o próprio grafo se não direcionado).
+                 Para muitas consultas no mesmo grafo, monte uma vez e repasse.
+
+    Retorna:
+        lista de vértices de s até t, ou None se t é inalcançável.
+    """
+    if s == t:
+        return [s]
+    if reverse is None:
+        reverse = reverse_adjacency(graph)
+
+    # Pais e distâncias de cada lado (dicionários: só os vértices visitados)
+    parent_s, dist_s = {s: s}, {s: 0}
+    parent_t, dist_t = {t: t}, {t: 0}
+    frontier_s, frontier_t = [s], [t]
+
+    while frontier_s and frontier_t:
+        # Expande o lado com menos arestas de saída na fronteira
+        custo_s = sum(graph.degree(v) for v in frontier_s)
+        custo_t = sum(reverse.degree(v) for v in frontier_t)
+        avanca_s = custo_s <= custo_t
+        if avanca_s:
+            lado, frontier = graph, frontier_s
+            parent, dist, dist_outro = parent_s, dist_s, dist_t
+        else:
+            lado, frontier = reverse, frontier_t
+            parent, dist, dist_outro = parent_t, dist_t, dist_s
+
+        encontro, melhor = -1, -1
+        next_frontier = []
+        for v1 in frontier:
+            for v2, _ in lado.adj_list[v1]:
+                if v2 in dist:
+                    continue
+                parent[v2] = v1
+                dist[v2] = dist[v1] + 1
+                next_frontier.append(v2)
+                if v2 in dist_outro:
+                    total = dist[v2] + dist_outro[v2]
+                    if melhor == -1 or total < melhor:
+                        encontro, melhor = v2, total
+
+        if encontro != -1:
+            # s → ... → encontro pelos pais de s; encontro → ... → t pelos pais de t
+            caminho = [encontro]
+            while caminho[-1] != s:
+                caminho.append(parent_s[caminho[-1]])
+            caminho.reverse()
+            while caminho[-1] != t:
+                caminho.append(parent_t[caminho[-1]])
+            return caminho
+
+        if avanca_s:
+            frontier_s = next_frontier
+        else:
+            frontier_t = next_frontier
+
+    return None
+
+# Complexidade:
+#   Pior caso O(V + E), como a bfs; em grafos com fator de ramificação b
+#   e distância d, visita ~2·b^(d/2) vértices em vez de ~b^d
+
+
+# BFS com várias origens
+# ================================================================
+#
+# Todas as origens entram na fila com distância 0; cada vértice é
+# alcançado primeiro pela origem mais próxima (em número de arestas).
+# Empates ficam com a origem que aparece antes em `sources`.
+#
+# Além de order/parent (parent[s] = s para cada origem), devolve:
+#   distance[v] = distância até a origem mais próxima (-1 se inalcançável)
+#   owner[v]    = essa origem (-1 se inalcançável)
+
+def bfs_multi_source(graph: GraphList, sources):
+    num_vertices = graph.num_vertices
+    order = [-1] * num_vertices
+    parent = [-1] * num_vertices
+    distance = [-1] * num_vertices
+    owner = [-1] * num_vertices
+    queue = deque()
+    counter = 0
+
+    for s in sources:
+        if order[s] == -1:
+            order[s] = counter
+            counter += 1
+            parent[s] = s
+            distance[s] = 0
+            owner[s] = s
+            queue.append(s)
+
+    while queue:
+        v1 = queue.popleft()
+        for v2, _ in graph.adj_list[v1]:
+            if order[v2] == -1:
+                order[v2] = counter
+                parent[v2] = v1
+                distance[v2] = distance[v1] + 1
+                owner[v2] = owner[v1]
+                counter += 1
+                queue.append(v2)
+    return order, parent, distance, owner
+
+# Complexidade:
+#   Tempo: O(V + E), uma única passada para todas as origens
+#   Espaço: O(V)
+
+
+# MS-BFS bit-paralela (Then et al., "The More the Merrier")
+# ================================================================
+#
+# Roda até WORD_BITS buscas independentes ao mesmo tempo. Cada vértice
+# guarda uma palavra em que o bit i diz respeito à i-ésima raiz do lote:
+#
+#   seen[v]  → raízes que já alcançaram v
+#   visit[v] → raízes para as quais v está na fronteira atual
+#
+# Em cada nível, um vértice da fronteira espalha a palavra inteira para
+# os vizinhos com um único OR, em vez de uma BFS por raiz:
+#
+#   visit_next[n] |= visit[v]        para cada aresta v → n
+#   visit_next[n] &= ~seen[n]        descarta quem já tinha chegado em n
+#
+# Os bits que sobram em visit_next[n] são as raízes que descobrem n
+# neste nível. Vértices compartilhados por muitas buscas (comum em
+# grafos de diâmetro pequeno) são percorridos uma vez só por nível.
+#
+# Retorna distance[i][v] = número de arestas de roots[i] até v (-1 se
+# inalcançável), uma array('i') por raiz. Raízes além de WORD_BITS são
+# processadas em lotes sucessivos.
+#
+# Com com_pais=True também devolve parent[i][v] (parent[i][roots[i]] =
+# roots[i], -1 se inalcançável): ao espalhar a palavra de v, os bits que
+# ainda não tinham chegado em n neste nível têm v como pai. Custa um
+# passo por par (raiz, vértice) descoberto, o mesmo das distâncias.
+
+WORD_BITS = 64
+
+
+def ms_bfs(graph: GraphList, roots, word_bits: int = WORD_BITS, com_pais: bool = False):
+    """
+    Retorna:
+        distance (uma array('i') por raiz), ou (distance, parent) se
+        com_pais=True, com parent também uma array('i') por raiz.
+    """
+    num_vertices = graph.num_vertices
+    roots = list(roots)
+    distance = [array('i', [-1]) * num_vertices for _ in roots]
+    parent = [array('i', [-1]) * num_vertices for _ in roots] if com_pais else None
+
+    for base in range(0, len(roots), word_bits):
+        lote = roots[base:base + word_bits]
+        seen = [0] * num_vertices
+
+        # Fronteira como dicionário vértice → palavra, só com vértices ativos
+        visit = {}
+        for i, r in enumerate(lote):
+            bit = 1 << i
+            seen[r] |= bit
+            visit[r] = visit.get(r, 0) | bit
+            distance[base + i][r] = 0
+            if com_pais:
+                parent[base + i][r] = r
+
+        level = 0
+        while visit:
+            level += 1
+            visit_next = {}
+            for v1, palavra in visit.items():
+                if not com_pais:
+                    for v2, _ in graph.adj_list[v1]:
+                        visit_next[v2] = visit_next.get(v2, 0) | palavra
+                    continue
+                for v2, _ in graph.adj_list[v1]:
+                    # Raízes que chegam em v2 pela primeira vez, e por v1
+                    anterior = visit_next.get(v2, 0)
+                    novos = palavra & ~seen[v2] & ~anterior
+                    while novos:
+                        menor = novos & -novos
+                        parent[base + menor.bit_length() - 1][v2] = v1
+                        novos ^= menor
+                    visit_next[v2] = anterior | palavra
 
+            visit = {}
+            for v2, palavra in visit_next.items():
+                palavra &= ~seen[v2]
+                if not palavra:
+                    continue
+                seen[v2] |= palavra
+                visit[v2] = palavra
 
+                # Registra a distância para cada raiz (bit) que chegou agora
+                while palavra:
+                    menor = palavra & -palavra
+                    distance[base + menor.bit_length() - 1][v2] = level
+                    palavra ^= menor
 
+    if com_pais:
+        return distance, parent
+    return distance
 
+# Complexidade (k raízes, w = word_bits):
+#   Tempo: O(ceil(k / w) · (V + E)) operações de palavra no pior caso,
+#          contra O(k · (V + E)) de k chamadas da bfs
+#   Espaço: O(V) palavras por lote + O(k · V) para a tabela de distâncias
+#           (e outro O(k · V) para os pais com com_pais=True)
+
+
+# BFS com otimização de direção (top-down / bottom-up), no estilo de Beamer
+# ================================================================
+#
+# Top-down (BFS clássica): cada vértice da fronteira percorre TODAS as
+# suas arestas de saída procurando vizinhos não visitados.
+#
+# Bottom-up: cada vértice ainda NÃO visitado procura, entre os seus
+# vizinhos de entrada, algum que esteja na fronteira; ao achar o
+# primeiro, para. Quando a fronteira é enorme (níveis do meio em grafos
+# de diâmetro pequeno), quase todo vértice acha um pai logo nas
+# primeiras arestas, e muito menos arestas são examinadas.
+#
+# Heurística de troca:
+#   top-down → bottom-up quando m_f > m_u / alpha
+#       m_f = arestas que saem da fronteira
+#       m_u = arestas que saem dos vértices ainda não visitados
+#   bottom-up → top-down quando n_f < n / beta
+#       n_f = tamanho da fronteira
+#
+# Retorna os mesmos vetores order/parent da bfs: os vértices de um
+# nível sempre recebem números de ordem maiores que os do nível
+# anterior e parent[v] é um vizinho de v no nível anterior. Dentro de um
+# mesmo nível, a ordem (e a escolha do pai) pode diferir da versão
+# top-down pura.
+
+ALPHA = 14
+BETA = 24
+
+
+def bfs_direction_optimizing(graph: GraphList, v0: int, reverse=None,
+                             alpha: int = ALPHA, beta: int = BETA):
+    """
+    Parâmetros:
+        reverse: visão reversa do grafo (vizinhos de entrada); se None,
+                 é montada com reverse_adjacency(graph)
+    """
+    num_vertices = graph.num_vertices
+    if reverse is None:
+        reverse = reverse_adjacency(graph)
+
+    order = [-1] * num_vertices
+    parent = [-1] * num_vertices
+    in_frontier = bytearray(num_vertices)
+    counter = 0
+
+    order[v0] = counter
+    counter += 1
+    parent[v0] = v0
+    frontier = [v0]
+
+    m_f = graph.degree(v0)
+    m_u = graph.num_edges - m_f
+    bottom_up = False
+
+    while frontier:
+        # Decide a direção deste nível
+        if bottom_up:
+            bottom_up = len(frontier) >= num_vertices / beta
+        else:
+            bottom_up = m_f > m_u / alpha
+
+        next_frontier = []
+        if bottom_up:
+            for v in frontier:
+                in_frontier[v] = 1
+            for v2 in range(num_vertices):
+                if order[v2] != -1:
+                    continue
+                for v1, _ in reverse.adj_list[v2]:
+                    if in_frontier[v1]:
+                        order[v2] = counter
+                        parent[v2] = v1
+                        counter += 1
+                        next_frontier.append(v2)
+                        break
+            for v in frontier:
+                in_frontier[v] = 0
+        else:
+            for v1 in frontier:
+                for v2, _ in graph.adj_list[v1]:
+                    if order[v2] == -1:
+                        order[v2] = counter
+                        parent[v2] = v1
+                        counter += 1
+                        next_frontier.append(v2)
+
+        m_f = sum(graph.degree(v) for v in next_frontier)
+        m_u -= m_f
+        frontier = next_frontier
+
+    return order, parent
 
+# Complexidade:
+#   Pior caso O(V + E) por nível bottom-up (varre todos os não visitados),
+#   mas na prática examina bem menos arestas que a BFS top-down em
+#   grafos de diâmetro pequeno.
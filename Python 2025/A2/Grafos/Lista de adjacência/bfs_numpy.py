@@ -0,0 +1,80 @@
+import numpy as np
+
+from conversoes import csr_numpy
+
+# BFS por níveis vetorizada sobre os vetores CSR
+# ================================================================
+#
+# Em vez de tirar um vértice da fila por vez, cada iteração expande a
+# fronteira inteira com operações NumPy:
+#
+#   1. gather: junta as faixas offsets[v]..offsets[v+1] de todos os
+#      vértices da fronteira num único vetor de vizinhos
+#   2. mask:   descarta os vizinhos já visitados (dist != -1)
+#   3. unique: remove repetidos; o resultado é a próxima fronteira
+#
+# O número de passos em Python é o número de níveis (o diâmetro), não
+# o número de vértices e arestas.
+
+
+def expand_frontier(offsets, targets, frontier):
+    """
+    Gather de todas as arestas que saem da fronteira.
+
+    Retorna:
+        (origens, vizinhos): vetores paralelos com uma posição por aresta
+    """
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return frontier[:0], targets[:0]
+
+    # Posição de cada aresta dentro de targets:
+    # start do seu vértice + deslocamento dentro da faixa dele
+    inicio_no_lote = np.cumsum(counts) - counts
+    idx = np.arange(total) + np.repeat(starts - inicio_no_lote, counts)
+    return np.repeat(frontier, counts), targets[idx]
+
+
+def bfs_vectorized(graph, v0: int):
+    """
+    BFS por níveis a partir de v0. Aceita GraphList, GraphCSR ou as matrizes
+    (convertidas para CSR por conversoes.to_csr).
+
+    Retorna:
+        (distance, parent) como vetores NumPy int64:
+            distance[v] = número de arestas de v0 até v (-1 se inalcançável)
+            parent[v]   = pai de v na árvore BFS (parent[v0] = v0, -1 se inalcançável)
+    """
+    csr, offsets, targets, _ = csr_numpy(graph)
+    num_vertices = csr.num_vertices
+
+    distance = np.full(num_vertices, -1, dtype=np.int64)
+    parent = np.full(num_vertices, -1, dtype=np.int64)
+    distance[v0] = 0
+    parent[v0] = v0
+
+    frontier = np.array([v0], dtype=np.int64)
+    level = 0
+    while frontier.size:
+        origens, vizinhos = expand_frontier(offsets, targets, frontier)
+
+        # Só interessam vizinhos ainda não visitados
+        novos = distance[vizinhos] == -1
+        origens, vizinhos = origens[novos], vizinhos[novos]
+
+        # Cada vértice novo entra uma vez; o pai é a primeira aresta que o alcançou
+        vizinhos, primeira = np.unique(vizinhos, return_index=True)
+
+        level += 1
+        distance[vizinhos] = level
+        parent[vizinhos] = origens[primeira]
+        frontier = vizinhos.astype(np.int64)
+
+    return distance, parent
+
+# Complexidade:
+#   Tempo: O(V + E) de trabalho vetorizado (+ O(k log k) do unique por nível),
+#          com só O(diâmetro) iterações em Python
+#   Espaço: O(V) para distance/parent + O(arestas da fronteira) por nível
@@ -0,0 +1,185 @@
+import time
+
+from graph_list import GraphList
+
+# Dijkstra com filas de baldes (pesos inteiros não negativos)
+# ================================================================
+#
+# Quando todo peso é um inteiro em [0, C], as distâncias também são
+# inteiras e o Dijkstra tira os vértices em ordem não decrescente de
+# distância (fila monótona). Dá para trocar o heap binário por baldes:
+#
+# Dial (C pequeno):
+#   C + 1 baldes circulares; o balde d % (C + 1) guarda os vértices com
+#   distância provisória d. Como toda distância pendente está em
+#   [d, d + C], os baldes nunca se misturam. Push e pop são O(1); o custo
+#   extra é andar pelos baldes vazios, no total O(V · C) no pior caso.
+#
+# Radix heap (C grande):
+#   baldes por bit: o balde i guarda chaves que diferem da última chave
+#   removida (last) a partir do bit i-1. Quando o balde 0 esvazia, o
+#   primeiro balde não vazio é redistribuído em relação ao seu mínimo;
+#   cada chave só desce de balde, no máximo log C vezes.
+#
+# dijkstra(graph, v0) passa sozinho para Dial quando o grafo está
+# congelado (GraphCSR) e GraphCSR.integer_weight_bound() confirma pesos
+# inteiros até DIAL_MAX_WEIGHT (o resultado fica em cache no grafo).
+# O radix heap, escrito em Python, empata com o heapq (em C), então só é
+# usado quando pedido: dijkstra(..., bucket=True) com C > DIAL_MAX_WEIGHT.
+# Retornam os mesmos (parent, distance) da versão com heap.
+
+DIAL_MAX_WEIGHT = 1 << 12
+
+
+def integer_weight_bound(graph):
+    """
+    Maior peso (int) se todos os pesos são inteiros não negativos, senão None.
+    Em GraphCSR o resultado vem do cache do grafo; em GraphList percorre as arestas.
+    """
+    if not isinstance(graph, GraphList):
+        return graph.integer_weight_bound()
+    limite = 0
+    for vizinhos in graph.adj_list:
+        for _, peso in vizinhos:
+            # is_integer() é False para inf e nan (int() levantaria erro)
+            if peso < 0 or not float(peso).is_integer():
+                return None
+            if peso > limite:
+                limite = peso
+    return int(limite)
+
+
+def dijkstra_dial(graph: GraphList, v0: int, max_weight=None, stats=None):
+    """
+    Dijkstra com os baldes circulares de Dial.
+
+    Parâmetros:
+        max_weight: maior peso C; se None, é calculado (precisa ser inteiro >= 0)
+    """
+    inicio = time.perf_counter()
+    if max_weight is None:
+        max_weight = integer_weight_bound(graph)
+        if max_weight is None:
+            raise ValueError("dijkstra_dial exige pesos inteiros não negativos")
+
+    num_vertices = graph.num_vertices
+    parent = [-1] * num_vertices
+    distance = [float('inf')] * num_vertices
+    checked = [False] * num_vertices
+
+    parent[v0] = v0
+    distance[v0] = 0
+
+    num_baldes = max_weight + 1
+    baldes = [[] for _ in range(num_baldes)]
+    baldes[0].append(v0)
+    pendentes = 1           # entradas em todos os baldes
+    d = 0                   # distância do balde atual
+    pushes, stale = 1, 0
+
+    while pendentes:
+        balde = baldes[d % num_baldes]
+        # Arestas de peso 0 podem colocar vértices no próprio balde atual
+        while balde:
+            v1 = balde.pop()
+            pendentes -= 1
+            if checked[v1] or distance[v1] != d:
+                stale += 1      # entrada antiga, de antes de uma melhora
+                continue
+            checked[v1] = True
+
+            for v2, peso in graph.adj_list[v1]:
+                nova = d + peso
+                if nova < distance[v2]:
+                    distance[v2] = nova
+                    parent[v2] = v1
+                    baldes[int(nova) % num_baldes].append(v2)
+                    pendentes += 1
+                    pushes += 1
+        d += 1
+
+    if stats is not None:
+        stats.record("dijkstra_dial",
+                     {"heap_push": pushes, "heap_pop": pushes, "stale_skip": stale,
+                      "relaxations": pushes - 1, "buckets_scanned": d},
+                     {"busca": time.perf_counter() - inicio})
+
+    return parent, distance
+
+
+class RadixHeap:
+    """Fila de prioridade monótona para chaves inteiras não negativas."""
+
+    def __init__(self, bits: int = 64):
+        self.last = 0
+        self.size = 0
+        # balde i: chaves k com (k ^ last).bit_length() == i
+        self.baldes = [[] for _ in range(bits + 1)]
+
+    def __len__(self):
+        return self.size
+
+    def push(self, key: int, v: int):
+        # Exige key >= last (fila monótona)
+        self.baldes[(key ^ self.last).bit_length()].append((key, v))
+        self.size += 1
+
+    def pop(self):
+        """Remove e retorna (chave, vértice) de menor chave."""
+        baldes = self.baldes
+        if not baldes[0]:
+            i = 1
+            while not baldes[i]:
+                i += 1
+            # Redistribui o primeiro balde não vazio em torno do seu mínimo
+            itens = baldes[i]
+            baldes[i] = []
+            last = self.last = min(itens)[0]
+            for item in itens:
+                baldes[(item[0] ^ last).bit_length()].append(item)
+        self.size -= 1
+        return baldes[0].pop()
+
+
+def dijkstra_radix(graph: GraphList, v0: int, stats=None):
+    """Dijkstra com radix heap (pesos inteiros não negativos, qualquer tamanho)."""
+    inicio = time.perf_counter()
+
+    num_vertices = graph.num_vertices
+    parent = [-1] * num_vertices
+    distance = [float('inf')] * num_vertices
+    checked = [False] * num_vertices
+
+    parent[v0] = v0
+    distance[v0] = 0
+
+    heap = RadixHeap()
+    heap.push(0, v0)
+    pushes, stale = 1, 0
+
+    while heap:
+        dist_v1, v1 = heap.pop()
+        if checked[v1]:
+            stale += 1
+            continue
+        checked[v1] = True
+
+        for v2, peso in graph.adj_list[v1]:
+            nova = dist_v1 + peso
+            if nova < distance[v2]:
+                distance[v2] = nova
+                parent[v2] = v1
+                heap.push(int(nova), v2)
+                pushes += 1
+
+    if stats is not None:
+        stats.record("dijkstra_radix",
+                     {"heap_push": pushes, "heap_pop": pushes, "stale_skip": stale,
+                      "relaxations": pushes - 1},
+                     {"busca": time.perf_counter() - inicio})
+
+    return parent, distance
+
+# Complexidade (pesos inteiros em [0, C]):
+#   dijkstra_dial  → O(V + E + D) tempo, D = maior distância (≤ V·C); O(V + C) baldes
+#   dijkstra_radix → O(E + V log C) tempo; 65 baldes
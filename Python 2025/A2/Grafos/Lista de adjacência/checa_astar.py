@@ -0,0 +1,78 @@
+import random
+import sys
+
+from graph_list import GraphList
+from dijkstra import dijkstra, astar
+from heuristicas import Landmarks
+
+# Verificação: A* com ALT × Dijkstra em grafos com pesos grandes
+# ================================================================
+#
+# As tabelas do ALT são float32. Com distâncias ao marco na casa de 2^25
+# o arredondamento passa de 1, maior que as arestas do grafo:
+#   1. admissibilidade → h(v) nunca pode passar de d(v, t)
+#      (folga absoluta descontada em heuristicas.py)
+#   2. consistência    → h(u) <= peso(u, v) + h(v) pode falhar; o astar
+#      reabre o vértice quando acha um caminho melhor até ele
+# Cada caso compara a distância do astar com a do dijkstra.
+#
+#   python checa_astar.py
+
+
+def caso_admissivel():
+    # d(L, x) = 2^25 + 1 vira 2^25 em float32; sem a folga, h(x) ≈ 4 > d(x, t) = 2
+    L, s, x, t = 0, 1, 2, 3
+    graph = GraphList(4)
+    graph.add_edge(L, x, 2 ** 25 + 1)
+    graph.add_edge(x, t, 2)
+    graph.add_edge(s, x, 1)
+    graph.add_edge(s, t, 4.5)
+    return [(graph, s, t)]
+
+
+def grafo_marco_distante(seed: int) -> GraphList:
+    # Marco 0 ligado a todos por arestas ≈ 2^25; o resto com pesos 0.5–3
+    rng = random.Random(seed)
+    n = rng.randint(4, 12)
+    graph = GraphList(n)
+    for v in range(1, n):
+        graph.add_edge(0, v, 2 ** 25 + rng.uniform(0, 40))
+    for _ in range(3 * n):
+        a, b = rng.randrange(1, n), rng.randrange(1, n)
+        if a != b:
+            graph.add_edge(a, b, rng.choice([0.5, 1, 1.5, 2, 2.5, 3]))
+    return graph
+
+
+def casos_consistencia(num_grafos: int = 300):
+    # Inclui o grafo 65 (s=8, t=4), que dava 8 em vez de 6 sem a reabertura
+    casos = []
+    for seed in [65] + list(range(num_grafos)):
+        graph = grafo_marco_distante(seed)
+        for s in range(1, graph.num_vertices):
+            for t in range(1, graph.num_vertices):
+                casos.append((graph, s, t))
+    return casos
+
+
+def main():
+    falhas = 0
+    for nome, casos in (("admissibilidade", caso_admissivel()),
+                        ("consistência", casos_consistencia())):
+        marcos = {}
+        erradas = 0
+        for graph, s, t in casos:
+            if id(graph) not in marcos:
+                marcos[id(graph)] = Landmarks(graph, landmarks=[0])
+            _, esperado = dijkstra(graph, s)
+            _, obtido = astar(graph, s, t, marcos[id(graph)].heuristica(t))
+            if obtido[t] != esperado[t]:
+                erradas += 1
+                print(f"  {nome}: s={s} t={t} astar={obtido[t]} dijkstra={esperado[t]}")
+        print(f"{nome:16} {len(casos):6} consultas  {erradas} erradas")
+        falhas += erradas
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,364 @@
+import heapq
+import struct
+import sys
+from array import array
+
+from graph_csr import GraphCSR
+from graph_list import GraphList
+
+# Hierarquia de contração (Contraction Hierarchies, Geisberger et al.)
+# ================================================================
+#
+# Pré-processamento (uma vez por grafo):
+#   Os vértices são "contraídos" um a um, do menos ao mais importante.
+#   Contrair v = tirá-lo do grafo preservando as distâncias entre os que
+#   sobram: para cada par u → v → w, se não existe outro caminho de u a w
+#   (testemunha, sem passar por v) de custo <= peso(u,v) + peso(v,w),
+#   insere-se o atalho u → w com esse custo, lembrando que ele passa por v.
+#
+#   Ordem: fila de prioridade pela diferença de arestas
+#       atalhos que v criaria − arestas que v remove (+ vizinhos já contraídos)
+#   O número de atalhos de cada vértice fica em cache. Contrair v só muda
+#   a vizinhança dos vizinhos de v, então só eles são marcados "sujos".
+#   Atualização preguiçosa: ao sair da fila, um vértice sujo tem a
+#   prioridade recalculada e, se piorou além do próximo da fila, volta
+#   para ela; um vértice limpo usa a contagem guardada. O cache só poupa
+#   esses recálculos: a contração em si sempre faz as buscas de
+#   testemunha (de novo, se o vértice estava limpo), porque a lista de
+#   atalhos não é guardada — uma testemunha antiga pode passar por um
+#   vértice contraído depois dela.
+#
+#   As buscas de testemunha são limitadas (WITNESS_HOPS arestas e
+#   WITNESS_LIMITE vértices finalizados), o que mantém o pré-processamento
+#   perto de linear em redes viárias.
+#
+#   Cada aresta (original ou atalho) vai para um dos dois grafos finais:
+#     up   → arestas a → b com rank[a] < rank[b]   (busca a partir de s)
+#     down → arestas a → b com rank[a] > rank[b], guardadas invertidas
+#            em down[b] = a                         (busca reversa a partir de t)
+#
+# Consulta (s, t):
+#   Dijkstra bidirecional em que as duas buscas só SOBEM de rank. O
+#   caminho mínimo sempre tem um vértice de rank máximo onde as buscas
+#   se encontram. Cada lado para quando o topo do seu heap passa da
+#   melhor distância já encontrada (mu). Stall-on-demand: um vértice
+#   alcançado mais barato por cima (por um vértice de rank maior já
+#   visitado) não é expandido. Como só se sobe na hierarquia,
+#   cada busca visita poucas centenas de vértices mesmo em grafos com
+#   milhões deles. Os atalhos do caminho são desempacotados
+#   recursivamente pelo vértice do meio.
+#
+# Os dois grafos ficam em CSR (GraphCSR) e, junto com rank e os vértices
+# do meio, podem ser gravados em arquivo (save/load) para serem
+# reaproveitados por outros processos sem refazer o pré-processamento.
+
+# Limites de cada busca de testemunha: vértices finalizados e arestas no
+# caminho. Se um limite estoura sem achar testemunha, o atalho é
+# inserido: nunca fica errado, só com algumas arestas a mais.
+WITNESS_LIMITE = 500
+WITNESS_HOPS = 5
+
+MAGIC = b"GRCH"
+VERSAO = 1
+_HEADER = struct.Struct("<4sIQQQ")   # magic, versão, V, arestas up, arestas down
+
+
+def _witness_search(saida, origem, ignorado, limite_custo, alvos):
+    # Dijkstra local a partir de origem, sem passar por `ignorado`, até
+    # finalizar todos os alvos, passar do custo limite_custo, finalizar
+    # WITNESS_LIMITE vértices ou chegar a caminhos de WITNESS_HOPS arestas.
+    # Toda distância do dicionário é custo de um caminho real, então
+    # dist[w] <= c prova uma testemunha mesmo que w não tenha sido finalizado.
+    dist = {origem: 0}
+    heap = [(0, 0, origem)]
+    finalizados = 0
+    faltam = len(alvos)
+    while heap:
+        d, hops, x = heapq.heappop(heap)
+        if d > dist[x]:
+            continue
+        if d > limite_custo or finalizados == WITNESS_LIMITE:
+            break
+        finalizados += 1
+        if x in alvos:
+            faltam -= 1
+            if not faltam:
+                break
+        if hops == WITNESS_HOPS:
+            continue
+        for y, peso in saida[x].items():
+            if y == ignorado:
+                continue
+            nova = d + peso
+            if nova < dist.get(y, float('inf')):
+                dist[y] = nova
+                heapq.heappush(heap, (nova, hops + 1, y))
+    return dist
+
+
+def _atalhos(saida, entrada, v):
+    """Atalhos (u, w, custo) necessários para contrair v."""
+    atalhos = []
+    for u, peso_uv in entrada[v].items():
+        alvos = {w: peso_vw for w, peso_vw in saida[v].items() if w != u}
+        if not alvos:
+            continue
+        dist = _witness_search(saida, u, v, peso_uv + max(alvos.values()), alvos)
+        for w, peso_vw in alvos.items():
+            custo = peso_uv + peso_vw
+            if dist.get(w, float('inf')) > custo:
+                atalhos.append((u, w, custo))
+    return atalhos
+
+
+def _to_csr(num_vertices, listas):
+    # listas[v] = [(alvo, peso, meio), ...] → GraphCSR + vetor de meios
+    offsets = array('q', [0]) * (num_vertices + 1)
+    targets, weights, meios = array('i'), array('d'), array('i')
+    for v, arestas in enumerate(listas):
+        for alvo, peso, meio in arestas:
+            targets.append(alvo)
+            weights.append(peso)
+            meios.append(meio)
+        offsets[v + 1] = len(targets)
+    return GraphCSR(num_vertices, offsets, targets, weights), meios
+
+
+class ContractionHierarchy:
+    def __init__(self, rank, up, up_meio, down, down_meio):
+        self.num_vertices = len(rank)
+        self.rank = rank            # array('i'): ordem de contração de cada vértice
+        self.up = up                # GraphCSR: arestas para vértices de rank maior
+        self.up_meio = up_meio      # array('i'): vértice do meio de cada atalho (-1 = original)
+        self.down = down            # GraphCSR: arestas que chegam de rank maior, invertidas
+        self.down_meio = down_meio
+
+    @classmethod
+    def build(cls, graph: GraphList):
+        """Pré-processa um grafo (pesos não negativos) e devolve a hierarquia."""
+        n = graph.num_vertices
+
+        # Grafo restante (só vértices ainda não contraídos), com o menor
+        # peso entre arestas paralelas e sem laços
+        saida = [{} for _ in range(n)]
+        entrada = [{} for _ in range(n)]
+        for v1 in range(n):
+            for v2, peso in graph.adj_list[v1]:
+                if v1 != v2 and peso < saida[v1].get(v2, float('inf')):
+                    saida[v1][v2] = peso
+                    entrada[v2][v1] = peso
+
+        meio = {}                       # (u, w) → vértice do meio do atalho atual u → w
+        vizinhos_contraidos = [0] * n
+
+        # Cache do número de atalhos; sujo[v] = a vizinhança de v mudou desde o cálculo
+        num_atalhos = [len(_atalhos(saida, entrada, v)) for v in range(n)]
+        sujo = bytearray(n)
+
+        def prioridade(v):
+            removidas = len(saida[v]) + len(entrada[v])
+            return num_atalhos[v] - removidas + vizinhos_contraidos[v]
+
+        fila = [(prioridade(v), v) for v in range(n)]
+        heapq.heapify(fila)
+
+        rank = array('i', [-1]) * n
+        up = [[] for _ in range(n)]
+        down = [[] for _ in range(n)]
+        ordem = 0
+
+        while fila:
+            _, v = heapq.heappop(fila)
+
+            # Atualização preguiçosa: só vértices sujos recalculam a prioridade
+            atalhos = None
+            if sujo[v]:
+                atalhos = _atalhos(saida, entrada, v)
+                num_atalhos[v] = len(atalhos)
+                sujo[v] = 0
+                atual = prioridade(v)
+                if fila and atual > fila[0][0]:
+                    heapq.heappush(fila, (atual, v))
+                    continue
+
+            if atalhos is None:
+                # Limpo: a contagem veio do cache, mas os atalhos são refeitos
+                atalhos = _atalhos(saida, entrada, v)
+            rank[v] = ordem
+            ordem += 1
+
+            # Arestas de v para os que ainda restam vão para o grafo final
+            for w, peso in saida[v].items():
+                up[v].append((w, peso, meio.get((v, w), -1)))
+                del entrada[w][v]
+                vizinhos_contraidos[w] += 1
+                sujo[w] = 1
+            for u, peso in entrada[v].items():
+                down[v].append((u, peso, meio.get((u, v), -1)))
+                del saida[u][v]
+                vizinhos_contraidos[u] += 1
+                sujo[u] = 1
+            saida[v].clear()
+            entrada[v].clear()
+
+            for u, w, custo in atalhos:
+                if custo < saida[u].get(w, float('inf')):
+                    saida[u][w] = custo
+                    entrada[w][u] = custo
+                    meio[(u, w)] = v
+
+        up_csr, up_meio = _to_csr(n, up)
+        down_csr, down_meio = _to_csr(n, down)
+        return cls(rank, up_csr, up_meio, down_csr, down_meio)
+
+    def _aresta(self, a, b):
+        # (peso, meio) da aresta a → b da hierarquia
+        if self.rank[a] < self.rank[b]:
+            graph, meios, origem, alvo = self.up, self.up_meio, a, b
+        else:
+            graph, meios, origem, alvo = self.down, self.down_meio, b, a
+        inicio = graph.offsets[origem]
+        for i in range(inicio, graph.offsets[origem + 1]):
+            if graph.targets[i] == alvo:
+                return graph.weights[i], meios[i]
+        raise KeyError((a, b))
+
+    def _desempacota(self, caminho):
+        # Troca cada atalho a → b (meio m) por a → m → b, até só restarem arestas originais
+        resultado = [caminho[0]]
+        pilha = [(a, b) for a, b in zip(caminho[-2::-1], caminho[:0:-1])]
+        while pilha:
+            a, b = pilha.pop()
+            _, m = self._aresta(a, b)
+            if m == -1:
+                resultado.append(b)
+            else:
+                pilha.append((m, b))
+                pilha.append((a, m))
+        return resultado
+
+    def query(self, s: int, t: int):
+        """
+        Retorna:
+            (distância, caminho de s até t no grafo original),
+            ou (inf, []) se t é inalcançável.
+        """
+        if s == t:
+            return 0, [s]
+
+        grafos = (self.up, self.down)
+        dist = ({s: 0}, {t: 0})
+        parent = ({s: s}, {t: t})
+        heaps = ([(0, s)], [(0, t)])
+        mu, encontro = float('inf'), -1
+
+        while True:
+            # Lado ativo: topo menor, entre os que ainda podem melhorar mu
+            topo_s = heaps[0][0][0] if heaps[0] else float('inf')
+            topo_t = heaps[1][0][0] if heaps[1] else float('inf')
+            if topo_s >= mu and topo_t >= mu:
+                break
+            lado = 0 if topo_s <= topo_t else 1
+
+            d_x, x = heapq.heappop(heaps[lado])
+            dist_lado = dist[lado]
+            if d_x > dist_lado[x]:
+                continue
+            outro = dist[1 - lado]
+            if x in outro and d_x + outro[x] < mu:
+                mu, encontro = d_x + outro[x], x
+
+            # Stall-on-demand: as arestas do outro grafo em x ligam x a
+            # vértices mais altos no sentido contrário ao da busca. Se um
+            # deles, a, já tem dist[a] + peso < d_x, d_x não é a distância
+            # real de x e nenhum caminho mínimo sobe passando por x: x não
+            # é expandido.
+            inverso = grafos[1 - lado]
+            targets, weights = inverso.targets, inverso.weights
+            for i in range(inverso.offsets[x], inverso.offsets[x + 1]):
+                d_a = dist_lado.get(targets[i])
+                if d_a is not None and d_a + weights[i] < d_x:
+                    break
+            else:
+                graph = grafos[lado]
+                targets, weights = graph.targets, graph.weights
+                for i in range(graph.offsets[x], graph.offsets[x + 1]):
+                    y = targets[i]
+                    nova = d_x + weights[i]
+                    if nova < dist_lado.get(y, float('inf')):
+                        dist_lado[y] = nova
+                        parent[lado][y] = x
+                        heapq.heappush(heaps[lado], (nova, y))
+
+        if encontro == -1:
+            return float('inf'), []
+
+        # Caminho na hierarquia: s ↑ encontro ↓ t
+        caminho = [encontro]
+        while caminho[-1] != s:
+            caminho.append(parent[0][caminho[-1]])
+        caminho.reverse()
+        while caminho[-1] != t:
+            caminho.append(parent[1][caminho[-1]])
+        return mu, self._desempacota(caminho)
+
+    def distance(self, s: int, t: int) -> float:
+        return self.query(s, t)[0]
+
+    @property
+    def num_shortcuts(self) -> int:
+        return sum(1 for m in self.up_meio if m != -1) + sum(1 for m in self.down_meio if m != -1)
+
+    def save(self, path):
+        """
+        Grava a hierarquia (little-endian):
+            cabeçalho: magic b"GRCH", versão, V, E_up, E_down
+            rank (int32 · V)
+            up:   offsets (int64 · (V+1)), targets (int32), weights (float64), meios (int32)
+            down: idem
+        """
+        vetores = [array('i', self.rank)]
+        for graph, meios in ((self.up, self.up_meio), (self.down, self.down_meio)):
+            vetores += [array('q', graph.offsets), array('i', graph.targets),
+                        array('d', graph.weights), array('i', meios)]
+        if sys.byteorder == "big":
+            for vetor in vetores:
+                vetor.byteswap()
+
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSAO, self.num_vertices,
+                                 self.up.num_edges, self.down.num_edges))
+            for vetor in vetores:
+                vetor.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            magic, versao, n, e_up, e_down = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} não é um arquivo de hierarquia de contração")
+            if versao != VERSAO:
+                raise ValueError(f"Versão {versao} do formato não suportada")
+
+            def ler(typecode, tamanho):
+                vetor = array(typecode)
+                vetor.fromfile(f, tamanho)
+                if sys.byteorder == "big":
+                    vetor.byteswap()
+                return vetor
+
+            rank = ler('i', n)
+            partes = []
+            for num_edges in (e_up, e_down):
+                offsets, targets = ler('q', n + 1), ler('i', num_edges)
+                weights, meios = ler('d', num_edges), ler('i', num_edges)
+                partes += [GraphCSR(n, offsets, targets, weights), meios]
+        return cls(rank, *partes)
+
+# Complexidade:
+#   build → depende da ordem; cada contração faz grau_entrada buscas de
+#           testemunha limitadas (WITNESS_LIMITE, WITNESS_HOPS), e só os
+#           vizinhos do vértice contraído são reavaliados na fila
+#   query → O(k log k), k = vértices visitados pelas duas buscas ascendentes
+#           (tipicamente centenas, independente de V em redes viárias)
+#   Espaço: O(V + E + atalhos)
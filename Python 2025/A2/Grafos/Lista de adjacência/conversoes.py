@@ -0,0 +1,175 @@
+import importlib.util
+import os
+import sys
+from array import array
+
+import numpy as np
+
+from graph_csr import GraphCSR
+from graph_list import GraphList
+
+# As classes de matriz ficam na pasta vizinha, que também tem dfs.py,
+# funcoes.py e main.py. Para não pôr esses nomes no sys.path (e mudar o
+# que um `import dfs` posterior encontra), os dois módulos são carregados
+# pelo caminho do arquivo, com nomes próprios.
+_PASTA_MATRIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Matriz de adjacência")
+
+
+def _carrega_matriz(nome):
+    caminho = os.path.join(_PASTA_MATRIZ, nome + ".py")
+
+    # Se o módulo já foi importado pelo nome de sempre (pasta da matriz no
+    # sys.path do programa), usa o mesmo: isinstance precisa da mesma classe
+    modulo = sys.modules.get(nome)
+    arquivo = getattr(modulo, "__file__", None)
+    if arquivo is not None and os.path.exists(arquivo) and os.path.samefile(arquivo, caminho):
+        return modulo
+
+    apelido = "_matriz_adjacencia_" + nome
+    if apelido not in sys.modules:
+        spec = importlib.util.spec_from_file_location(apelido, caminho)
+        modulo = importlib.util.module_from_spec(spec)
+        sys.modules[apelido] = modulo
+        spec.loader.exec_module(modulo)
+    return sys.modules[apelido]
+
+
+GraphMatrix = _carrega_matriz("graph_matrix").GraphMatrix
+WeightedGraphMatrix = _carrega_matriz("weighted_graph_matrix").WeightedGraphMatrix
+
+# Conversões entre GraphList, GraphCSR, GraphMatrix (bitset) e
+# WeightedGraphMatrix (NumPy).
+#
+# Toda conversão passa pelos três vetores CSR e é feita com operações
+# sobre vetores inteiros:
+#   lista/CSR → matriz: scatter  matriz[origens, destinos] = pesos
+#   matriz → CSR:       gather   origens, destinos = np.nonzero(matriz)
+# Nenhuma conversão chama add_edge aresta por aresta.
+
+# Linhas da matriz bitset montadas por bloco, para limitar a memória temporária
+_LINHAS_POR_BLOCO = 1024
+
+
+def csr_numpy(graph):
+    """Visões NumPy (sem cópia) dos vetores CSR de qualquer representação."""
+    csr = to_csr(graph)
+    offsets = np.frombuffer(csr.offsets, dtype=np.int64)
+    targets = np.frombuffer(csr.targets, dtype=np.int32)
+    weights = np.frombuffer(csr.weights, dtype=np.float64)
+    return csr, offsets, targets, weights
+
+
+def _to_array(typecode, valores):
+    vetor = array(typecode)
+    vetor.frombytes(np.ascontiguousarray(valores).tobytes())
+    return vetor
+
+
+def _dense_bitset(graph: GraphMatrix):
+    # Desempacota as linhas bitset numa matriz booleana V x V
+    n = graph.num_vertices
+    num_bytes = (n + 7) // 8
+    buffer = b"".join(row.to_bytes(num_bytes, "little") for row in graph.rows)
+    bytes_ = np.frombuffer(buffer, dtype=np.uint8).reshape(n, num_bytes)
+    return np.unpackbits(bytes_, axis=1, bitorder="little")[:, :n].astype(bool)
+
+
+def to_csr(graph) -> GraphCSR:
+    """Converte qualquer representação para GraphCSR."""
+    if isinstance(graph, GraphCSR):
+        return graph
+    if isinstance(graph, GraphList):
+        return graph.freeze()
+
+    n = graph.num_vertices
+    if isinstance(graph, WeightedGraphMatrix):
+        adj = graph.mask()
+    else:
+        adj = _dense_bitset(graph)
+
+    # np.nonzero percorre a matriz linha a linha, então as arestas
+    # já saem agrupadas por origem (ordem CSR)
+    origens, destinos = np.nonzero(adj)
+    if isinstance(graph, WeightedGraphMatrix) and graph.weighted:
+        pesos = graph.matrix[origens, destinos]
+    else:
+        pesos = np.ones(len(destinos))
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(origens, minlength=n), out=offsets[1:])
+
+    return GraphCSR(n, _to_array('q', offsets), _to_array('i', destinos.astype(np.int32)),
+                    _to_array('d', pesos.astype(np.float64)))
+
+
+def from_csr(csr: GraphCSR) -> GraphList:
+    return GraphList.from_csr(csr)
+
+
+def to_list(graph) -> GraphList:
+    """Converte qualquer representação para GraphList."""
+    if isinstance(graph, GraphList):
+        return graph
+    return GraphList.from_csr(to_csr(graph))
+
+
+def to_matrix(graph, weighted: bool = False):
+    """
+    Converte para matriz de adjacência.
+
+    weighted=False → GraphMatrix (bitset, descarta os pesos)
+    weighted=True  → WeightedGraphMatrix (float64 com inf onde não há aresta)
+    """
+    csr, offsets, targets, weights = csr_numpy(graph)
+    n = csr.num_vertices
+    origens = np.repeat(np.arange(n), np.diff(offsets))
+
+    if weighted:
+        matriz = WeightedGraphMatrix(n)
+        matriz.matrix[origens, targets] = weights
+        matriz.num_edges = int(np.isfinite(matriz.matrix).sum())
+        return matriz
+
+    matriz = GraphMatrix(n)
+    rows = []
+    for inicio in range(0, n, _LINHAS_POR_BLOCO):
+        fim = min(n, inicio + _LINHAS_POR_BLOCO)
+        a, b = offsets[inicio], offsets[fim]
+        bloco = np.zeros((fim - inicio, n), dtype=bool)
+        bloco[origens[a:b] - inicio, targets[a:b]] = True
+        empacotado = np.packbits(bloco, axis=1, bitorder="little")
+        rows.extend(int.from_bytes(linha.tobytes(), "little") for linha in empacotado)
+        matriz.num_edges += int(bloco.sum())
+    matriz.rows = rows
+    return matriz
+
+
+def density(graph) -> float:
+    """Densidade E / V² do grafo."""
+    n = graph.num_vertices
+    return graph.num_edges / (n * n) if n else 0.0
+
+
+def auto_representation(graph):
+    """
+    Escolhe a representação que ocupa menos memória para este grafo:
+
+    - sem pesos (todos 1.0): bitset usa V²/8 bytes e CSR ~12·E bytes
+      → matriz compensa a partir de E/V² ≥ 1/96
+    - com pesos: float64 usa 8·V² bytes
+      → matriz compensa a partir de E/V² ≥ 2/3
+
+    Retorna GraphMatrix, WeightedGraphMatrix ou GraphCSR.
+    """
+    _, _, _, weights = csr_numpy(graph)
+    com_peso = bool(np.any(weights != 1.0))
+    limiar = 2 / 3 if com_peso else 1 / 96
+
+    if density(graph) >= limiar:
+        return to_matrix(graph, weighted=com_peso)
+    return to_csr(graph)
+
+# Complexidade (V vértices, E arestas):
+#   to_csr (de matriz) → O(V²) vetorizado
+#   to_matrix          → O(V² + E) vetorizado (V conversões de linha em Python)
+#   to_list / from_csr → O(V + E), um passo Python por vértice
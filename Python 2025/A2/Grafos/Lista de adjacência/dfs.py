@@ -1,37 +1,265 @@
+from operator import itemgetter
 from graph_list import GraphList
 
+_VIZINHO = itemgetter(0)
+
+
 def dfs(graph: 'GraphList'):
     pre_order = [-1] * graph.num_vertices       # ordem de descoberta de v 
     post_order = [-1] * graph.num_vertices      # ordem de finalização de v
     parents = [-1] * graph.num_vertices
     pre_counter = [0]
     post_counter = [0]
+    neighbors = adj_neighbors(graph)
 
     for v in range(graph.num_vertices):
         if pre_order[v] == -1:
             parents[v] = v
-            _dfs_recursive(
-                graph, v, pre_order, pre_counter,
+            dfs_visit(
+                neighbors, v, pre_order, pre_counter,
                 post_order, post_counter, parents)
     return pre_order, post_order, parents
 
 
-def _dfs_recursive(graph: 'GraphList', v1, pre_order, pre_counter,
-                   post_order, post_counter, parents):
+def adj_neighbors(graph: 'GraphList'):
+    """Função v → iterador com os vizinhos de v (sem os pesos)."""
+    adj_list = graph.adj_list
+    return lambda v: map(_VIZINHO, adj_list[v])
 
-    pre_order[v1] = pre_counter[0] # Marca o vertice como descoberto (pre-ordem)
+
+def dfs_visit(neighbors, v0, pre_order, pre_counter, post_order, post_counter, parents,
+              on_discover=None, on_tree_edge=None, on_nontree_edge=None, on_finish=None):
+    """
+    Motor da DFS com pilha explícita, a partir do vértice v0.
+
+    Em vez de uma chamada recursiva por vértice, a pilha guarda pares
+    (vértice, iterador dos vizinhos ainda não examinados). O topo da
+    pilha faz o papel da chamada recursiva ativa: quando o iterador
+    acaba, o vértice é finalizado e desempilhado. Assim não há limite
+    de recursão e a profundidade só depende da memória.
+
+    Parâmetros:
+        neighbors: função v → iterável com os vizinhos de v
+        pre_order, post_order, parents: vetores preenchidos como na versão recursiva
+        pre_counter, post_counter: listas de tamanho 1 com os contadores
+        on_discover(v):           chamado quando v é descoberto
+        on_tree_edge(v1, v2):     aresta de árvore, antes de descobrir v2
+        on_nontree_edge(v1, v2):  aresta para um vértice já descoberto
+        on_finish(v):             chamado após todos os vizinhos de v
+        Se algum callback retornar True, a busca é interrompida.
+
+    Retorna:
+        True se foi interrompida por um callback, False caso contrário.
+    """
+    pre_order[v0] = pre_counter[0]
     pre_counter[0] += 1
+    if on_discover is not None and on_discover(v0):
+        return True
+    stack = [(v0, iter(neighbors(v0)))]
+
+    while stack:
+        v1, vizinhos = stack[-1]
+
+        for v2 in vizinhos:
+            if pre_order[v2] == -1:
+                if on_tree_edge is not None and on_tree_edge(v1, v2):
+                    return True
+                parents[v2] = v1
+                pre_order[v2] = pre_counter[0]  # Marca o vertice como descoberto (pre-ordem)
+                pre_counter[0] += 1
+                if on_discover is not None and on_discover(v2):
+                    return True
+                # "Chamada recursiva": empilha v2 e continua a partir dele
+                stack.append((v2, iter(neighbors(v2))))
+                break
+            if on_nontree_edge is not None and on_nontree_edge(v1, v2):
+                return True
+        else:
+            # Apos visitar todos os vizinhos, define pos-ordem
+            stack.pop()
+            post_order[v1] = post_counter[0]
+            post_counter[0] += 1
+            if on_finish is not None and on_finish(v1):
+                return True
+
+    return False
+
+
+# Travessias preguiçosas (geradores)
+# ================================================================
+#
+# iter_dfs / iter_bfs produzem (vértice, pai, profundidade) à medida que
+# os vértices são descobertos, sem montar vetores O(V) de resultado.
+# Quem chama pode parar no meio (break, any, itertools.islice) e o resto
+# do grafo nunca é visitado.
+#
+# O conjunto de visitados também é preguiçoso: começa como um set (custo
+# proporcional ao que foi explorado) e só vira um bytearray de V posições
+# quando a exploração passa de V / FRACAO_DENSA vértices, ponto em que o
+# vetor fica mais barato que o set.
+
+FRACAO_DENSA = 32
+
+
+class Visitados:
+    """Conjunto de vértices visitados: set enquanto pequeno, bytearray depois."""
+
+    def __init__(self, num_vertices=None):
+        self.num_vertices = num_vertices
+        self._set = set()
+        self._vetor = None
+        self._limite = num_vertices // FRACAO_DENSA if num_vertices else None
+
+    def __contains__(self, v):
+        if self._vetor is not None:
+            return self._vetor[v] == 1
+        return v in self._set
+
+    def add(self, v):
+        if self._vetor is not None:
+            self._vetor[v] = 1
+            return
+        self._set.add(v)
+        if self._limite is not None and len(self._set) > self._limite:
+            # Exploração grande: troca para o vetor denso
+            self._vetor = bytearray(self.num_vertices)
+            for u in self._set:
+                self._vetor[u] = 1
+            self._set = None
+
+
+def neighbors_of(graph, num_vertices):
+    """Aceita um grafo (GraphList/GraphCSR) ou direto uma função v → vizinhos."""
+    if callable(graph):
+        return graph, num_vertices
+    return adj_neighbors(graph), graph.num_vertices
+
+
+def iter_dfs(graph, v0: int, num_vertices=None):
+    """
+    DFS preguiçosa a partir de v0, em pré-ordem (mesma ordem da dfs).
+
+    Parâmetros:
+        graph: GraphList/GraphCSR, ou uma função v → iterável de vizinhos
+        num_vertices: só usado com função; sem ele, Visitados fica sempre em set
+
+    Gera:
+        (v, pai, profundidade), com pai = v0 e profundidade 0 para a raiz.
+    """
+    neighbors, num_vertices = neighbors_of(graph, num_vertices)
+    visitados = Visitados(num_vertices)
+
+    visitados.add(v0)
+    yield v0, v0, 0
+    stack = [(v0, 0, iter(neighbors(v0)))]
+
+    while stack:
+        v1, profundidade, vizinhos = stack[-1]
+        for v2 in vizinhos:
+            if v2 not in visitados:
+                visitados.add(v2)
+                yield v2, v1, profundidade + 1
+                stack.append((v2, profundidade + 1, iter(neighbors(v2))))
+                break
+        else:
+            stack.pop()
+
+# Complexidade:
+#   Tempo: O(vértices e arestas efetivamente explorados) — O(V + E) no máximo
+#   Espaço: O(explorados) em set, ou O(V) bytes depois da troca para o vetor
+
+
+# Tipos de aresta usados por dfs_classify_edges
+TREE_EDGE = 0       # parte da floresta DFS
+BACK_EDGE = 1       # de retorno (para um ancestral ainda na pilha)
+FORWARD_EDGE = 2    # de avanço (para um descendente já finalizado)
+CROSS_EDGE = 3      # cruzada (entre subárvores/árvores distintas)
+EDGE_TYPE_NAMES = ("Tree branch", "Return", "Forward", "Cross")
+
+
+class DFSVisitor:
+    """
+    Ganchos (hooks) de eventos da DFS para usar com dfs_traverse.
+
+    Sobrescreva apenas os eventos de interesse. Os que não forem
+    sobrescritos nem chegam ao motor: dfs_traverse passa None no lugar
+    deles, então não custam uma chamada por vértice/aresta.
+    Se um gancho retornar True, a busca é interrompida.
+    """
+
+    def discover(self, v):
+        pass
+
+    def finish(self, v):
+        pass
+
+    def tree_edge(self, v1, v2):
+        pass
+
+    def back_edge(self, v1, v2):
+        pass
+
+    def forward_edge(self, v1, v2):
+        pass
+
+    def cross_edge(self, v1, v2):
+        pass
+
+
+def _hook(visitor, nome):
+    # None se o visitante não sobrescreveu o evento
+    if getattr(type(visitor), nome) is getattr(DFSVisitor, nome):
+        return None
+    return getattr(visitor, nome)
+
+
+def dfs_traverse(graph: 'GraphList', visitor: DFSVisitor, roots=None):
+    """
+    Executa a DFS chamando os ganchos do visitante a cada evento.
 
-    for (v2, peso) in graph.adj_list[v1]:
-        if pre_order[v2] == -1:  
-            parents[v2] = v1
-            _dfs_recursive(
-                graph, v2, pre_order, pre_counter,
-                post_order, post_counter, parents
-            )
-    # Apos visitar todos os vizinhos, define pos-ordem
-    post_order[v1] = post_counter[0]
-    post_counter[0] += 1
+    Parâmetros:
+        visitor: instância de (subclasse de) DFSVisitor
+        roots: vértices de onde iniciar; padrão = todos, em ordem (floresta DFS)
+
+    Retorna:
+        (pre_order, post_order, parents, interrompida)
+    """
+    num_vertices = graph.num_vertices
+    pre_order = [-1] * num_vertices
+    post_order = [-1] * num_vertices
+    parents = [-1] * num_vertices
+    pre_counter = [0]
+    post_counter = [0]
+
+    back = _hook(visitor, "back_edge")
+    forward = _hook(visitor, "forward_edge")
+    cross = _hook(visitor, "cross_edge")
+
+    on_nontree_edge = None
+    if back is not None or forward is not None or cross is not None:
+        def on_nontree_edge(v1, v2):
+            # Classifica pela situação de v2 no momento em que a aresta é vista
+            if post_order[v2] == -1:
+                return back is not None and back(v1, v2)
+            if pre_order[v2] > pre_order[v1]:
+                return forward is not None and forward(v1, v2)
+            return cross is not None and cross(v1, v2)
+
+    callbacks = dict(
+        on_discover=_hook(visitor, "discover"),
+        on_tree_edge=_hook(visitor, "tree_edge"),
+        on_nontree_edge=on_nontree_edge,
+        on_finish=_hook(visitor, "finish"),
+    )
+    neighbors = adj_neighbors(graph)
+
+    for v in (range(num_vertices) if roots is None else roots):
+        if pre_order[v] == -1:
+            parents[v] = v
+            if dfs_visit(neighbors, v, pre_order, pre_counter,
+                         post_order, post_counter, parents, **callbacks):
+                return pre_order, post_order, parents, True
+    return pre_order, post_order, parents, False
 
 
 # 1. **Pre-ordem (descoberta):**
@@ -39,7 +267,7 @@ def _dfs_recursive(graph: 'GraphList', v1, pre_order, pre_counter,
 #
 # 2. **Pos-ordem (finalização):**
 #    → O instante em que terminamos de visitar todos os vizinhos
-#      e estamos "voltando" na recursão.
+#      e estamos "voltando" (desempilhando o vértice).
 #
 # O resultado e uma floresta de arvores DFS (uma para cada componente).
 
@@ -86,36 +314,23 @@ def _dfs_recursive(graph: 'GraphList', v1, pre_order, pre_counter,
 # Problema: como determinar se um grafo 𝐺 = (𝑉,𝐸) possui ao menos um ciclo?
 # Solução : execute a busca DFS e procure por uma aresta de retorno comparando os intervalos de vida encontrados para cada vértice.
 
+class _BackEdgeFinder(DFSVisitor):
+    def back_edge(self, v1, v2):
+        return True     # primeira aresta de retorno já prova o ciclo
+
+
 def has_cycle(graph: 'GraphList'):
     """
-    Detecta se existe um ciclo em um grafo direcionado usando
-    as listas de pré e pós-ordem da DFS.
+    Detecta se existe um ciclo em um grafo direcionado: há ciclo se, e
+    somente se, a DFS encontra uma aresta de retorno.
 
     Retorna:
         True  → se o grafo contém pelo menos um ciclo.
         False → se o grafo é acíclico.
     """
-
-    # Primeiro, executa DFS para obter pré-ordem e pós-ordem
-    pre_order, post_order, _ = dfs(graph)
-
-    print("\n=== Verificando existência de ciclos ===")
-
-    # Percorre todos os vértices e suas arestas
-    for v1 in range(graph.num_vertices):
-        for (v2, peso) in graph.adj_list[v1]:
-            print(f"Analisando aresta {v1} → {v2} ...")
-
-            # Verifica a condição de ciclo:
-            # Se v1 foi descoberto depois de v2 (pre[v1] > pre[v2])
-            # mas finalizado antes (post[v1] < post[v2]),
-            # então há um ciclo.
-            if pre_order[v1] > pre_order[v2] and post_order[v1] < post_order[v2]:
-                print(f"⚠️  Ciclo detectado: {v1} → {v2}")
-                return True
-
-    print("✅ Nenhum ciclo encontrado.")
-    return False
+    # A busca para na primeira aresta de retorno
+    *_, encontrou = dfs_traverse(graph, _BackEdgeFinder())
+    return encontrou
 
 
 # ================================================================
@@ -138,7 +353,7 @@ def has_cycle(graph: 'GraphList'):
 #        → pre[v1] < pre[v2] < post[v2] < post[v1]
 #
 #   3. **Aresta de retorno (back edge)** ⚠️
-#        v2 é um ancestral ainda ativo na recursão.
+#        v2 é um ancestral ainda ativo (na pilha da DFS).
 #        → pre[v1] > pre[v2] e post[v1] < post[v2]
 #        → Isso indica a existência de um ciclo.
 #
@@ -150,12 +365,13 @@ def has_cycle(graph: 'GraphList'):
 #
 # 🔹 Passo a passo:
 # -------------------
-# 1. Chama `dfs(graph)` para calcular `pre_order` e `post_order`.
-# 2. Para cada aresta (v1 → v2):
-#       - Se v1 foi descoberto DEPOIS de v2 (pre[v1] > pre[v2])
-#         e finalizado ANTES (post[v1] < post[v2]),
-#         então existe um ciclo (v2 alcança v1 novamente).
-# 3. Se nenhuma aresta satisfaz a condição, o grafo é acíclico.
+# 1. Executa a DFS com `dfs_traverse`.
+# 2. Para cada aresta (v1 → v2) vista durante a busca:
+#       - Se v2 já foi descoberto mas ainda não finalizado
+#         (post[v2] == -1), v2 é ancestral de v1 → aresta de retorno,
+#         então existe um ciclo (v2 alcança v1 e v1 volta a v2).
+#         A busca para imediatamente.
+# 3. Se a DFS termina sem aresta de retorno, o grafo é acíclico.
 #
 #
 # 🔹 Exemplo:
@@ -182,14 +398,13 @@ def has_cycle(graph: 'GraphList'):
 #
 # 🔹 Complexidade:
 # -------------------
-# - O DFS inicial:      O(V + E)
-# - A varredura final:  O(E)
+# - A DFS:  O(V + E), parando na primeira aresta de retorno
 # -------------------------------
 # ➤ Complexidade total: O(V + E)
 #
 # Espaço:
 # - Vetores pre_order, post_order, parents: O(V)
-# - Pilha recursiva DFS: até O(V)
+# - Pilha explícita da DFS: até O(V)
 # ➤ Espaço total: O(V)
 #
 #
@@ -202,6 +417,19 @@ def has_cycle(graph: 'GraphList'):
 # ================================================================
 
 
+class _UndirectedCycleFinder(DFSVisitor):
+    def __init__(self, num_vertices):
+        self.pai = [-1] * num_vertices
+
+    def tree_edge(self, v, vizinho):
+        self.pai[vizinho] = v
+
+    def back_edge(self, v, vizinho):
+        # Vizinho já visitado, mas não é o pai → ciclo detectado
+        # (um laço v—v também fecha ciclo)
+        return vizinho != self.pai[v] or vizinho == v
+
+
 def has_cycle_undirected(graph: 'GraphList'):
     """
     Detecta se existe um ciclo em um grafo NÃO DIRECIONADO
@@ -211,42 +439,9 @@ def has_cycle_undirected(graph: 'GraphList'):
         True  → se o grafo contém pelo menos um ciclo.
         False → se o grafo é acíclico.
     """
-
-    visited = [False] * graph.num_vertices
-
-    print("\n=== Iniciando detecção de ciclo (grafo não direcionado) ===")
-
-    # Pode haver múltiplas componentes → roda DFS em todas
-    for v in range(graph.num_vertices):
-        if not visited[v]:
-            print(f"\n→ Iniciando DFS na componente com raiz {v}")
-            if _dfs_cycle_undirected(graph, v, visited, parent=-1):
-                print("⚠️  Ciclo detectado nesta componente!")
-                return True
-
-    print("✅ Nenhum ciclo encontrado.")
-    return False
-
-
-def _dfs_cycle_undirected(graph: 'GraphList', v, visited, parent, level=0):
-    """Função recursiva auxiliar para detecção de ciclo em grafos não direcionados."""
-    indent = "  " * level
-    visited[v] = True
-    print(f"Visitando vértice {v} (pai = {parent})")
-
-    for (vizinho, peso) in graph.adj_list[v]:
-        # Caso 1: vizinho ainda não visitado → explorar recursivamente
-        if not visited[vizinho]:
-            print(f"↳ Indo visitar vizinho {vizinho}")
-            if _dfs_cycle_undirected(graph, vizinho, visited, v, level + 1):
-                return True  # ciclo encontrado abaixo
-        # Caso 2: vizinho já visitado, mas não é o pai → ciclo detectado
-        elif vizinho != parent:
-            print(f"⚠️  Aresta {v} ↔ {vizinho} fecha um ciclo!")
-            return True
-
-    print(f"Retornando de {v}")
-    return False
+    # Pode haver múltiplas componentes → dfs_traverse roda a DFS em todas
+    *_, encontrou = dfs_traverse(graph, _UndirectedCycleFinder(graph.num_vertices))
+    return encontrou
 
 
 # ================================================================
@@ -269,17 +464,16 @@ def _dfs_cycle_undirected(graph: 'GraphList', v, visited, parent, level=0):
 #
 # 🔹 Significado das variáveis:
 # -----------------------------
-# visited[v] → True se o vértice já foi visitado.
-# parent     → pai do vértice atual na DFS.
-# level      → profundidade da recursão (usado só para prints).
+# pai[v]       → pai do vértice v na DFS (-1 na raiz),
+#                registrado no evento tree_edge.
 #
 #
 # 🔹 Passo a passo:
 # -------------------
 # 1. Marca o vértice atual como visitado.
 # 2. Para cada vizinho:
-#      - Se ainda não foi visitado → chama DFS recursiva.
-#      - Se já foi visitado e **não é o pai**, ciclo encontrado!
+#      - Se ainda não foi visitado → empilha e continua a DFS por ele.
+#      - Se já foi visitado (aresta de retorno) e **não é o pai**, ciclo encontrado!
 # 3. Se não encontrar nenhum caso desses, retorna False.
 #
 #
@@ -300,7 +494,7 @@ def _dfs_cycle_undirected(graph: 'GraphList', v, visited, parent, level=0):
 #   Cada vértice e aresta é visitado uma vez.
 #
 # Espaço: O(V)
-#   Vetor visited + pilha de recursão.
+#   Vetores da DFS + pilha explícita.
 #
 # 🔹 Observação:
 # -------------------
@@ -325,48 +519,39 @@ def _dfs_cycle_undirected(graph: 'GraphList', v, visited, parent, level=0):
 # Ou seja, define se a aresta é: Parte da floresta DFS, De avanço, De retorno, Cruzada. 
 # O algoritmo deverá apresentar complexidade 𝑂(𝑉 + 𝐸)
 
-def dfs_classify_edges(graph: 'GraphList'):
-    pre_order = [-1] * graph.num_vertices       # ordem de descoberta
-    post_order = [-1] * graph.num_vertices      # ordem de finalização
-    parents = [-1] * graph.num_vertices
-    pre_counter = [0]
-    post_counter = [0]
+class _EdgeClassifier(DFSVisitor):
+    def __init__(self, num_vertices):
+        # edge_types[v1][k] = tipo da k-ésima aresta de adj_list[v1]
+        self.edge_types = [[] for _ in range(num_vertices)]
 
-    for v in range(graph.num_vertices):
-        if pre_order[v] == -1:
-            parents[v] = v
-            _dfs_classify_recursive(
-                graph, v, pre_order, pre_counter,
-                post_order, post_counter, parents
-            )
-    return pre_order, post_order, parents
+    def tree_edge(self, v1, v2):
+        self.edge_types[v1].append(TREE_EDGE)
 
+    def back_edge(self, v1, v2):
+        self.edge_types[v1].append(BACK_EDGE)
 
-def _dfs_classify_recursive(graph: 'GraphList', v1, pre_order, pre_counter,
-                            post_order, post_counter, parents):
+    def forward_edge(self, v1, v2):
+        self.edge_types[v1].append(FORWARD_EDGE)
 
-    pre_order[v1] = pre_counter[0]  # Marca o vértice como descoberto
-    pre_counter[0] += 1
+    def cross_edge(self, v1, v2):
+        self.edge_types[v1].append(CROSS_EDGE)
 
-    for (v2, peso) in graph.adj_list[v1]:
-        if pre_order[v2] == -1:
-            print(f"({v1},{v2}) Tree branch")
-            parents[v2] = v1
-            _dfs_classify_recursive(
-                graph, v2, pre_order, pre_counter,
-                post_order, post_counter, parents
-            )
-
-        elif post_order[v2] == -1:
-            print(f"({v1},{v2}) Return")
-        else:
-            if pre_order[v2] > pre_order[v1]:
-                print(f"({v1},{v2}) Forward")
-            else:
-                print(f"({v1},{v2}) Cross")
 
-    post_order[v1] = post_counter[0]
-    post_counter[0] += 1
+def dfs_classify_edges(graph: 'GraphList'):
+    """
+    Classifica cada aresta durante a DFS.
+
+    Retorna:
+        (pre_order, post_order, parents, edge_types), em que
+        edge_types[v1][k] é TREE_EDGE, BACK_EDGE, FORWARD_EDGE ou CROSS_EDGE
+        para a k-ésima aresta de graph.adj_list[v1]
+        (EDGE_TYPE_NAMES[tipo] dá o nome para exibição).
+    """
+    # A DFS examina as arestas de cada vértice na ordem de adj_list,
+    # uma única vez, então cada lista sai alinhada com adj_list[v1]
+    classifier = _EdgeClassifier(graph.num_vertices)
+    pre_order, post_order, parents, _ = dfs_traverse(graph, classifier)
+    return pre_order, post_order, parents, classifier.edge_types
 
 
 
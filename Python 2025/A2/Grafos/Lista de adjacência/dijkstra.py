@@ -1,7 +1,45 @@
 import heapq
+import time
 from graph_list import GraphList
+from graph_csr import GraphCSR, reverse_adjacency
+from bfs import bfs_01
+from bucket_queue import DIAL_MAX_WEIGHT, integer_weight_bound, dijkstra_dial, dijkstra_radix
+from indexed_heap import IndexedHeap, ARIDADE
+from instrumentacao import current_stats, heap_ops
+
+def dijkstra(graph: GraphList, v0: int, stats=None, indexed: bool = False, d: int = ARIDADE,
+             bucket=None):
+    """
+    stats: AlgoStats opcional (ver instrumentacao.py); registra heap_push,
+           heap_pop, stale_skip, relaxations, peak_heap e o tempo da busca.
+    indexed: True → usa o heap d-ário indexado com decrease_key
+             (indexed_heap.py) no lugar do heapq com remoção preguiçosa.
+    bucket: fila de baldes para pesos inteiros (bucket_queue.py)
+            None  → automático em grafo congelado (GraphCSR): bfs_01 se os pesos
+                    são só 0 e 1, Dial se são inteiros até DIAL_MAX_WEIGHT
+            True  → força (Dial se o maior peso <= DIAL_MAX_WEIGHT, senão radix heap)
+            False → nunca
+    """
+    stats = current_stats(stats)
+    if bucket:
+        limite = integer_weight_bound(graph)
+        if limite is None:
+            raise ValueError("bucket=True exige pesos inteiros não negativos")
+        if limite <= DIAL_MAX_WEIGHT:
+            return dijkstra_dial(graph, v0, limite, stats)
+        return dijkstra_radix(graph, v0, stats)
+    if bucket is None and not indexed and isinstance(graph, GraphCSR):
+        # Verificação barata: min/max sobre o vetor de pesos, em cache no grafo
+        limite = graph.integer_weight_bound()
+        if limite is not None and limite <= 1:
+            return bfs_01(graph, v0, stats)     # só pesos 0 e 1
+        if limite is not None and limite <= DIAL_MAX_WEIGHT:
+            return dijkstra_dial(graph, v0, limite, stats)
+    if indexed:
+        return _dijkstra_indexed(graph, v0, stats, d)
+    inicio = time.perf_counter()
+    heappush, heappop, contador = heap_ops(stats)
 
-def dijkstra(graph: GraphList, v0: int):
     num_vertices = graph.num_vertices
     parent = [-1] * num_vertices
     distance = [float('inf')] * num_vertices
@@ -13,13 +51,15 @@ def dijkstra(graph: GraphList, v0: int):
 
     # Fila de prioridade (min-heap)
     heap = []
-    heapq.heappush(heap, (0, v0))  # (distância, vértice)
+    heappush(heap, (0, v0))  # (distância, vértice)
+    stale = 0
 
     while heap:
-        dist_v1, v1 = heapq.heappop(heap)
+        dist_v1, v1 = heappop(heap)
 
         # Se já processado, pula
         if checked[v1]:
+            stale += 1
             continue
 
         # Se a distância ainda é infinita, interrompe
@@ -33,8 +73,233 @@ def dijkstra(graph: GraphList, v0: int):
                 if distance[v1] + custo < distance[v2]:
                     distance[v2] = distance[v1] + custo
                     parent[v2] = v1
-                    heapq.heappush(heap, (distance[v2], v2))
+                    heappush(heap, (distance[v2], v2))
+
+        checked[v1] = True
+
+    if stats is not None:
+        # Cada relaxação bem-sucedida faz exatamente um push
+        stats.record("dijkstra",
+                     {"heap_push": contador.pushes, "heap_pop": contador.pops,
+                      "stale_skip": stale, "relaxations": contador.pushes - 1},
+                     {"busca": time.perf_counter() - inicio}, contador.peak)
+
+    return parent, distance
+
+
+def _dijkstra_indexed(graph: GraphList, v0: int, stats, d: int):
+    # Mesma busca, mas cada vértice tem no máximo uma entrada no heap:
+    # uma distância melhor faz decrease_key em vez de um novo push.
+    inicio = time.perf_counter()
+
+    num_vertices = graph.num_vertices
+    parent = [-1] * num_vertices
+    distance = [float('inf')] * num_vertices
+    checked = [False] * num_vertices
+
+    parent[v0] = v0
+    distance[v0] = 0
+
+    heap = IndexedHeap(num_vertices, d)
+    heap.push(v0, 0)
+    relaxations = 0
+
+    while heap:
+        dist_v1, v1 = heap.pop()   # nunca é obsoleto
+        checked[v1] = True
+
+        for v2, peso in graph.adj_list[v1]:
+            if not checked[v2]:
+                nova = dist_v1 + peso
+                if nova < distance[v2]:
+                    distance[v2] = nova
+                    parent[v2] = v1
+                    heap.push_or_decrease(v2, nova)
+                    relaxations += 1
+
+    if stats is not None:
+        stats.record("dijkstra",
+                     {"heap_push": heap.pushes, "heap_pop": heap.pops,
+                      "decrease_key": heap.decreases, "stale_skip": 0,
+                      "relaxations": relaxations},
+                     {"busca": time.perf_counter() - inicio}, heap.peak)
+
+    return parent, distance
+
+# Complexidade:
+#   heapq (lazy):    O((V + E) log E) tempo, heap com até O(E) entradas
+#   indexed (d-ário): O(V·d·log_d V + E·log_d V) tempo, heap com até V entradas
+
+
+# Consultas ponto a ponto (origem s → destino t)
+# ================================================================
+#
+# dijkstra_target: o mesmo Dijkstra, mas para assim que t sai do heap —
+# nesse momento distance[t] já é definitiva. Só os vértices mais
+# próximos de s que t são finalizados.
+#
+# astar: o mesmo laço com uma heurística plugável (ver heuristicas.py);
+# dijkstra_target é o caso heurística = 0.
+#
+# dijkstra_bidirectional: uma busca sai de s pelas arestas de saída e
+# outra sai de t pelas arestas de entrada (grafo reverso). Cada vez que
+# uma relaxação alcança um vértice já visto pela outra busca, a soma
+# das duas distâncias é um caminho candidato; mu guarda o melhor.
+# Critério de parada: topo_s + topo_t >= mu. Qualquer caminho ainda não
+# visto passaria por um vértice não finalizado dos dois lados e custaria
+# pelo menos topo_s + topo_t. As duas buscas juntas cobrem mais ou menos
+# duas bolas de raio d/2 em vez de uma de raio d.
+
+def dijkstra_target(graph: GraphList, v0: int, target: int, stats=None):
+    """
+    Retorna (parent, distance) como dijkstra, mas a busca para ao finalizar
+    target: distance[target] é exata; vértices mais distantes que target
+    podem ter ficado com distância provisória ou infinita.
+    """
+    return astar(graph, v0, target, None, stats)
 
+
+def astar(graph: GraphList, v0: int, target: int, heuristica=None, stats=None):
+    """
+    A*: o laço de relaxação do dijkstra_target, mas o heap é ordenado por
+    distance[v] + heuristica(v), uma estimativa do caminho inteiro s → v → t.
+    Vértices "na direção" de t saem antes, e menos vértices são finalizados.
+
+    Parâmetros:
+        heuristica: função v → limite inferior da distância de v até target
+                    (admissível, ex.: heuristicas.py); None → 0 (Dijkstra puro)
+
+    Se a heurística não for consistente (h(u) > peso(u, v) + h(v), como
+    acontece com o arredondamento das tabelas float32 do ALT), um vértice
+    pode ser finalizado cedo demais. Quando um caminho melhor até ele
+    aparece, ele é reaberto e volta para o heap; com heurística
+    admissível a distância de target continua exata.
+
+    Retorna (parent, distance) como dijkstra_target.
+    """
+    stats = current_stats(stats)
+    inicio = time.perf_counter()
+    heappush, heappop, contador = heap_ops(stats)
+
+    num_vertices = graph.num_vertices
+    parent = [-1] * num_vertices
+    distance = [float('inf')] * num_vertices
+    checked = [False] * num_vertices
+    potencial = {}          # heurística calculada uma vez por vértice
+
+    parent[v0] = v0
+    distance[v0] = 0
+    heap = [(0, v0)]
+    stale = settled = reopened = 0
+
+    while heap:
+        _, v1 = heappop(heap)
+        if checked[v1]:
+            stale += 1
+            continue
         checked[v1] = True
+        settled += 1
+        if v1 == target:
+            break   # distância de target já é definitiva
+
+        dist_v1 = distance[v1]
+        for v2, peso in graph.adj_list[v1]:
+            nova = dist_v1 + peso
+            if nova < distance[v2]:
+                # Só acontece com v2 finalizado se a heurística é inconsistente
+                if checked[v2]:
+                    checked[v2] = False
+                    reopened += 1
+                distance[v2] = nova
+                parent[v2] = v1
+                if heuristica is None:
+                    heappush(heap, (nova, v2))
+                    continue
+                h = potencial.get(v2)
+                if h is None:
+                    h = potencial[v2] = heuristica(v2)
+                if h != float('inf'):       # inf: v2 não alcança target
+                    heappush(heap, (nova + h, v2))
+
+    if stats is not None:
+        stats.record("astar" if heuristica is not None else "dijkstra_target",
+                     {"heap_push": contador.pushes + 1, "heap_pop": contador.pops,
+                      "stale_skip": stale, "relaxations": contador.pushes,
+                      "settled": settled, "reopened": reopened},
+                     {"busca": time.perf_counter() - inicio}, contador.peak)
 
     return parent, distance
+
+
+def dijkstra_bidirectional(graph: GraphList, s: int, t: int, reverse=None, stats=None):
+    """
+    Parâmetros:
+        reverse: visão reversa do grafo; se None, é montada com
+                 reverse_adjacency(graph). Para muitas consultas no mesmo
+                 grafo, monte uma vez e repasse.
+
+    Retorna:
+        (distância, caminho de s até t), ou (inf, []) se t é inalcançável.
+    """
+    stats = current_stats(stats)
+    inicio = time.perf_counter()
+    if s == t:
+        return 0, [s]
+    if reverse is None:
+        reverse = reverse_adjacency(graph)
+
+    # Índice 0 = busca a partir de s; 1 = busca reversa a partir de t.
+    # Dicionários: só os vértices alcançados pagam memória.
+    adj = (graph.adj_list, reverse.adj_list)
+    dist = ({s: 0}, {t: 0})
+    parent = ({s: s}, {t: t})
+    heaps = ([(0, s)], [(0, t)])
+    mu, encontro = float('inf'), -1
+    pops = 0
+
+    while heaps[0] and heaps[1]:
+        topo_s, topo_t = heaps[0][0][0], heaps[1][0][0]
+        if topo_s + topo_t >= mu:
+            break
+
+        # Avança o lado com o menor topo (mantém as duas bolas parecidas)
+        lado = 0 if topo_s <= topo_t else 1
+        d_u, u = heapq.heappop(heaps[lado])
+        pops += 1
+        dist_lado, dist_outro = dist[lado], dist[1 - lado]
+        if d_u > dist_lado[u]:
+            continue    # entrada obsoleta
+
+        for v, peso in adj[lado][u]:
+            nova = d_u + peso
+            if nova < dist_lado.get(v, float('inf')):
+                dist_lado[v] = nova
+                parent[lado][v] = u
+                heapq.heappush(heaps[lado], (nova, v))
+            # v já alcançado pela outra busca → caminho candidato
+            if v in dist_outro and dist_lado[v] + dist_outro[v] < mu:
+                mu, encontro = dist_lado[v] + dist_outro[v], v
+
+    if stats is not None:
+        stats.record("dijkstra_bidirectional",
+                     {"heap_pop": pops, "settled_s": len(dist[0]), "settled_t": len(dist[1])},
+                     {"busca": time.perf_counter() - inicio})
+
+    if encontro == -1:
+        return float('inf'), []
+
+    # s → ... → encontro pelos pais da busca direta;
+    # encontro → ... → t pelos pais da busca reversa
+    caminho = [encontro]
+    while caminho[-1] != s:
+        caminho.append(parent[0][caminho[-1]])
+    caminho.reverse()
+    while caminho[-1] != t:
+        caminho.append(parent[1][caminho[-1]])
+    return mu, caminho
+
+# Complexidade:
+#   dijkstra_target        → O((V' + E') log E'), V'/E' = vértices/arestas mais próximos de s que t
+#   astar                  → mesmo pior caso; com boa heurística V' cai bastante
+#   dijkstra_bidirectional → mesmo pior caso do dijkstra; na prática explora
+#                            as duas "bolas" de raio ~d/2 ao redor de s e t
@@ -0,0 +1,120 @@
+from array import array
+from collections import OrderedDict
+
+from dijkstra import dijkstra
+from bfs import reconstruir_caminho
+
+# Oráculo de distâncias com cache LRU de árvores de caminhos mínimos
+# ================================================================
+#
+# Cada consulta (s, t) precisa da árvore de caminhos mínimos de s, que o
+# dijkstra monta inteira. Quando as origens se repetem, a árvore de s
+# fica guardada e a próxima consulta com a mesma origem custa só a
+# leitura de distance[t] (O(1)) ou a subida pelos pais (O(caminho)).
+#
+# - Árvores compactas: parent em array('i') e distance em array('d'),
+#   12 bytes por vértice, em vez de duas listas de objetos Python.
+# - Memória limitada: cabem max_bytes // (12 · V) árvores (pelo menos
+#   uma); ao passar disso, a usada há mais tempo sai (LRU, OrderedDict).
+# - Invalidação: o cache guarda a versão do grafo (graph.version). Se o
+#   grafo mudou desde então, todas as árvores são descartadas.
+# - Em grafo não direcionado, a árvore de t também responde (s, t).
+
+BYTES_POR_VERTICE = 4 + 8   # parent (int32) + distance (float64)
+MAX_BYTES = 64 * 1024 * 1024
+
+
+class DistanceOracle:
+    def __init__(self, graph, max_bytes: int = MAX_BYTES, algoritmo=dijkstra):
+        """
+        Parâmetros:
+            graph: GraphList ou GraphCSR (precisa do atributo version)
+            max_bytes: limite de memória para as árvores guardadas
+            algoritmo: função (graph, s) → (parent, distance); padrão dijkstra
+        """
+        self.graph = graph
+        self.algoritmo = algoritmo
+        self.capacidade = max(1, max_bytes // (BYTES_POR_VERTICE * max(graph.num_vertices, 1)))
+
+        self._arvores = OrderedDict()   # origem → (parent, distance)
+        self._versao = graph.version
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _valida(self):
+        # Grafo alterado depois que as árvores foram calculadas → descarta
+        if self.graph.version != self._versao:
+            if self._arvores:
+                self.invalidations += 1
+                self._arvores.clear()
+            self._versao = self.graph.version
+
+    def _guardada(self, s):
+        arvore = self._arvores.get(s)
+        if arvore is not None:
+            self._arvores.move_to_end(s)    # usada agora: vai para o fim da fila LRU
+        return arvore
+
+    def tree(self, s: int):
+        """Árvore de caminhos mínimos de s: (parent, distance) como array('i') e array('d')."""
+        self._valida()
+        arvore = self._guardada(s)
+        if arvore is not None:
+            self.hits += 1
+            return arvore
+
+        self.misses += 1
+        parent, distance = self.algoritmo(self.graph, s)
+        arvore = (array('i', parent), array('d', distance))
+
+        self._arvores[s] = arvore
+        if len(self._arvores) > self.capacidade:
+            self._arvores.popitem(last=False)   # a usada há mais tempo
+            self.evictions += 1
+        return arvore
+
+    def distance(self, s: int, t: int) -> float:
+        """Menor distância de s até t (inf se não há caminho)."""
+        self._valida()
+        if not self.graph.direcionado and s not in self._arvores:
+            arvore = self._guardada(t)
+            if arvore is not None:
+                self.hits += 1
+                return arvore[1][s]
+        return self.tree(s)[1][t]
+
+    def path(self, s: int, t: int):
+        """Caminho mínimo de s até t como lista de vértices, ou None."""
+        self._valida()
+        if not self.graph.direcionado and s not in self._arvores:
+            arvore = self._guardada(t)
+            if arvore is not None:
+                # Na árvore de t, subir de s pelos pais já dá o caminho s → t
+                self.hits += 1
+                caminho = reconstruir_caminho(arvore[0], t, s)
+                return caminho[::-1] if caminho is not None else None
+        return reconstruir_caminho(self.tree(s)[0], s, t)
+
+    def clear(self):
+        self._arvores.clear()
+
+    def cache_info(self) -> dict:
+        consultas = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / consultas if consultas else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "arvores": len(self._arvores),
+            "capacidade": self.capacidade,
+            "bytes": len(self._arvores) * BYTES_POR_VERTICE * self.graph.num_vertices,
+        }
+
+# Complexidade (por consulta):
+#   acerto no cache → O(1) para distance, O(caminho) para path
+#   falha           → uma execução do algoritmo (O((V + E) log V) com dijkstra)
+#   Espaço: até capacidade · 12 · V bytes
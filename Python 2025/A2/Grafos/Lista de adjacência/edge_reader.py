@@ -0,0 +1,234 @@
+import os
+import sys
+import time
+from array import array
+
+from graph_csr import GraphCSR, CSRBuilder, csr_from_edges
+from graph_list import GraphList
+
+try:
+    import numpy as np
+except ImportError:     # sem NumPy, read_edge_list junta os lotes (CSRBuilder exige NumPy)
+    np = None
+
+# Leitura em streaming de arquivos texto de arestas
+# ================================================================
+#
+# Formatos aceitos (parâmetro `formato`):
+#
+#   "edges"  → uma aresta por linha: "u v" ou "u v w" (vértices a partir de 0).
+#              Linhas vazias ou começando com '#' ou '%' são ignoradas.
+#
+#   "dimacs" → formato do 9º DIMACS Challenge (vértices a partir de 1):
+#                c comentário
+#                p sp <n> <m>
+#                a <u> <v> <w>
+#
+#   "metis"  → formato do METIS (vértices a partir de 1, grafo não direcionado):
+#                <n> <m> [fmt]
+#                linha i = vizinhos do vértice i ("v1 v2 ..." ou, se fmt
+#                terminar em 1, "v1 w1 v2 w2 ...")
+#              Linhas começando com '%' são comentários.
+#
+# O arquivo é lido em blocos de `chunk_size` bytes. Cada bloco é quebrado
+# em linhas e a última linha incompleta é guardada para o bloco seguinte,
+# então nunca existe o arquivo inteiro na memória como strings Python.
+# As arestas de cada bloco saem como três arrays (us, vs, ws) compactos.
+#
+# read_edge_list também nunca junta a lista inteira de arestas: lê o
+# arquivo duas vezes e entrega os lotes ao CSRBuilder (graph_csr.py) —
+# na 1ª passada só contando graus, na 2ª gravando cada lote direto nos
+# vetores CSR finais. O pico de memória é o próprio grafo mais um lote.
+
+CHUNK_SIZE = 1 << 24   # 16 MB
+
+
+def _parse_edges(linhas, us, vs, ws, estado):
+    for linha in linhas:
+        campos = linha.split()
+        if not campos or campos[0][:1] in (b"#", b"%"):
+            continue
+        us.append(int(campos[0]))
+        vs.append(int(campos[1]))
+        ws.append(float(campos[2]) if len(campos) > 2 else 1.0)
+
+
+def _parse_dimacs(linhas, us, vs, ws, estado):
+    for linha in linhas:
+        campos = linha.split()
+        if not campos:
+            continue
+        if campos[0] == b"a":
+            us.append(int(campos[1]) - 1)
+            vs.append(int(campos[2]) - 1)
+            ws.append(float(campos[3]))
+        elif campos[0] == b"p":
+            estado["num_vertices"] = int(campos[2])
+
+
+def _parse_metis(linhas, us, vs, ws, estado):
+    for linha in linhas:
+        if linha[:1] == b"%":
+            continue
+        campos = linha.split()
+
+        # A primeira linha útil é o cabeçalho "<n> <m> [fmt]"
+        if "num_vertices" not in estado:
+            if not campos:
+                continue
+            estado["num_vertices"] = int(campos[0])
+            estado["com_peso"] = len(campos) > 2 and campos[2][-1:] == b"1"
+            estado["vertice"] = 0
+            continue
+
+        # Depois dele, a k-ésima linha (mesmo vazia) lista os vizinhos do vértice k
+        u = estado["vertice"]
+        if u >= estado["num_vertices"]:
+            continue
+        estado["vertice"] = u + 1
+
+        if estado["com_peso"]:
+            for i in range(0, len(campos), 2):
+                us.append(u)
+                vs.append(int(campos[i]) - 1)
+                ws.append(float(campos[i + 1]))
+        else:
+            for campo in campos:
+                us.append(u)
+                vs.append(int(campo) - 1)
+                ws.append(1.0)
+
+
+_PARSERS = {
+    "edges": _parse_edges,
+    "dimacs": _parse_dimacs,
+    "metis": _parse_metis,
+}
+
+
+def iter_edge_batches(path, formato="edges", chunk_size=CHUNK_SIZE, progresso=None, estado=None):
+    """
+    Lê o arquivo bloco a bloco e gera, para cada bloco, um lote
+    (us, vs, ws) com array('i'), array('i') e array('d').
+
+    Parâmetros:
+        path: caminho do arquivo texto
+        formato: "edges", "dimacs" ou "metis"
+        chunk_size: tamanho de cada bloco lido, em bytes
+        progresso: função opcional chamada após cada bloco como
+                   progresso(bytes_lidos, total_bytes, arestas_lidas, segundos)
+        estado: dicionário opcional que recebe informações do cabeçalho
+                (ex.: estado["num_vertices"] em DIMACS e METIS)
+    """
+    if formato not in _PARSERS:
+        raise ValueError(f"Formato desconhecido: {formato}")
+    parse = _PARSERS[formato]
+    if estado is None:
+        estado = {}
+
+    total_bytes = os.path.getsize(path)
+    bytes_lidos = 0
+    arestas_lidas = 0
+    inicio = time.perf_counter()
+    resto = b""
+
+    with open(path, "rb") as f:
+        while True:
+            bloco = f.read(chunk_size)
+            if not bloco:
+                break
+            bytes_lidos += len(bloco)
+
+            linhas = (resto + bloco).split(b"\n")
+            resto = linhas.pop()   # última linha pode estar incompleta
+
+            us, vs, ws = array('i'), array('i'), array('d')
+            parse(linhas, us, vs, ws, estado)
+            arestas_lidas += len(us)
+
+            if progresso is not None:
+                progresso(bytes_lidos, total_bytes, arestas_lidas, time.perf_counter() - inicio)
+            if us:
+                yield us, vs, ws
+
+    # Última linha do arquivo, se não terminar com '\n'
+    if resto:
+        us, vs, ws = array('i'), array('i'), array('d')
+        parse([resto], us, vs, ws, estado)
+        if us:
+            yield us, vs, ws
+
+
+def imprimir_progresso(bytes_lidos, total_bytes, arestas_lidas, segundos):
+    # Implementação simples de `progresso`: porcentagem e vazão em MB/s e arestas/s
+    porcentagem = 100.0 * bytes_lidos / total_bytes if total_bytes else 100.0
+    segundos = max(segundos, 1e-9)
+    mb_por_s = bytes_lidos / segundos / 1e6
+    arestas_por_s = arestas_lidas / segundos
+    print(f"\r{porcentagem:5.1f}%  {arestas_lidas} arestas  "
+          f"{mb_por_s:.1f} MB/s  {arestas_por_s:.0f} arestas/s", end="", file=sys.stderr)
+    if bytes_lidos >= total_bytes:
+        print(file=sys.stderr)
+
+
+def read_edge_list(path, formato="edges", num_vertices=None, direcionado: bool = True,
+                   dedupe: bool = True, congelado: bool = True,
+                   chunk_size=CHUNK_SIZE, progresso=None):
+    """
+    Lê um arquivo de arestas inteiro em streaming e monta o grafo com o
+    construtor incremental (CSRBuilder), em duas passadas pelo arquivo.
+
+    Parâmetros:
+        num_vertices: se None, vem do cabeçalho (DIMACS/METIS) ou do maior id + 1
+        direcionado: ignorado em METIS, que é sempre não direcionado
+        congelado: True → GraphCSR (compacto); False → GraphList
+        progresso: chamado a cada bloco, nas duas passadas
+
+    Retorna:
+        GraphCSR ou GraphList.
+    """
+    # METIS já lista as duas direções de cada aresta: não espelhar de novo
+    simetrica = formato == "metis"
+    if simetrica:
+        direcionado = False
+
+    if np is None:
+        graph = _read_concatenado(path, formato, num_vertices, direcionado,
+                                  simetrica, dedupe, chunk_size, progresso)
+    else:
+        builder = CSRBuilder(num_vertices, direcionado, simetrica, dedupe)
+        estado = {}
+        for us, vs, _ in iter_edge_batches(path, formato, chunk_size, progresso, estado):
+            builder.count(us, vs)
+        builder.allocate(num_vertices if num_vertices is not None else estado.get("num_vertices"))
+        for us, vs, ws in iter_edge_batches(path, formato, chunk_size, progresso):
+            builder.scatter(us, vs, ws)
+        graph = builder.build()
+
+    return graph if congelado else GraphList.from_csr(graph)
+
+
+def _read_concatenado(path, formato, num_vertices, direcionado, simetrica,
+                      dedupe, chunk_size, progresso):
+    # Sem NumPy: junta os lotes em três arrays (16 bytes por aresta) e usa
+    # o construtor em lote de uma vez
+    us, vs, ws = array('i'), array('i'), array('d')
+    estado = {}
+    for lote_us, lote_vs, lote_ws in iter_edge_batches(path, formato, chunk_size, progresso, estado):
+        us.extend(lote_us)
+        vs.extend(lote_vs)
+        ws.extend(lote_ws)
+
+    if num_vertices is None:
+        num_vertices = estado.get("num_vertices")
+    if num_vertices is None:
+        num_vertices = max(max(us, default=-1), max(vs, default=-1)) + 1
+
+    offsets, targets, pesos = csr_from_edges(
+        num_vertices, us, vs, ws, direcionado or simetrica, dedupe)
+    return GraphCSR(num_vertices, offsets, targets, pesos, direcionado)
+
+
+# Complexidade:
+#   Tempo:  O(tamanho do arquivo + V + E log L), L = arestas por bloco (duas leituras)
+#   Espaço: O(chunk_size) para o texto e o lote + O(V + E) dos vetores do grafo
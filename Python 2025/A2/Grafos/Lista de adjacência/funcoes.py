@@ -6,11 +6,12 @@ def is_subgraph(G:GraphList, H:GraphList) -> bool:
         return False
     
     for i in range(H.num_vertices):
-        for v2 in H.adj_list[i]:
+        for v2, _ in H.adj_list[i]:
+            # has_edge usa o índice hash do GraphList → O(1) esperado
             if not G.has_edge(i, v2):
                 return False
             
-    return True      
+    return True      # O(V + E_H)
 
 #OVE
 
@@ -0,0 +1,487 @@
+from array import array
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:     # sem NumPy, csr_from_edges usa o counting sort em Python
+    np = None
+
+# Representação CSR (compressed sparse row) de um grafo.
+#
+# Em vez de uma lista de listas de tuplas (vizinho, peso), guardamos
+# três vetores contíguos:
+#   offsets[v] .. offsets[v+1]  → faixa das arestas que saem de v
+#   targets[i]                  → vizinho da i-ésima aresta
+#   weights[i]                  → peso da i-ésima aresta
+#
+# Exemplo (grafo 0 → 1, 0 → 2, 2 → 1):
+#   offsets = [0, 2, 2, 3]
+#   targets = [1, 2, 1]
+#   weights = [1.0, 1.0, 1.0]
+#
+# Cada aresta custa 4 bytes (int) + 8 bytes (double), contra ~100 bytes
+# de uma tupla Python dentro de uma lista. Além disso os vizinhos de um
+# vértice ficam lado a lado na memória.
+
+
+class _Vizinhos:
+    """
+    Vizinhos de um vértice: sequência somente leitura de pares
+    (vizinho, peso) sobre fatias dos vetores CSR, sem cópia. Como uma
+    lista de GraphList.adj_list, pode ser percorrida várias vezes e
+    aceita len() e indexação.
+    """
+
+    __slots__ = ("_targets", "_weights")
+
+    def __init__(self, targets, weights):
+        self._targets = targets
+        self._weights = weights
+
+    def __len__(self):
+        return len(self._targets)
+
+    def __getitem__(self, i):
+        return self._targets[i], self._weights[i]
+
+    def __iter__(self):
+        return zip(self._targets, self._weights)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _AdjView:
+    """
+    Visão somente leitura que imita `GraphList.adj_list`.
+    graph.adj_list[v] devolve uma sequência de pares (vizinho, peso),
+    então bfs, dfs, dijkstra, bellman_ford e prim funcionam sem mudanças.
+    """
+
+    def __init__(self, offsets, targets, weights):
+        self._offsets = offsets
+        # memoryview permite fatiar sem copiar os vetores
+        self._targets = memoryview(targets)
+        self._weights = memoryview(weights)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, v):
+        inicio = self._offsets[v]
+        fim = self._offsets[v + 1]
+        return _Vizinhos(self._targets[inicio:fim], self._weights[inicio:fim])
+
+    def __iter__(self):
+        for v in range(len(self)):
+            yield self[v]
+
+
+class GraphCSR:
+    def __init__(self, num_vertices, offsets, targets, weights, direcionado: bool = True):
+        self.num_vertices = num_vertices
+        self.num_edges = len(targets)
+        self.direcionado = direcionado
+
+        self.offsets = offsets      # tamanho num_vertices + 1
+        self.targets = targets      # tamanho num_edges
+        self.weights = weights      # tamanho num_edges
+
+        self.adj_list = _AdjView(offsets, targets, weights)
+        self._limite_inteiro = -1   # cache de integer_weight_bound (-1 = não calculado)
+        self.version = 0            # imutável: a versão nunca muda
+
+    @classmethod
+    def from_edges(cls, num_vertices, us, vs, weights=None, direcionado: bool = True, dedupe: bool = True):
+        # Mesmo contrato de GraphList.from_edges, mas sem criar tuplas
+        offsets, targets, pesos = csr_from_edges(
+            num_vertices, us, vs, weights, direcionado, dedupe)
+        return cls(num_vertices, offsets, targets, pesos, direcionado)
+
+    def degree(self, v):
+        return self.offsets[v + 1] - self.offsets[v]
+
+    def integer_weight_bound(self):
+        """
+        Maior peso, como int, se todos os pesos são inteiros não negativos;
+        None caso contrário. Como o grafo congelado não muda, o resultado
+        fica guardado depois da primeira chamada.
+        """
+        if self._limite_inteiro == -1:
+            pesos = self.weights
+            if not pesos:
+                self._limite_inteiro = 0
+            elif min(pesos) >= 0 and all(map(float.is_integer, pesos)):
+                self._limite_inteiro = int(max(pesos))
+            else:
+                self._limite_inteiro = None
+        return self._limite_inteiro
+
+    def has_edge(self, v1, v2):
+        for vizinho, _ in self.adj_list[v1]:
+            if vizinho == v2:
+                return True
+        return False
+
+    def print_edges(self):
+        print("Arestas do grafo:")
+        for v1 in range(self.num_vertices):
+            for v2, peso in self.adj_list[v1]:
+                print(f"({v1} -> {v2}, peso = {peso})")
+        print()
+
+
+def csr_from_adj_list(adj_list):
+    """
+    Copia uma lista de adjacência (lista de listas de (vizinho, peso))
+    para os três vetores CSR.
+
+    Retorna:
+        (offsets, targets, weights) como array('q'), array('i') e array('d').
+    """
+    num_vertices = len(adj_list)
+    offsets = array('q', [0]) * (num_vertices + 1)
+    targets = array('i')
+    weights = array('d')
+
+    # map + itemgetter copiam cada lista em C, sem um passo Python por aresta
+    vizinho, peso = itemgetter(0), itemgetter(1)
+    for v, vizinhos in enumerate(adj_list):
+        targets.extend(map(vizinho, vizinhos))
+        weights.extend(map(peso, vizinhos))
+        offsets[v + 1] = len(targets)
+
+    return offsets, targets, weights
+
+
+def csr_from_edges(num_vertices, us, vs, weights=None, direcionado: bool = True, dedupe: bool = True):
+    """
+    Monta os vetores CSR a partir de três sequências paralelas de arestas
+    (origem, destino, peso), agrupando os arcos pela origem.
+
+    Com NumPy o agrupamento é um argsort estável pela origem e a remoção
+    de repetidas um np.unique da chave origem·V + destino, tudo em C.
+    Sem NumPy, cai no counting sort em Python (_csr_from_edges_python).
+
+    Parâmetros:
+        num_vertices: número de vértices
+        us, vs: origens e destinos das arestas
+        weights: pesos (None → peso 1.0 em todas)
+        direcionado: se False, cada aresta (u, v) gera também (v, u)
+        dedupe: remove arestas repetidas, mantendo a primeira ocorrência
+                (mesmo comportamento de várias chamadas a add_edge)
+
+    Retorna:
+        (offsets, targets, weights) como array('q'), array('i') e array('d').
+    """
+    if np is not None:
+        return _csr_from_edges_numpy(num_vertices, us, vs, weights, direcionado, dedupe)
+    return _csr_from_edges_python(num_vertices, us, vs, weights, direcionado, dedupe)
+
+
+def _csr_from_edges_numpy(num_vertices, us, vs, weights, direcionado, dedupe):
+    src = np.asarray(us, dtype=np.int64)
+    dst = np.asarray(vs, dtype=np.int64)
+    pesos = np.ones(len(src)) if weights is None else np.asarray(weights, dtype=np.float64)
+    for vertices in (src, dst):
+        if vertices.size and (vertices.min() < 0 or vertices.max() >= num_vertices):
+            raise IndexError("vértice fora do intervalo [0, num_vertices)")
+
+    if not direcionado:
+        src, dst, pesos = _com_reversos_numpy(src, dst, pesos)
+
+    # Ordenação estável pela origem: dentro de cada faixa fica a ordem de entrada
+    ordem = np.argsort(src, kind="stable")
+    src, dst, pesos = src[ordem], dst[ordem], pesos[ordem]
+
+    if dedupe:
+        # np.unique devolve o índice da primeira ocorrência de cada chave;
+        # a máscara mantém essas arestas na ordem original
+        _, primeiras = np.unique(src * num_vertices + dst, return_index=True)
+        manter = np.zeros(len(src), dtype=bool)
+        manter[primeiras] = True
+        src, dst, pesos = src[manter], dst[manter], pesos[manter]
+
+    offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=num_vertices), out=offsets[1:])
+    return _array_de('q', offsets), _array_de('i', dst.astype(np.int32)), _array_de('d', pesos)
+
+
+def _com_reversos_numpy(src, dst, pesos):
+    # Intercala cada arco com o reverso (como add_edge); laços ficam uma vez só
+    num_arestas = len(src)
+    intercalado_src = np.empty(2 * num_arestas, dtype=np.int64)
+    intercalado_src[0::2], intercalado_src[1::2] = src, dst
+    intercalado_dst = np.empty(2 * num_arestas, dtype=np.int64)
+    intercalado_dst[0::2], intercalado_dst[1::2] = dst, src
+    manter = np.ones(2 * num_arestas, dtype=bool)
+    manter[1::2] = src != dst
+    return intercalado_src[manter], intercalado_dst[manter], np.repeat(pesos, 2)[manter]
+
+
+def _array_de(typecode, valores):
+    vetor = array(typecode)
+    vetor.frombytes(np.ascontiguousarray(valores).tobytes())
+    return vetor
+
+
+def _csr_from_edges_python(num_vertices, us, vs, weights, direcionado, dedupe):
+    # Counting sort pela origem, um passo Python por arco
+    if weights is None:
+        weights = [1.0] * len(us)
+
+    # Lista de arcos (origem, destino, peso); em grafo não direcionado
+    # o arco reverso vem logo depois do original, como em add_edge
+    if direcionado:
+        # arrays do tipo certo (ex.: vindos de edge_reader) são usados sem cópia
+        src = _como_array('i', us)
+        dst = _como_array('i', vs)
+        pesos = _como_array('d', weights)
+    else:
+        src = array('i')
+        dst = array('i')
+        pesos = array('d')
+        for u, v, w in _com_reversos(us, vs, weights):
+            src.append(u)
+            dst.append(v)
+            pesos.append(w)
+    num_arcos = len(src)
+
+    # 1ª passada: conta o grau de saída de cada vértice
+    offsets = array('q', [0]) * (num_vertices + 1)
+    for u in src:
+        offsets[u + 1] += 1
+
+    # Soma de prefixos: offsets[v] = início da faixa de v
+    for v in range(num_vertices):
+        offsets[v + 1] += offsets[v]
+
+    # 2ª passada: espalha cada arco na sua faixa (ordenação estável)
+    proxima = array('q', offsets[:num_vertices])
+    targets = array('i', [0]) * num_arcos
+    ordenados = array('d', [0.0]) * num_arcos
+    for i in range(num_arcos):
+        u = src[i]
+        p = proxima[u]
+        targets[p] = dst[i]
+        ordenados[p] = pesos[i]
+        proxima[u] = p + 1
+
+    if dedupe:
+        offsets, targets, ordenados = _dedupe(offsets, targets, ordenados)
+
+    return offsets, targets, ordenados
+
+
+class CSRBuilder:
+    """
+    Construtor incremental de GraphCSR para entradas maiores que a memória
+    disponível para guardar a lista de arestas (ex.: edge_reader).
+
+    Os lotes de arestas são vistos em duas passadas, sem nunca juntar a
+    lista inteira:
+        1. count(us, vs) para cada lote → grau de saída de cada vértice
+        2. allocate() → offsets pela soma de prefixos e targets/weights
+           já no tamanho final
+        3. scatter(us, vs, ws) para os MESMOS lotes, na mesma ordem → cada
+           arco vai direto para a sua posição (estável: dentro de cada
+           faixa fica a ordem de entrada)
+        4. build() → remove repetidas faixa a faixa, em blocos, e devolve
+           o GraphCSR
+    Memória: os vetores finais (12 bytes por arco + 8 por vértice) mais
+    temporários do tamanho de um lote. Exige NumPy.
+    """
+
+    def __init__(self, num_vertices=None, direcionado: bool = True,
+                 simetrica: bool = False, dedupe: bool = True):
+        """
+        Parâmetros:
+            num_vertices: se None, vira o maior id visto + 1
+            direcionado: valor de GraphCSR.direcionado no grafo final
+            simetrica: a entrada já lista as duas direções de cada aresta
+                       (ex.: METIS); só tem efeito em grafo não direcionado,
+                       que então não espelha os arcos de novo
+            dedupe: remove arcos repetidos, mantendo a primeira ocorrência
+        """
+        if np is None:
+            raise ImportError("CSRBuilder precisa do NumPy")
+        self.num_vertices = num_vertices
+        self.direcionado = direcionado
+        self.dedupe = dedupe
+        self._espelhar = not direcionado and not simetrica
+        self._graus = np.zeros(num_vertices or 0, dtype=np.int64)
+        self._maior = -1
+
+    def _arcos(self, us, vs, ws=None):
+        src = np.asarray(us, dtype=np.int64)
+        dst = np.asarray(vs, dtype=np.int64)
+        pesos = np.ones(len(src)) if ws is None else np.asarray(ws, dtype=np.float64)
+        if self._espelhar:
+            src, dst, pesos = _com_reversos_numpy(src, dst, pesos)
+        return src, dst, pesos
+
+    def count(self, us, vs):
+        """Passada 1: soma o grau de saída dos arcos de um lote."""
+        src, dst, _ = self._arcos(us, vs)
+        if not src.size:
+            return
+        if min(src.min(), dst.min()) < 0:
+            raise IndexError("vértice negativo")
+        self._maior = max(self._maior, int(src.max()), int(dst.max()))
+        graus = np.bincount(src, minlength=len(self._graus))
+        graus[:len(self._graus)] += self._graus
+        self._graus = graus
+
+    def allocate(self, num_vertices=None):
+        """Fecha a passada 1 e reserva os vetores finais."""
+        if num_vertices is not None:
+            self.num_vertices = num_vertices
+        if self.num_vertices is None:
+            self.num_vertices = self._maior + 1
+        n = self.num_vertices
+        if self._maior >= n:
+            raise IndexError("vértice fora do intervalo [0, num_vertices)")
+
+        graus = np.zeros(n, dtype=np.int64)
+        graus[:len(self._graus)] = self._graus
+        self._graus = None
+        num_arcos = int(graus.sum())
+
+        # Os vetores finais são array('q'/'i'/'d'); o NumPy escreve neles por visões
+        self.offsets = array('q', [0]) * (n + 1)
+        self.targets = array('i', [0]) * num_arcos
+        self.weights = array('d', [0.0]) * num_arcos
+        np.cumsum(graus, out=np.frombuffer(self.offsets, dtype=np.int64)[1:])
+        self._proxima = np.frombuffer(self.offsets, dtype=np.int64)[:n].copy()
+
+    def scatter(self, us, vs, ws=None):
+        """Passada 2: grava os arcos de um lote nas suas faixas."""
+        src, dst, pesos = self._arcos(us, vs, ws)
+        if not src.size:
+            return
+        # Posição de cada arco = próxima posição livre da origem + quantos
+        # arcos da mesma origem vêm antes dele no lote
+        ordem = np.argsort(src, kind="stable")
+        src = src[ordem]
+        inicio_grupo = np.flatnonzero(np.r_[True, src[1:] != src[:-1]])
+        tamanhos = np.diff(np.r_[inicio_grupo, src.size])
+        rank = np.arange(src.size) - np.repeat(inicio_grupo, tamanhos)
+        posicoes = self._proxima[src] + rank
+
+        limites = np.frombuffer(self.offsets, dtype=np.int64)[1:]
+        if (posicoes >= limites[src]).any():
+            raise ValueError("scatter recebeu mais arcos do que count contou")
+        np.frombuffer(self.targets, dtype=np.int32)[posicoes] = dst[ordem]
+        np.frombuffer(self.weights, dtype=np.float64)[posicoes] = pesos[ordem]
+        self._proxima[src[inicio_grupo]] += tamanhos
+
+    def build(self) -> "GraphCSR":
+        if not np.array_equal(self._proxima, np.frombuffer(self.offsets, dtype=np.int64)[1:]):
+            raise ValueError("scatter recebeu menos arcos do que count contou")
+        self._proxima = None
+        if self.dedupe:
+            total = _dedupe_em_blocos(
+                np.frombuffer(self.offsets, dtype=np.int64),
+                np.frombuffer(self.targets, dtype=np.int32),
+                np.frombuffer(self.weights, dtype=np.float64))
+            # Sem visões NumPy vivas, os arrays podem encolher no lugar
+            del self.targets[total:]
+            del self.weights[total:]
+        return GraphCSR(self.num_vertices, self.offsets, self.targets, self.weights, self.direcionado)
+
+
+# Arcos por bloco na remoção de repetidas de CSRBuilder.build
+_ARCOS_POR_BLOCO = 1 << 22
+
+
+def _dedupe_em_blocos(offsets, targets, weights):
+    # Compacta as faixas no lugar, da esquerda para a direita: cada bloco
+    # de vértices consecutivos (até _ARCOS_POR_BLOCO arcos, ou um vértice)
+    # é lido inteiro antes de ser escrito, e a escrita nunca passa da leitura.
+    n = len(offsets) - 1
+    escrita = 0
+    inicio = 0          # offsets[v] antigo (o atual já foi reescrito)
+    v = 0
+    while v < n:
+        b = int(np.searchsorted(offsets[v + 1:], inicio + _ARCOS_POR_BLOCO, "right")) + v
+        b = min(max(b, v + 1), n)
+        fim = int(offsets[b])
+
+        graus = np.diff(np.r_[inicio, offsets[v + 1:b + 1]])
+        src = np.repeat(np.arange(v, b, dtype=np.int64), graus)
+        _, primeiras = np.unique(src * n + targets[inicio:fim], return_index=True)
+        primeiras.sort()
+        k = len(primeiras)
+
+        targets[escrita:escrita + k] = targets[inicio:fim][primeiras]
+        weights[escrita:escrita + k] = weights[inicio:fim][primeiras]
+        offsets[v + 1:b + 1] = escrita + np.cumsum(np.bincount(src[primeiras] - v, minlength=b - v))
+
+        escrita += k
+        inicio = fim
+        v = b
+    return escrita
+
+
+def reverse_adjacency(graph):
+    """
+    Visão reversa do grafo: um GraphCSR com cada arco (u, v) invertido
+    para (v, u), útil para buscas que precisam dos vizinhos de entrada.
+    Em grafo não direcionado as listas já são simétricas e o próprio
+    grafo é devolvido.
+    """
+    if not graph.direcionado:
+        return graph
+
+    us = array('i')
+    vs = array('i')
+    ws = array('d')
+    for v1 in range(graph.num_vertices):
+        for v2, peso in graph.adj_list[v1]:
+            us.append(v2)
+            vs.append(v1)
+            ws.append(peso)
+    return GraphCSR.from_edges(graph.num_vertices, us, vs, ws, direcionado=True, dedupe=False)
+
+
+def _como_array(typecode, valores):
+    if isinstance(valores, array) and valores.typecode == typecode:
+        return valores
+    return array(typecode, valores)
+
+
+def _com_reversos(us, vs, weights):
+    for u, v, w in zip(us, vs, weights):
+        yield u, v, w
+        if u != v:
+            yield v, u, w
+
+
+def _dedupe(offsets, targets, weights):
+    # Compacta cada faixa mantendo só a primeira ocorrência de cada vizinho
+    num_vertices = len(offsets) - 1
+    novos_offsets = array('q', [0]) * (num_vertices + 1)
+    novos_targets = array('i')
+    novos_weights = array('d')
+
+    for v in range(num_vertices):
+        vistos = set()
+        for i in range(offsets[v], offsets[v + 1]):
+            v2 = targets[i]
+            if v2 not in vistos:
+                vistos.add(v2)
+                novos_targets.append(v2)
+                novos_weights.append(weights[i])
+        novos_offsets[v + 1] = len(novos_targets)
+
+    return novos_offsets, novos_targets, novos_weights
+
+
+# Complexidade:
+#   csr_from_adj_list → O(V + E) tempo, O(V + E) espaço
+#   adj_list[v]        → O(1) para montar a visão, O(grau(v)) para percorrer
+#   csr_from_edges     → O(V + E log E) com NumPy (argsort/unique em C);
+#                        O(V + E) no counting sort em Python
+#   CSRBuilder         → O(E log L) por passada (argsort de cada lote de L arcos),
+#                        memória O(V + E) dos vetores finais + O(L)
+#   has_edge           → O(grau(v1))
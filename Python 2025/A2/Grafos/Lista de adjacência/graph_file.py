@@ -0,0 +1,117 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from graph_csr import GraphCSR
+
+# Formato binário de grafo (.graf)
+# ================================================================
+#
+# Todos os campos são little-endian. O arquivo é a cópia literal dos
+# vetores CSR (ver graph_csr.py), então pode ser mapeado em memória
+# e usado sem nenhuma conversão.
+#
+#   deslocamento  tamanho        campo
+#   ------------  -------------  ---------------------------------------
+#   0             4              magic = b"GRAF"
+#   4             4  (uint32)    versão do formato = 1
+#   8             4  (uint32)    flags (bit 0 = grafo direcionado)
+#   12            4  (uint32)    reservado (0)
+#   16            8  (uint64)    V = número de vértices
+#   24            8  (uint64)    E = número de arestas (arcos)
+#   32            8 * (V + 1)    offsets  (int64)
+#   ...           4 * E          targets  (int32)
+#   ...           0 ou 4         preenchimento até múltiplo de 8
+#   ...           8 * E          weights  (float64)
+#
+# O cabeçalho tem 32 bytes e cada seção começa em posição múltipla
+# de 8, então os vetores ficam alinhados dentro do mmap.
+#
+# load_graph entrega os vetores como memoryviews do mmap, que se
+# comportam como os array('q'/'i'/'d') de um GraphCSR comum (fatias sem
+# cópia, indexação), então todo o código existente roda sem mudanças.
+# Para trabalho vetorizado, conversoes.csr_numpy embrulha essas mesmas
+# memoryviews com np.frombuffer, também sem cópia.
+
+MAGIC = b"GRAF"
+VERSAO = 1
+FLAG_DIRECIONADO = 1
+
+_HEADER = struct.Struct("<4sIIIQQ")
+
+
+def _layout(num_vertices, num_edges):
+    # Retorna o início de cada seção (offsets, targets, weights) e o tamanho total
+    inicio_offsets = _HEADER.size
+    inicio_targets = inicio_offsets + 8 * (num_vertices + 1)
+    fim_targets = inicio_targets + 4 * num_edges
+    inicio_weights = (fim_targets + 7) // 8 * 8
+    fim = inicio_weights + 8 * num_edges
+    return inicio_offsets, inicio_targets, inicio_weights, fim
+
+
+def save_graph(graph, path):
+    """
+    Grava um GraphList ou GraphCSR no formato binário descrito acima.
+    """
+    if not isinstance(graph, GraphCSR):
+        graph = graph.freeze()
+
+    num_vertices = graph.num_vertices
+    num_edges = graph.num_edges
+    _, _, inicio_weights, _ = _layout(num_vertices, num_edges)
+
+    offsets = array('q', graph.offsets)
+    targets = array('i', graph.targets)
+    weights = array('d', graph.weights)
+    if sys.byteorder == "big":
+        for vetor in (offsets, targets, weights):
+            vetor.byteswap()
+
+    flags = FLAG_DIRECIONADO if graph.direcionado else 0
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSAO, flags, 0, num_vertices, num_edges))
+        offsets.tofile(f)
+        targets.tofile(f)
+        f.write(b"\0" * (inicio_weights - f.tell()))
+        weights.tofile(f)
+
+
+def load_graph(path):
+    """
+    Abre um arquivo .graf com mmap e devolve um GraphCSR somente leitura
+    cujos vetores são memoryviews sobre o próprio mapeamento: nada é
+    lido, convertido ou copiado na carga. Vários processos que abrirem
+    o mesmo arquivo compartilham as mesmas páginas do cache do sistema.
+
+    O resultado funciona direto com bfs, dijkstra, prim etc.
+    """
+    with open(path, "rb") as f:
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, versao, flags, _, num_vertices, num_edges = _HEADER.unpack_from(mapa, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} não é um arquivo de grafo (.graf)")
+    if versao != VERSAO:
+        raise ValueError(f"Versão {versao} do formato não suportada")
+    if sys.byteorder == "big":
+        raise ValueError("load_graph só mapeia arquivos em máquinas little-endian")
+
+    inicio_offsets, inicio_targets, inicio_weights, fim = _layout(num_vertices, num_edges)
+    if len(mapa) < fim:
+        raise ValueError(f"{path} está truncado")
+
+    # memoryview sobre o mmap mantém o mapeamento vivo enquanto o grafo existir
+    buffer = memoryview(mapa)
+    offsets = buffer[inicio_offsets:inicio_targets].cast('q')
+    targets = buffer[inicio_targets:inicio_targets + 4 * num_edges].cast('i')
+    weights = buffer[inicio_weights:fim].cast('d')
+
+    direcionado = bool(flags & FLAG_DIRECIONADO)
+    return GraphCSR(num_vertices, offsets, targets, weights, direcionado)
+
+# Complexidade:
+#   save_graph → O(V + E) tempo
+#   load_graph → O(1): só o cabeçalho é lido; as páginas dos vetores
+#                são trazidas do disco sob demanda pelo sistema operacional
@@ -1,3 +1,6 @@
+from graph_csr import GraphCSR, csr_from_adj_list, csr_from_edges
+
+
 class GraphList:
     def __init__(self, num_vertices, direcionado: bool = True):
         self.num_vertices = num_vertices
@@ -8,37 +11,126 @@ class GraphList:
         # Cada posição conterá uma lista de tuplas (vizinho, peso)
         self.adj_list = [[] for _ in range(num_vertices)]
 
+        # Índice hash por vértice: _index[v1][v2] = posição de v2 em adj_list[v1]
+        # Permite has_edge, add_edge e remove_edge em O(1) esperado
+        self._index = [{} for _ in range(num_vertices)]
+
+        # Versão do grafo: aumenta a cada alteração feita pelos métodos
+        # (add_edge, remove_edge, add_edges_from). Caches como o
+        # DistanceOracle comparam a versão para saber se ainda valem.
+        self.version = 0
+
+    @classmethod
+    def from_edges(cls, num_vertices, us, vs, weights=None, direcionado: bool = True, dedupe: bool = True):
+        """
+        Constrói o grafo de uma vez a partir de sequências paralelas de
+        origens, destinos e pesos, agrupando as arestas por origem com
+        csr_from_edges (argsort do NumPy, ou counting sort sem ele).
+
+        Com dedupe=False as arestas repetidas não são removidas; use apenas
+        quando a entrada já não tiver duplicatas.
+        """
+        offsets, targets, pesos = csr_from_edges(
+            num_vertices, us, vs, weights, direcionado, dedupe)
+        return cls.from_csr(GraphCSR(num_vertices, offsets, targets, pesos, direcionado))
+
+    @classmethod
+    def from_csr(cls, csr):
+        """
+        Constrói um GraphList (mutável) a partir de um GraphCSR.
+        Cada lista de vizinhos e cada índice são montados por fatias
+        inteiras dos vetores, sem um passo Python por aresta.
+        """
+        num_vertices = csr.num_vertices
+        offsets, targets, pesos = csr.offsets, csr.targets, csr.weights
+
+        graph = cls(num_vertices, csr.direcionado)
+        for v in range(num_vertices):
+            inicio, fim = offsets[v], offsets[v + 1]
+            vizinhos = targets[inicio:fim]
+            graph.adj_list[v] = list(zip(vizinhos, pesos[inicio:fim]))
+            graph._index[v] = dict(zip(vizinhos, range(fim - inicio)))
+        graph.num_edges = len(targets)
+        return graph
+
+    def add_edges_from(self, arestas):
+        """
+        Adiciona várias arestas de uma vez.
+        Cada item é (v1, v2) ou (v1, v2, peso); arestas já existentes são ignoradas.
+        """
+        adj_list = self.adj_list
+        index = self._index
+        direcionado = self.direcionado
+        adicionadas = 0
+
+        # Cada aresta vai direto para a lista da sua origem (um único passe)
+        for aresta in arestas:
+            v1, v2 = aresta[0], aresta[1]
+            peso = aresta[2] if len(aresta) > 2 else 1.0
+            if v2 in index[v1]:
+                continue
+            index[v1][v2] = len(adj_list[v1])
+            adj_list[v1].append((v2, peso))
+            adicionadas += 1
+
+            if not direcionado and v1 != v2 and v1 not in index[v2]:
+                index[v2][v1] = len(adj_list[v2])
+                adj_list[v2].append((v1, peso))
+                adicionadas += 1
+
+        self.num_edges += adicionadas
+        if adicionadas:
+            self.version += 1
+
     def has_edge(self, v1, v2):
-        for vizinho in self.adj_list[v1]:
-            if vizinho == v2:
-                return True
-        return False
+        return v2 in self._index[v1]
+
+    def degree(self, v):
+        return len(self.adj_list[v])
 
     def add_edge(self, v1, v2, peso = 1.0):
         if not self.has_edge(v1, v2):
-            self.adj_list[v1].append((v2, peso))
-            self.num_edges += 1
+            self._append(v1, v2, peso)
 
             # se o grafo não é direcionado, adiciona a aresta contrária também
-            if not self.direcionado:
-                self.adj_list[v2].append((v1, peso))
-                self.num_edges += 1
+            # (um laço v1 == v2 aparece uma única vez na lista)
+            if not self.direcionado and v1 != v2:
+                self._append(v2, v1, peso)
 
     def remove_edge(self, v1, v2):
-        # procura e remove a aresta (v1, v2)
-        for vizinho, peso in list(self.adj_list[v1]):
-            if vizinho == v2:
-                self.adj_list[v1].remove((vizinho, peso))
-                self.num_edges -= 1
-                break
+        # remove a aresta (v1, v2), se existir
+        if self.has_edge(v1, v2):
+            self._remove(v1, v2)
 
         # se o grafo não for direcionado, remove também o inverso
-        if not self.direcionado:
-            for vizinho, peso in list(self.adj_list[v2]):
-                if vizinho == v1:
-                    self.adj_list[v2].remove((vizinho, peso))
-                    self.num_edges -= 1
-                    break
+        if not self.direcionado and self.has_edge(v2, v1):
+            self._remove(v2, v1)
+
+    def _append(self, v1, v2, peso):
+        self._index[v1][v2] = len(self.adj_list[v1])
+        self.adj_list[v1].append((v2, peso))
+        self.num_edges += 1
+        self.version += 1
+
+    def _remove(self, v1, v2):
+        # Troca a aresta removida com a última da lista e faz pop(),
+        # assim não é preciso deslocar os elementos seguintes (O(1))
+        vizinhos = self.adj_list[v1]
+        indice = self._index[v1]
+
+        pos = indice.pop(v2)
+        ultima = vizinhos.pop()
+        if pos < len(vizinhos):
+            vizinhos[pos] = ultima
+            indice[ultima[0]] = pos
+        self.num_edges -= 1
+        self.version += 1
+
+    def freeze(self):
+        # Gera uma cópia imutável em formato CSR (vetores contíguos).
+        # Alterações posteriores no GraphList não afetam a cópia.
+        offsets, targets, weights = csr_from_adj_list(self.adj_list)
+        return GraphCSR(self.num_vertices, offsets, targets, weights, self.direcionado)
 
     def print_edges(self):
         print("Arestas do grafo:")
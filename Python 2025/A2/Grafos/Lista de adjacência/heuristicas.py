@@ -0,0 +1,157 @@
+import math
+import random
+from array import array
+
+from graph_csr import reverse_adjacency
+from dijkstra import dijkstra
+
+# Heurísticas admissíveis para o A* (dijkstra.astar)
+# ================================================================
+#
+# Uma heurística h(v) precisa ser um LIMITE INFERIOR da distância de v
+# até o destino t (admissível) e satisfazer h(u) <= peso(u, v) + h(v)
+# (consistente). Assim o A* continua exato e cada vértice é finalizado
+# uma única vez.
+#
+# As tabelas do ALT em float32 garantem só a primeira condição: a folga
+# absoluta abaixo mantém h admissível, mas h(u) - h(v) é a diferença de
+# duas entradas arredondadas e pode passar de peso(u, v). Por isso o
+# astar reabre um vértice finalizado quando acha caminho melhor até ele
+# (checa_astar.py verifica os dois casos).
+#
+# ALT (A*, Landmarks, Triangle inequality):
+#   escolhem-se k vértices "marco" L e guardam-se as distâncias
+#   d(L, v) e d(v, L) para todo v. Pela desigualdade triangular:
+#       d(v, t) >= d(L, t) - d(L, v)
+#       d(v, t) >= d(v, L) - d(t, L)
+#   h(v) = o maior desses limites entre os k marcos.
+#
+# Euclidiana:
+#   em grafos geométricos cujo peso é o comprimento do segmento (como a
+#   rede de sensores de a2-2024.py), a linha reta até t nunca é mais
+#   longa que o caminho.
+
+# As tabelas do ALT ficam em float32 (24 bits de mantissa). Guardar x
+# erra no máximo |x| · 2^-24, então a diferença de duas entradas de uma
+# mesma tabela erra no máximo maior · 2^-23, onde maior = maior distância
+# finita da tabela. Esse erro é ABSOLUTO (cresce com a distância ao
+# marco, não com o limite) e é descontado de cada limite; a folga
+# relativa só cobre o arredondamento das contas em float64.
+ERRO_FLOAT32 = 2.0 ** -23
+MAIOR_FLOAT32 = 3.4028234663852886e38
+FOLGA = 1 - 1e-6
+
+
+class Landmarks:
+    """
+    Pré-processamento do ALT.
+
+    de[i*V + v]   = d(L_i, v)   (Dijkstra a partir de L_i)
+    para[i*V + v] = d(v, L_i)   (Dijkstra a partir de L_i no grafo reverso)
+
+    Cada vetor é uma matriz k × V de float32 (array('f')) em ordem de
+    linhas: 8·k·V bytes no total. erro_de[i] e erro_para[i] são as folgas
+    absolutas do arredondamento de cada linha.
+    """
+
+    def __init__(self, graph, k: int = 8, landmarks=None, seed: int = 0):
+        """
+        Parâmetros:
+            k: número de marcos (ignorado se `landmarks` for dado)
+            landmarks: lista de vértices marco; se None, são escolhidos
+                       pela seleção do mais distante
+        """
+        n = graph.num_vertices
+        self.num_vertices = n
+        reverse = reverse_adjacency(graph)
+
+        self.landmarks = []
+        self.de = array('f')
+        self.para = array('f')
+        self.erro_de = []
+        self.erro_para = []
+
+        if landmarks is not None:
+            for marco in landmarks:
+                self._adiciona(graph, reverse, marco)
+            return
+
+        # Seleção do mais distante: cada novo marco é o vértice alcançável
+        # mais longe dos marcos já escolhidos. Reaproveita as mesmas
+        # execuções do Dijkstra que preenchem as tabelas.
+        menor = [float('inf')] * n
+        marco = random.Random(seed).randrange(n) if n else None
+        for _ in range(min(k, n)):
+            distancias = self._adiciona(graph, reverse, marco)
+            for v in range(n):
+                if distancias[v] < menor[v]:
+                    menor[v] = distancias[v]
+            candidatos = [v for v in range(n) if menor[v] != float('inf')
+                          and v not in self.landmarks]
+            if not candidatos:
+                break
+            marco = max(candidatos, key=menor.__getitem__)
+
+    def _adiciona(self, graph, reverse, marco):
+        # Um Dijkstra em cada sentido por marco
+        _, distancias = dijkstra(graph, marco)
+        _, distancias_reversas = dijkstra(reverse, marco)
+        self.landmarks.append(marco)
+        self.de.extend(distancias)
+        self.para.extend(distancias_reversas)
+        self.erro_de.append(_erro_arredondamento(distancias))
+        self.erro_para.append(_erro_arredondamento(distancias_reversas))
+        return distancias
+
+    def heuristica(self, target: int):
+        """Função h(v) = limite inferior de d(v, target) pelos marcos."""
+        n = self.num_vertices
+        de, para = self.de, self.para
+
+        # Linhas da tabela relativas a t, fixas durante a busca. As folgas
+        # de arredondamento já entram descontadas de d(L, t) e de d(t, L).
+        termos = [(i * n, de[i * n + target] - self.erro_de[i],
+                   para[i * n + target] + self.erro_para[i])
+                  for i in range(len(self.landmarks))]
+
+        def h(v):
+            melhor = 0.0
+            for base, l_t, t_l in termos:
+                # d(L, t) - d(L, v): inf - inf dá nan, e nan nunca é > melhor
+                limite = l_t - de[base + v]
+                if limite > melhor:
+                    melhor = limite
+                limite = para[base + v] - t_l
+                if limite > melhor:
+                    melhor = limite
+            return melhor * FOLGA
+
+        return h
+
+
+def _erro_arredondamento(distancias):
+    # Folga absoluta de uma linha da tabela: maior distância finita · 2^-23
+    maior = max((d for d in distancias if d != float('inf')), default=0.0)
+    if maior > MAIOR_FLOAT32:
+        raise OverflowError("distâncias grandes demais para as tabelas float32 do ALT")
+    return maior * ERRO_FLOAT32
+
+
+def euclidean_heuristic(coords, target: int, escala: float = 1.0):
+    """
+    h(v) = escala · distância em linha reta entre coords[v] e coords[target].
+
+    coords[v] = (x, y, ...) — só as duas primeiras posições são usadas,
+    então serve direto para os sensores (x, y, r) de a2-2024.py.
+    escala: use < 1 se o peso da aresta puder ser menor que o comprimento.
+    """
+    xt, yt = coords[target][0], coords[target][1]
+
+    def h(v):
+        return escala * math.hypot(coords[v][0] - xt, coords[v][1] - yt) * FOLGA
+
+    return h
+
+# Complexidade:
+#   Landmarks (pré-processamento) → 2·k execuções do dijkstra + O(k·V) memória (float32)
+#   h(v) → O(k) para ALT, O(1) para a euclidiana
@@ -0,0 +1,126 @@
+from array import array
+
+# Heap d-ário indexado (min-heap) com decrease_key
+# ================================================================
+#
+# Guarda no máximo uma entrada por vértice (0..capacity-1):
+#
+#   heap[i] → vértice na posição i da árvore d-ária
+#   pos[v]  → posição de v em heap (-1 se v não está no heap)
+#   key[v]  → prioridade atual de v
+#
+# Os filhos da posição i ficam em d·i + 1 .. d·i + d e o pai em (i-1)//d.
+# Com pos[] dá para achar um vértice em O(1) e baixar sua prioridade no
+# lugar (decrease_key), em vez de empilhar uma cópia e descartar a antiga
+# depois (remoção preguiçosa do heapq). O heap nunca passa de V entradas
+# e nenhum pop é desperdiçado com entradas obsoletas.
+#
+# d > 2 deixa a árvore mais rasa: decrease_key (sift-up, O(log_d V)) fica
+# mais barato e pop (sift-down, O(d·log_d V)) um pouco mais caro, o que
+# compensa em grafos densos, onde há muito mais decrease_key que pops.
+
+ARIDADE = 4
+
+
+class IndexedHeap:
+    def __init__(self, capacity: int, d: int = ARIDADE):
+        self.d = d
+        self.heap = []
+        self.pos = array('i', [-1]) * capacity
+        self.key = [0.0] * capacity
+
+        # Contadores (lidos pela instrumentação)
+        self.pushes = 0
+        self.pops = 0
+        self.decreases = 0
+        self.peak = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, v: int) -> bool:
+        return self.pos[v] != -1
+
+    def push(self, v: int, key):
+        self.key[v] = key
+        self.heap.append(v)
+        self.pos[v] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+        self.pushes += 1
+        if len(self.heap) > self.peak:
+            self.peak = len(self.heap)
+
+    def decrease_key(self, v: int, key):
+        # Só diminui: a nova prioridade precisa ser <= key[v]
+        self.key[v] = key
+        self._sift_up(self.pos[v])
+        self.decreases += 1
+
+    def push_or_decrease(self, v: int, key):
+        """Insere v, ou baixa sua prioridade se já estiver no heap com uma maior."""
+        if self.pos[v] == -1:
+            self.push(v, key)
+        elif key < self.key[v]:
+            self.decrease_key(v, key)
+
+    def pop(self):
+        """Remove e retorna (prioridade, vértice) de menor prioridade."""
+        heap = self.heap
+        topo = heap[0]
+        ultimo = heap.pop()
+        self.pos[topo] = -1
+        if heap:
+            heap[0] = ultimo
+            self.pos[ultimo] = 0
+            self._sift_down(0)
+        self.pops += 1
+        return self.key[topo], topo
+
+    def _sift_up(self, i: int):
+        heap, pos, key, d = self.heap, self.pos, self.key, self.d
+        v = heap[i]
+        k = key[v]
+        while i > 0:
+            p = (i - 1) // d
+            u = heap[p]
+            if key[u] <= k:
+                break
+            # Desce o pai e continua subindo
+            heap[i] = u
+            pos[u] = i
+            i = p
+        heap[i] = v
+        pos[v] = i
+
+    def _sift_down(self, i: int):
+        heap, pos, key, d = self.heap, self.pos, self.key, self.d
+        n = len(heap)
+        v = heap[i]
+        k = key[v]
+        while True:
+            primeiro = d * i + 1
+            if primeiro >= n:
+                break
+
+            # Menor entre os até d filhos
+            menor = primeiro
+            k_menor = key[heap[primeiro]]
+            for c in range(primeiro + 1, min(primeiro + d, n)):
+                k_c = key[heap[c]]
+                if k_c < k_menor:
+                    menor, k_menor = c, k_c
+
+            if k_menor >= k:
+                break
+            # Sobe o filho e continua descendo
+            u = heap[menor]
+            heap[i] = u
+            pos[u] = i
+            i = menor
+        heap[i] = v
+        pos[v] = i
+
+# Complexidade (n = entradas no heap ≤ capacity):
+#   push, decrease_key → O(log_d n)
+#   pop                → O(d · log_d n)
+#   Espaço: O(capacity) para pos/key + O(n) para heap
@@ -0,0 +1,143 @@
+import heapq
+import time
+from contextlib import contextmanager
+
+# Instrumentação opcional dos algoritmos de grafos
+# ================================================================
+#
+# Os algoritmos (dijkstra, bellman_ford, prim, ...) aceitam um parâmetro
+# `stats`. Com stats=None (padrão) e fora de um bloco `instrumentar()`,
+# nada é registrado e o laço principal fica praticamente igual ao
+# original:
+#   - as operações de heap são contadas trocando heappush/heappop por
+#     versões que contam (heap_ops); desligado, são as próprias de heapq
+#   - os demais contadores são inteiros locais, incrementados só em
+#     ramos raros (entrada obsoleta, relaxação bem-sucedida)
+#   - o objeto de estatísticas só é tocado uma vez, no fim da chamada
+#
+# Duas formas de uso:
+#
+#   stats = AlgoStats()
+#   dijkstra(graph, 0, stats=stats)
+#   print(stats.report())
+#
+#   with instrumentar() as stats:       # vale para todas as chamadas do bloco
+#       dijkstra(graph, 0)
+#       prim(graph)
+#   print(stats.report())
+#
+# Contadores usados pelos algoritmos:
+#   heap_push, heap_pop → operações no heap
+#   stale_skip          → entradas obsoletas descartadas (remoção preguiçosa)
+#   relaxations         → relaxações que melhoraram uma distância/custo
+#   rounds              → rodadas (Bellman-Ford)
+# Tempos (segundos) ficam em `timers`, por fase; `peak_heap` é o maior
+# tamanho do heap observado.
+
+_ativo = None
+
+
+class AlgoStats:
+    """Contadores, tempos por fase e pico do heap de uma ou mais execuções."""
+
+    def __init__(self):
+        self.calls = 0
+        self.counters = {}
+        self.timers = {}
+        self.peak_heap = 0
+
+    def add(self, nome: str, valor: int = 1):
+        self.counters[nome] = self.counters.get(nome, 0) + valor
+
+    def add_time(self, fase: str, segundos: float):
+        self.timers[fase] = self.timers.get(fase, 0.0) + segundos
+
+    def heap_size(self, tamanho: int):
+        if tamanho > self.peak_heap:
+            self.peak_heap = tamanho
+
+    def record(self, algoritmo: str, counters: dict, timers: dict, peak_heap: int = 0):
+        """Acumula o resultado de uma chamada (usado pelos algoritmos no fim)."""
+        self.calls += 1
+        for nome, valor in counters.items():
+            self.add(nome, valor)
+        for fase, segundos in timers.items():
+            self.add_time(f"{algoritmo}.{fase}", segundos)
+        self.heap_size(peak_heap)
+
+    @contextmanager
+    def phase(self, fase: str):
+        # Mede o tempo de um trecho qualquer do código de quem chama
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(fase, time.perf_counter() - inicio)
+
+    def report(self) -> str:
+        linhas = [f"chamadas: {self.calls}"]
+        for nome, valor in sorted(self.counters.items()):
+            linhas.append(f"  {nome}: {valor}")
+        if self.peak_heap:
+            linhas.append(f"  peak_heap: {self.peak_heap}")
+        for fase, segundos in sorted(self.timers.items()):
+            linhas.append(f"  {fase}: {segundos * 1000:.3f} ms")
+        return "\n".join(linhas)
+
+    def __repr__(self):
+        return (f"AlgoStats(calls={self.calls}, counters={self.counters}, "
+                f"timers={self.timers}, peak_heap={self.peak_heap})")
+
+
+class HeapCounter:
+    """heappush/heappop que contam as operações e o maior tamanho do heap."""
+
+    def __init__(self):
+        self.pushes = 0
+        self.pops = 0
+        self.peak = 0
+
+    def push(self, heap, item):
+        heapq.heappush(heap, item)
+        self.pushes += 1
+        if len(heap) > self.peak:
+            self.peak = len(heap)
+
+    def pop(self, heap):
+        self.pops += 1
+        return heapq.heappop(heap)
+
+
+def heap_ops(stats):
+    """
+    Retorna (push, pop, contador): as funções de heapq puras se stats é
+    None (contador = None), ou as de um HeapCounter novo.
+    """
+    if stats is None:
+        return heapq.heappush, heapq.heappop, None
+    contador = HeapCounter()
+    return contador.push, contador.pop, contador
+
+
+def current_stats(stats=None):
+    """O `stats` explícito, ou o do bloco `instrumentar()` ativo, ou None."""
+    return stats if stats is not None else _ativo
+
+
+@contextmanager
+def instrumentar(stats=None):
+    """Ativa a coleta para todas as chamadas dentro do bloco `with`."""
+    global _ativo
+    if stats is None:
+        stats = AlgoStats()
+    anterior = _ativo
+    _ativo = stats
+    try:
+        yield stats
+    finally:
+        _ativo = anterior
+
+# Complexidade:
+#   Desligada: uma consulta a variável global por chamada do algoritmo
+#   Ligada: uma chamada de método a mais por operação de heap, e
+#           O(número de contadores) por chamada, no fim da execução
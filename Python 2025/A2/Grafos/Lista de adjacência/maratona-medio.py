@@ -1,4 +1,7 @@
 from graph_list import GraphList
+from dfs import dfs_visit, adj_neighbors, iter_dfs
+from bfs import iter_bfs
+from spfa import bellman_ford_spfa
 import heapq
 from collections import deque
 
@@ -77,35 +80,11 @@ Você precisa calcular o menor tempo de transmissão
 entre o computador 1 e todos os outros."""
 
 def tempo_transmissao(graph = GraphList):
-      N = graph.num_vertices
-      dist = [float('inf')]* N    # dist[v] é a menor distância conhecida de 0 a v, começa com todas as distancia infinitas
-      dist[0] = 0 
-      edges = []
-      for u in range(N): # percorre todos os vértices
-        for v,w in graph.adj_list[u]:
-              edges.append((u,v,w))
-
-    # Etapa principal do Bellman-Ford
-    # Relaxa todas as arestas N-1 vezes
-    # Isso garante a menor distância possível se não houver ciclo negativo
-      for _ in range(N - 1):  # repete N-1 rodadas de relaxamento
-        mudou = False       # flag que detecta se alguma aresta mudou
-
-        # percorre cada aresta (u, v, w)
-        for u, v, w in edges:
-            # se a distância para u não é infinita e passar por u melhora v...
-            if dist[u] != float('inf') and dist[u] + w < dist[v]:
-                # atualiza dist[v]
-                dist[v] = dist[u] + w
-                mudou = True  # marca que houve mudança
-
-        # se nenhuma distância mudou na rodada inteira, pode parar antes
-        if not mudou:
-            break
-
-      for u, v, w in edges:
-        # se ainda dá pra melhorar dist[v], há ciclo negativo
-        if dist[u] != float('inf') and dist[u] + w < dist[v]:
+    # Bellman-Ford com fila (spfa.py): só as arestas de saída dos vértices
+    # cuja distância mudou são reexaminadas, em vez de todas as arestas em
+    # cada uma das N-1 rodadas. O ciclo negativo é detectado durante a busca.
+      _, dist, sem_ciclo, _ = bellman_ford_spfa(graph, 0)
+      if not sem_ciclo:
             return "Ciclo negativo achado"
 
     # retorna o vetor de distâncias finais
@@ -220,6 +199,11 @@ def menor_rota(graph: GraphList):
         if d > dist[u]:
             continue
 
+        # Só interessa o cruzamento N: quando ele sai da heap, dist[N-1]
+        # já é definitiva e o resto do grafo não precisa ser explorado.
+        if u == N - 1:
+            break
+
         # Percorre todas as arestas que saem de u:
         # u -> v com peso w
         for v, w in graph.adj_list[u]:
@@ -234,7 +218,7 @@ def menor_rota(graph: GraphList):
                 # permitindo que Dijkstra a considere futuramente
                 heapq.heappush(heap, (dist[v], v))
 
-    # Após o Dijkstra terminar, verificamos se existe caminho
+    # Após o Dijkstra terminar (ou parar no destino), verificamos se existe caminho
     # até o último vértice (N-1).
     # Se a distância ainda for infinita, não há rota possível.
     # Se não existe caminho até o último vértice, retorne -1.
@@ -255,11 +239,13 @@ def pontes_no_grafo(graph: GraphList):
     # Número de vértices do grafo
     N = graph.num_vertices
 
-    # "tempo" é usado para registrar a ordem de descoberta na DFS
-    tempo = 0
-
     # tin[u] = tempo em que o vértice u foi descoberto
+    # (é a pré-ordem preenchida pelo motor da DFS)
     tin = [-1] * N
+    post = [-1] * N
+    parents = [-1] * N
+    tempo = [0]
+    tempo_post = [0]
 
     # low[u] = menor tempo de descoberta alcançável a partir de u
     # (incluindo subir por uma aresta de retorno/back-edge)
@@ -268,55 +254,50 @@ def pontes_no_grafo(graph: GraphList):
     # lista final de pontes
     pontes = []
 
-    # DFS que calcula tin[], low[] e identifica pontes.
-    # Argumentos:
-    #   u      = vértice atual
-    #   parent = pai de u na DFS (para não voltar por onde veio)
-    def dfs(u, parent):
-        nonlocal tempo  # permite modificar 'tempo' definido fora da função
-
-        # Marca tempo de descoberta
-        tempo += 1
-        tin[u] = low[u] = tempo
-
-        # Explora vizinhos de u
-        for v, _ in graph.adj_list[u]:
-            # Ignora a aresta de onde acabamos de vir (u -> parent)
-            if v == parent:
-                continue
-
-            # Caso o vértice v ainda não tenha sido visitado...
-            if tin[v] == -1:
-                # Explora recursivamente v
-                dfs(v, u)
-
-                # Após voltar do DFS de v, atualizamos low[u]
-                # pois v pode alcançar ancestrais de u
-                low[u] = min(low[u], low[v])
-
-        
-                # Checagem da condição de ponte:
-                # low[v] > tin[u]  significa que NÃO há caminho alternativo
-                # para voltar a u ou seus ancestrais a partir de v.
-                #
-                # Logo, a única ligação entre os dois lados do grafo é (u, v).
-        
-                if low[v] > tin[u]:
-                    # armazenamos a ponte em ordem crescente (u, v)
-                    pontes.append(tuple(sorted((u, v))))
-
-            else:
-                # Se v já foi visitado e não é o pai,
-                # então (u, v) é uma back-edge.
-                # Atualizamos low[u] com o tin[v],
-                # mostrando que u pode voltar a um ancestral via v.
-                low[u] = min(low[u], tin[v])
+    # A DFS usa o motor iterativo de dfs.py (pilha explícita, sem
+    # limite de recursão). Os callbacks fazem o trabalho de tin/low:
+
+    def on_discover(u):
+        # Ao descobrir u, o menor tempo alcançável é o próprio tin[u]
+        low[u] = tin[u]
+
+    def on_nontree_edge(u, v):
+        # Ignora a aresta de onde acabamos de vir (u -> parent)
+        if v == parents[u]:
+            return
+        # Se v já foi visitado e não é o pai,
+        # então (u, v) é uma back-edge.
+        # Atualizamos low[u] com o tin[v],
+        # mostrando que u pode voltar a um ancestral via v.
+        low[u] = min(low[u], tin[v])
+
+    def on_finish(v):
+        u = parents[v]
+        if u == v:      # raiz da DFS não tem aresta de árvore acima
+            return
+
+        # Após terminar a DFS de v, atualizamos low[u]
+        # pois v pode alcançar ancestrais de u
+        low[u] = min(low[u], low[v])
+
+        # Checagem da condição de ponte:
+        # low[v] > tin[u]  significa que NÃO há caminho alternativo
+        # para voltar a u ou seus ancestrais a partir de v.
+        #
+        # Logo, a única ligação entre os dois lados do grafo é (u, v).
+        if low[v] > tin[u]:
+            # armazenamos a ponte em ordem crescente (u, v)
+            pontes.append(tuple(sorted((u, v))))
 
     # A DFS pode iniciar de qualquer vértice, mas o grafo pode
     # ter múltiplas componentes, então rodamos para todos.
+    neighbors = adj_neighbors(graph)
     for i in range(N):
         if tin[i] == -1:   # ainda não visitado
-            dfs(i, -1)     # não tem pai, então parent = -1
+            parents[i] = i     # raiz: é pai de si mesma
+            dfs_visit(neighbors, i, tin, tempo, post, tempo_post, parents,
+                      on_discover=on_discover, on_nontree_edge=on_nontree_edge,
+                      on_finish=on_finish)
 
     # Ordena as pontes para ficarem em ordem previsível
     pontes.sort()
@@ -368,6 +349,10 @@ def dijkstra(n, adj):
             # se já encontramos um caminho melhor antes, ignorar
             if d > dist[u]:
                     continue
+
+            # o portal N saiu da fila: dist[n] e parent já são definitivos
+            if u == n:
+                    break
                     
             # percorre todos os vizinhos de u
             for v, tempo in adj[u]:
@@ -479,24 +464,22 @@ def pode_chegar_tesouro(mapa):
             if mapa[i][j] == 'S':
                 sx, sy = i, j
 
-    fila = deque([(sx, sy)])
-    visit = [[False]*M for _ in range(N)]
-    visit[sx][sy] = True
     dirs = [(1,0),(-1,0),(0,1),(0,-1)]
 
-    while fila:
-        x, y = fila.popleft()
+    # Célula (x, y) vira o vértice x*M + y; vizinhos = células livres adjacentes
+    def vizinhos(c):
+        x, y = divmod(c, M)
+        for dx, dy in dirs:
+            nx, ny = x+dx, y+dy
+            if 0 <= nx < N and 0 <= ny < M and mapa[nx][ny] != '#':
+                yield nx*M + ny
 
+    # A BFS preguiçosa para assim que o tesouro aparece
+    for c, _, _ in iter_bfs(vizinhos, sx*M + sy, num_vertices=N*M):
+        x, y = divmod(c, M)
         if mapa[x][y] == 'T':
             return "sim"
 
-        for dx, dy in dirs:
-            nx, ny = x+dx, y+dy
-            if 0 <= nx < N and 0 <= ny < M:
-                if not visit[nx][ny] and mapa[nx][ny] != '#':
-                    visit[nx][ny] = True
-                    fila.append((nx, ny))
-
     return "nao"
 
 
@@ -507,16 +490,14 @@ Determine quantas cidades podem ser alcançadas a partir da cidade 1."""
 
 def cidades_alcancaveis(graph: GraphList):
     N = graph.num_vertices
-    visit = [False] * N
+    alcancadas = 0
 
-    def dfs(u):
-        visit[u] = True
-        for v, _ in graph.adj_list[u]:
-            if not visit[v]:
-                dfs(v)
+    for _ in iter_dfs(graph, 0):  # cidade 1 → índice 0
+        alcancadas += 1
+        if alcancadas == N:
+            break   # todas alcançadas: não precisa examinar as arestas restantes
 
-    dfs(0)  # cidade 1 → índice 0
-    return sum(visit)
+    return alcancadas
 
 
 """10)Há N templos interligados por corredores subterrâneos
@@ -530,11 +511,13 @@ def pontes_criticas(graph: GraphList):
     # Número total de vértices (templos)
     N = graph.num_vertices
 
-    # 'tempo' é um contador global usado para marcar a ordem de descoberta (tin)
-    tempo = 0
-
     # tin[u] = tempo em que o vértice u foi descoberto pela DFS
+    # (pré-ordem do motor iterativo de dfs.py)
     tin = [-1] * N
+    post = [-1] * N
+    parents = [-1] * N
+    tempo = [0]
+    tempo_post = [0]
 
     # low[u] = menor tempo de descoberta alcançável a partir de u
     # seguindo qualquer quantidade de arestas da DFS (incluindo retorno)
@@ -543,48 +526,45 @@ def pontes_criticas(graph: GraphList):
     # Lista final onde serão guardadas as pontes (corredores críticos)
     pontes = []
 
-    # FUNÇÃO DFS (profundidade) PARA DETECTAR PONTES
-    def dfs(u, parent):
-        nonlocal tempo
-        
-        # Avança o tempo global e marca o tempo de descoberta de u
-        tempo += 1
-        tin[u] = low[u] = tempo  
-
-        # Percorre todos os vizinhos de u
-        for v, _ in graph.adj_list[u]:
-
-            # Ignora a aresta que volta para o "pai" (parent)
-            if v == parent:
-                continue
-
-            # Se v ainda não foi visitado, seguimos a DFS
-            if tin[v] == -1:
-                dfs(v, u)
-
-                # Após retornar da DFS de v, atualizamos low[u]
-                low[u] = min(low[u], low[v])
-
-                # -----------------------------------------------------
-                # CONDIÇÃO DE PONTE:
-                # se low[v] > tin[u], NÃO existe caminho alternativo
-                # para voltar a u ou a algum ancestral.
-                # Ou seja, essa aresta é crítica.
-                # -----------------------------------------------------
-                if low[v] > tin[u]:
-                    pontes.append(tuple(sorted((u, v))))
-
-            else:
-                # Encontramos uma aresta de retorno (back-edge)
-                # que liga u a um ancestral.
-                # Isso diminui o valor de low[u].
-                low[u] = min(low[u], tin[v])
+    # CALLBACKS DA DFS (pilha explícita) PARA DETECTAR PONTES
+    def on_discover(u):
+        low[u] = tin[u]
+
+    def on_nontree_edge(u, v):
+        # Ignora a aresta que volta para o "pai" (parent)
+        if v == parents[u]:
+            return
+        # Encontramos uma aresta de retorno (back-edge)
+        # que liga u a um ancestral.
+        # Isso diminui o valor de low[u].
+        low[u] = min(low[u], tin[v])
+
+    def on_finish(v):
+        u = parents[v]
+        if u == v:
+            return
+
+        # Após terminar a DFS de v, atualizamos low[u]
+        low[u] = min(low[u], low[v])
+
+        # -----------------------------------------------------
+        # CONDIÇÃO DE PONTE:
+        # se low[v] > tin[u], NÃO existe caminho alternativo
+        # para voltar a u ou a algum ancestral.
+        # Ou seja, essa aresta é crítica.
+        # -----------------------------------------------------
+        if low[v] > tin[u]:
+            pontes.append(tuple(sorted((u, v))))
 
     # Roda DFS a partir de todos os vértices não visitados
     # (importante em grafos desconexos)
+    neighbors = adj_neighbors(graph)
     for i in range(N):
         if tin[i] == -1:
-            dfs(i, -1)  # -1 indica que não há "pai" no início
+            parents[i] = i  # a raiz não tem "pai": aponta para si mesma
+            dfs_visit(neighbors, i, tin, tempo, post, tempo_post, parents,
+                      on_discover=on_discover, on_nontree_edge=on_nontree_edge,
+                      on_finish=on_finish)
 
     # Ordenamos para facilitar leitura
     pontes.sort()
@@ -1,8 +1,23 @@
-import heapq
 import math
+import time
 from graph_list import GraphList
+from indexed_heap import IndexedHeap, ARIDADE
+from instrumentacao import current_stats, heap_ops
+
+def prim(graph = GraphList, stats=None, indexed: bool = False, d: int = ARIDADE):
+    """
+    stats: AlgoStats opcional (ver instrumentacao.py); registra heap_push,
+           heap_pop, stale_skip, relaxations, peak_heap e o tempo das fases
+           "inicializacao" e "arvore".
+    indexed: True → usa o heap d-ário indexado com decrease_key
+             (indexed_heap.py) no lugar do heapq com remoção preguiçosa.
+    """
+    stats = current_stats(stats)
+    if indexed:
+        return _prim_indexed(graph, stats, d)
+    inicio = time.perf_counter()
+    heappush, heappop, contador = heap_ops(stats)
 
-def prim(graph = GraphList):
     num_vertices = graph.num_vertices
 
     # parent[v] = quem é o pai de v na MST
@@ -21,14 +36,19 @@ def prim(graph = GraphList):
 
     # Inicializa o heap com todos os vértices
     for v in range(num_vertices):
-        heapq.heappush(heap, (vertex_cost[v], v))
+        heappush(heap, (vertex_cost[v], v))
+
+    fim_inicializacao = time.perf_counter()
+
+    stale = 0
 
     # Enquanto houver vértices a processar
     while heap:
-        cost, v1 = heapq.heappop(heap)
+        cost, v1 = heappop(heap)
 
         # Evita processar entradas obsoletas do heap
         if in_tree[v1]:
+            stale += 1
             continue
 
         # Se o custo for infinito, não há mais conexões válidas
@@ -44,6 +64,59 @@ def prim(graph = GraphList):
             if not in_tree[v2] and peso < vertex_cost[v2]:
                 vertex_cost[v2] = peso
                 parent[v2] = v1
-                heapq.heappush(heap, (vertex_cost[v2], v2))
+                heappush(heap, (vertex_cost[v2], v2))
+
+    if stats is not None:
+        # Além dos V pushes iniciais, cada relaxação faz exatamente um push
+        stats.record("prim",
+                     {"heap_push": contador.pushes, "heap_pop": contador.pops,
+                      "stale_skip": stale, "relaxations": contador.pushes - num_vertices},
+                     {"inicializacao": fim_inicializacao - inicio,
+                      "arvore": time.perf_counter() - fim_inicializacao}, contador.peak)
+
+    return parent
+
+
+def _prim_indexed(graph: GraphList, stats, d: int):
+    # Em vez de empilhar os V vértices com custo infinito e depois uma
+    # cópia a cada melhora, cada vértice entra no heap só quando ganha
+    # o primeiro custo finito e depois só tem a prioridade reduzida.
+    # Mesma árvore (a menos de empates entre arestas de mesmo peso).
+    inicio = time.perf_counter()
+
+    num_vertices = graph.num_vertices
+    parent = [-1] * num_vertices
+    in_tree = [False] * num_vertices
+    vertex_cost = [math.inf] * num_vertices
+
+    heap = IndexedHeap(num_vertices, d)
+    if num_vertices:
+        vertex_cost[0] = 0
+        heap.push(0, 0)
+    fim_inicializacao = time.perf_counter()
+    relaxations = 0
+
+    while heap:
+        _, v1 = heap.pop()
+        in_tree[v1] = True
+
+        for (v2, peso) in graph.adj_list[v1]:
+            if not in_tree[v2] and peso < vertex_cost[v2]:
+                vertex_cost[v2] = peso
+                parent[v2] = v1
+                heap.push_or_decrease(v2, peso)
+                relaxations += 1
+
+    if stats is not None:
+        stats.record("prim",
+                     {"heap_push": heap.pushes, "heap_pop": heap.pops,
+                      "decrease_key": heap.decreases, "stale_skip": 0,
+                      "relaxations": relaxations},
+                     {"inicializacao": fim_inicializacao - inicio,
+                      "arvore": time.perf_counter() - fim_inicializacao}, heap.peak)
+
+    return parent
 
-    return parent
\ No newline at end of file
+# Complexidade:
+#   heapq (lazy):    O((V + E) log(V + E)) tempo, heap com até V + E entradas
+#   indexed (d-ário): O(V·d·log_d V + E·log_d V) tempo, heap com até V entradas
@@ -0,0 +1,123 @@
+import time
+from collections import deque
+
+from graph_list import GraphList
+from instrumentacao import current_stats
+
+# Bellman-Ford com fila (SPFA, "Shortest Path Faster Algorithm")
+# ================================================================
+#
+# bellman_ford (bellman-ford.py) repassa TODAS as arestas em cada uma das
+# V-1 rodadas. Mas uma aresta u → v só pode relaxar se dist[u] mudou
+# desde a última vez que ela foi examinada. O SPFA guarda numa fila
+# apenas os vértices cuja distância mudou e só percorre as arestas de
+# saída deles. Em grafos esparsos isso costuma convergir em poucas
+# "passadas", em vez de V-1.
+#
+# Detecção de ciclo negativo (walk-to-root amortizado):
+#   o grafo dos pais (parent[v] → v) é sempre uma árvore enquanto não há
+#   ciclo negativo alcançável; se surgir um ciclo nele, esse ciclo tem
+#   peso negativo. A cada V relaxações, procura-se um ciclo no grafo dos
+#   pais em O(V) — custo amortizado O(1) por relaxação. Achando, a busca
+#   para na hora e devolve os vértices do ciclo, sem imprimir nada.
+
+
+def _ciclo_de_pais(parent, v0):
+    """
+    Procura um ciclo no grafo dos pais. Retorna os vértices do ciclo na
+    ordem das arestas (ciclo[i] → ciclo[i+1] → ... → ciclo[0]), ou None.
+    """
+    num_vertices = len(parent)
+    # 0 = não visto, 1 = na caminhada atual, 2 = já resolvido (chega na raiz)
+    estado = bytearray(num_vertices)
+
+    for inicio in range(num_vertices):
+        if estado[inicio] or parent[inicio] == -1:
+            continue
+
+        # Sobe pelos pais até a raiz, um vértice resolvido ou um repetido
+        caminho = []
+        v = inicio
+        while estado[v] == 0:
+            estado[v] = 1
+            caminho.append(v)
+            if v == v0 and parent[v] == v0:
+                break       # raiz da árvore
+            v = parent[v]
+
+        if estado[v] == 1 and not (v == v0 and parent[v] == v0):
+            # v apareceu duas vezes na mesma caminhada: ciclo
+            ciclo = caminho[caminho.index(v):]
+            ciclo.reverse()     # a caminhada anda contra as arestas
+            return ciclo
+
+        for x in caminho:
+            estado[x] = 2
+    return None
+
+
+def bellman_ford_spfa(graph: GraphList, v0: int, stats=None):
+    """
+    Retorna:
+        (parent, distance, sem_ciclo, ciclo)
+            parent, distance, sem_ciclo → como bellman_ford
+            ciclo → lista de vértices de um ciclo negativo alcançável
+                    a partir de v0 (na ordem das arestas), ou None
+    """
+    stats = current_stats(stats)
+    inicio = time.perf_counter()
+
+    num_vertices = graph.num_vertices
+    parent = [-1] * num_vertices
+    distance = [float('inf')] * num_vertices
+    na_fila = bytearray(num_vertices)
+
+    parent[v0] = v0
+    distance[v0] = 0
+    fila = deque([v0])
+    na_fila[v0] = 1
+
+    relaxations = pops = 0
+    proxima_checagem = num_vertices
+    ciclo = None
+
+    while fila:
+        v1 = fila.popleft()
+        na_fila[v1] = 0
+        pops += 1
+        dist_v1 = distance[v1]
+
+        for v2, cost in graph.adj_list[v1]:
+            if dist_v1 + cost < distance[v2]:
+                if v2 == v1:
+                    ciclo = [v1]        # laço negativo
+                    break
+                distance[v2] = dist_v1 + cost
+                parent[v2] = v1
+                relaxations += 1
+                if not na_fila[v2]:
+                    na_fila[v2] = 1
+                    fila.append(v2)
+        if ciclo is not None:
+            break
+
+        # Checagem amortizada do grafo dos pais
+        if relaxations >= proxima_checagem:
+            proxima_checagem = relaxations + num_vertices
+            ciclo = _ciclo_de_pais(parent, v0)
+            if ciclo is not None:
+                break
+
+    if stats is not None:
+        stats.record("bellman_ford_spfa",
+                     {"queue_pop": pops, "relaxations": relaxations,
+                      "passes": -(-pops // max(num_vertices, 1))},
+                     {"busca": time.perf_counter() - inicio})
+
+    return parent, distance, ciclo is None, ciclo
+
+# Complexidade:
+#   Pior caso O(V · E), como o Bellman-Ford; na prática perto de O(E)
+#   em grafos esparsos sem ciclo negativo.
+#   Checagem de ciclo: O(V) a cada V relaxações → O(1) amortizado
+#   Espaço: O(V)
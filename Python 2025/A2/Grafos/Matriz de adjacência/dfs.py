@@ -1,46 +1,86 @@
 from graph_matrix import GraphMatrix
 
-def dfs_recursive(graph: GraphMatrix, v: int, pre_order: list[int], counter: list[int]) -> None:
+def dfs_visit(graph: GraphMatrix, v0: int, pre_order: list[int], counter: list[int],
+              on_discover=None, on_tree_edge=None, on_nontree_edge=None, on_finish=None) -> bool:
     """
-    Função recursiva da DFS.
-    Marca o vértice `v` como visitado e explora seus vizinhos recursivamente.
+    DFS a partir de `v0` com pilha explícita (sem recursão).
+    A pilha guarda pares (vértice, iterador dos vizinhos ainda não examinados);
+    o topo faz o papel da chamada recursiva ativa. Os ganchos seguem o mesmo
+    contrato do dfs_visit da lista de adjacência.
     
     Args:
         graph: objeto GraphMatrix representando o grafo
-        v: vértice atual sendo visitado
+        v0: vértice inicial da busca
         pre_order: lista que armazena o instante de descoberta de cada vértice
         counter: lista de tamanho 1 usada como contador (simula passagem por referência)
+        on_discover(v):          chamado quando v é descoberto (pre_order[v] já preenchido)
+        on_tree_edge(v, u):      aresta de árvore, antes de descobrir u
+        on_nontree_edge(v, u):   aresta para um vértice já descoberto
+        on_finish(v):            chamado após todos os vizinhos de v
+        Ganchos None não custam nada; se algum retornar True, a busca é interrompida.
+
+    Returns:
+        True se foi interrompida por um gancho, False caso contrário.
     """
 
-    # Marca o vértice atual com o contador atual (momento de descoberta)
-    pre_order[v] = counter[0]
+    # Marca o vértice inicial com o contador atual (momento de descoberta)
+    pre_order[v0] = counter[0]
+    counter[0] += 1
+    if on_discover is not None and on_discover(v0):
+        return True
+
+    stack = [(v0, graph.neighbors(v0))]
 
-    # Imprime o vértice visitado, a lista pre_order atual e o contador
-    print(f"Visitando vertice {v} -> pre_order = {pre_order}, contador = {counter[0]}")
+    while stack:
+        v, vizinhos = stack[-1]
 
-    # Incrementa o contador para o próximo vértice
-    counter[0] += 1
+        # Continua a varrer os vizinhos de v de onde parou (o bitset pula as colunas sem aresta)
+        for u in vizinhos:
+            # Se u ainda não foi visitado
+            if pre_order[u] == -1:
+                if on_tree_edge is not None and on_tree_edge(v, u):
+                    return True
+                pre_order[u] = counter[0]
+                counter[0] += 1
+                if on_discover is not None and on_discover(u):
+                    return True
+                # Empilha u: a busca continua a partir dele
+                stack.append((u, graph.neighbors(u)))
+                break
+            if on_nontree_edge is not None and on_nontree_edge(v, u):
+                return True
+        else:
+            # Todos os vizinhos de v foram explorados: desempilha
+            stack.pop()
+            if on_finish is not None and on_finish(v):
+                return True
+
+    return False
 
-    # Percorre todos os vértices do grafo para verificar vizinhos
-    for u in range(graph.num_vertices):
-        # Se existe uma aresta de v para u e u ainda não foi visitado
-        if graph.has_edge(v, u) and pre_order[u] == -1:
-            # Imprime a ação de ir de v para u
-            print(f" Indo de {v} -> {u}")
-            # Chamada recursiva para visitar u
-            dfs_recursive(graph, u, pre_order, counter)
 
-    # Imprime quando a função retorna de um vértice (fim da exploração de todos os vizinhos)
-    print(f"Retornando de {v}")
+# Ganchos que imprimem o passo a passo da DFS (usados com verbose=True)
 
+def _print_hooks(pre_order):
+    def discover(v):
+        print(f"Visitando vertice {v} -> pre_order = {pre_order}, contador = {pre_order[v]}")
 
-def dfs(graph: GraphMatrix, start_vertex: int = 0) -> list[int]:
+    def tree_edge(v, u):
+        print(f" Indo de {v} -> {u}")
+
+    def finish(v):
+        print(f"Retornando de {v}")
+
+    return discover, tree_edge, None, finish
+
+
+def dfs(graph: GraphMatrix, start_vertex: int = 0, verbose: bool = False) -> list[int]:
     """
     Realiza a busca em profundidade (DFS) em um grafo usando matriz de adjacência.
 
     Args:
         graph: objeto GraphMatrix
         start_vertex: vértice inicial da busca (padrão 0)
+        verbose: se True, imprime cada passo da busca (útil para estudo)
 
     Returns:
         pre_order: lista onde cada posição indica o instante de descoberta do vértice correspondente
@@ -53,22 +93,26 @@ def dfs(graph: GraphMatrix, start_vertex: int = 0) -> list[int]:
     # Inicializa o contador como lista de tamanho 1 (para simular passagem por referência)
     counter = [0]
 
-    # Imprime início da DFS a partir do vértice especificado
-    print(f"\n--- Iniciando DFS a partir do vertice {start_vertex} ---")
+    # Sem verbose nenhum gancho é passado e a busca não faz I/O
+    hooks = _print_hooks(pre_order) if verbose else (None, None, None, None)
+
+    if verbose:
+        print(f"\n--- Iniciando DFS a partir do vertice {start_vertex} ---")
 
-    # Chama a função recursiva a partir do vértice inicial
-    dfs_recursive(graph, start_vertex, pre_order, counter)
+    # Explora a partir do vértice inicial
+    dfs_visit(graph, start_vertex, pre_order, counter, *hooks)
 
     # Para cobrir componentes desconexas, verifica todos os vértices
     for v in range(num_vertices):
         # Se o vértice ainda não foi visitado, inicia uma nova DFS
         if pre_order[v] == -1:
-            print(f"\n--- Iniciando nova DFS em componente desconexa a partir do vertice {v} ---")
-            dfs_recursive(graph, v, pre_order, counter)
+            if verbose:
+                print(f"\n--- Iniciando nova DFS em componente desconexa a partir do vertice {v} ---")
+            dfs_visit(graph, v, pre_order, counter, *hooks)
 
-    
-    print("\nDFS finalizada. Ordem final de visita:")
-    print(pre_order)
+    if verbose:
+        print("\nDFS finalizada. Ordem final de visita:")
+        print(pre_order)
     return pre_order    # A complexidade será Θ(𝑉²) .
 
 # --------------------------------------------------------------
@@ -78,12 +122,12 @@ def dfs(graph: GraphMatrix, start_vertex: int = 0) -> list[int]:
 #    - pre_order = [-1] * V        -> O(V) tempo e espaço
 #    - counter = [0]                -> O(1) tempo e espaço
 #
-# 2. Função dfs_recursive:
-#    - Cada chamada marca o vértice atual como visitado -> O(1)
-#    - Loop 'for u in range(V)' percorre todos os vértices para checar vizinhos
-#      -> Cada iteração do loop é O(1) para has_edge, mas percorre V vértices -> O(V)
+# 2. Função dfs_visit:
+#    - Cada vértice empilhado é marcado como visitado -> O(1)
+#    - graph.neighbors(v) varre a linha de v no bitset para achar os vizinhos
+#      -> O(V) por vértice (em C), mais O(1) por vizinho
 #    - Cada vértice é visitado apenas uma vez
-#    - Portanto, total dfs_recursive para todos os vértices: O(V^2)
+#    - Portanto, total dfs_visit para todos os vértices: O(V^2)
 #
 # 3. Função dfs (loop principal):
 #    - Garante que todas as componentes desconexas sejam visitadas
@@ -92,13 +136,13 @@ def dfs(graph: GraphMatrix, start_vertex: int = 0) -> list[int]:
 #
 # 4. Espaço usado:
 #    - pre_order -> O(V)
-#    - pilha de recursão -> profundidade máxima V -> O(V)
+#    - pilha explícita -> profundidade máxima V -> O(V)
 #    - matriz de adjacência -> V x V -> O(V^2)
 #    - Espaço total dominante: O(V^2)
 #
 # 5. Resumo final:
 #    - Tempo: O(V^2) (matriz de adjacência percorre todos os vértices para cada vértice)
-#    - Espaço: O(V^2) dominante pela matriz + O(V) para listas/pilha de recursão
+#    - Espaço: O(V^2) dominante pela matriz + O(V) para listas/pilha explícita
 # --------------------------------------------------------------
 
 # --------------------------------------------------------------
@@ -111,6 +155,6 @@ def dfs(graph: GraphMatrix, start_vertex: int = 0) -> list[int]:
 #
 # Espaço:
 #   - Matriz de adjacência: O(V^2)
-#   - Lista pre_order + pilha de recursão: O(V)
+#   - Lista pre_order + pilha explícita: O(V)
 #   → Total dominante: O(V^2)
 # --------------------------------------------------------------
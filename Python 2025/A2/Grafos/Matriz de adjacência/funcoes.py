@@ -6,12 +6,13 @@ def is_subgraph(G: GraphMatrix, H: GraphMatrix) -> bool:
     if G.num_vertices != H.num_vertices:
         return False
     
+    # Linha a linha: alguma aresta de H que não está em G? (H & ~G)
+    # Cada operação compara 64 colunas por palavra de máquina
     for i in range(H.num_vertices):
-        for j in range(H.num_vertices):
-            if H.has_edge(i,j) and not G.has_edge(i,j):
-                return False
+        if H.rows[i] & ~G.rows[i]:
+            return False
 
-    return True    #complexidade O(V²)
+    return True    #complexidade O(V²/64)
 
 
 # 2) Dado 𝐺 = (𝑉,𝐸) e um caminho 𝑃 composto por uma sequência de vertices.
@@ -64,13 +65,10 @@ def is_topological(graph: GraphMatrix) -> bool:
     num_vertices = graph.num_vertices
     # Percorre todos os vértices
     for i in range(num_vertices):
-        # Percorre todos os possíveis vizinhos j
-        for j in range(num_vertices):
-            # Se existe aresta i -> j
-            if graph.has_edge(i, j):
-                # Verifica se i >= j → então não é topológica
-                if i >= j:
-                    return False
+        # Máscara com os bits 0..i: qualquer aresta i -> j com j <= i
+        # viola a condição, então basta testar a linha contra a máscara
+        if graph.rows[i] & ((1 << (i + 1)) - 1):
+            return False
     # Se nenhuma aresta violou a condição, é topológica
     return True
 
@@ -91,14 +89,11 @@ def has_topological_order(graph: "GraphMatrix"):
     """
 
     num_vertices = graph.num_vertices  # Número total de vértices no grafo
-    in_degree = [0] * num_vertices     # Lista para armazenar o grau de entrada de cada vértice
 
-    # Calcula o grau de entrada (in-degree) de cada vértice
-    # Para cada aresta u -> v, incrementa in_degree[v]
-    for u in range(num_vertices):
-        for v in range(num_vertices):
-            if graph.has_edge(u, v):
-                in_degree[v] += 1
+    # Calcula o grau de entrada (in-degree) de cada vértice:
+    # a coluna v da matriz é a linha v da transposta, então o grau
+    # de entrada é a contagem de bits 1 (popcount) dessa linha
+    in_degree = [row.bit_count() for row in graph.transpose().rows]
 
     # Inicializa a fila de vértices com grau de entrada zero
     # Esses vértices podem começar a ordenação topológica
@@ -114,12 +109,11 @@ def has_topological_order(graph: "GraphMatrix"):
 
         # Para cada vértice adjacente a v
         # Reduz o grau de entrada, pois removemos v da "fila"
-        for u in range(num_vertices):
-            if graph.has_edge(v, u):
-                in_degree[u] -= 1
-                # Se o grau de entrada de u chegou a zero, adiciona à fila
-                if in_degree[u] == 0:
-                    queue.append(u)
+        for u in graph.neighbors(v):
+            in_degree[u] -= 1
+            # Se o grau de entrada de u chegou a zero, adiciona à fila
+            if in_degree[u] == 0:
+                queue.append(u)
 
     # Se todos os vértices foram processados, o grafo é acíclico e possui ordenação topológica
     has_order = len(processed) == num_vertices
@@ -0,0 +1,73 @@
+import numpy as np
+from weighted_graph_matrix import WeightedGraphMatrix
+
+# Versões vetorizadas das funções de funcoes.py para WeightedGraphMatrix.
+# Em vez de um laço duplo em Python, cada função opera sobre a matriz
+# inteira com NumPy.
+
+
+# 1) para G e H com o mesmo número de vértices, H é subgrafo de G?
+
+def is_subgraph(G: WeightedGraphMatrix, H: WeightedGraphMatrix) -> bool:
+    if G.num_vertices != H.num_vertices:
+        return False
+
+    # Alguma aresta em H que não está em G?
+    return not np.any(H.mask() & ~G.mask())    # O(V²) vetorizado
+
+
+# 3) A numeração dos vértices de G é topológica?
+
+def is_topological(graph: WeightedGraphMatrix) -> bool:
+    """
+    Toda aresta (i -> j) precisa ter i < j, ou seja, a matriz de
+    adjacência só pode ter entradas acima da diagonal principal.
+    """
+    adj = graph.mask()
+    return np.array_equal(adj, np.triu(adj, k=1))
+
+
+# Menor caminho entre todos os pares
+
+def floyd_warshall(graph: WeightedGraphMatrix):
+    """
+    Floyd–Warshall com uma atualização vetorizada da matriz por pivô k:
+        dist = min(dist, dist[:, k] + dist[k, :])
+
+    Retorna:
+        (dist, parent):
+            dist[i, j]   → menor distância de i até j (inf se não há caminho)
+            parent[i, j] → vértice anterior a j no caminho mínimo a partir de i
+                           (-1 se não há caminho)
+    Se dist[i, i] < 0 para algum i, o grafo tem ciclo negativo.
+    """
+    n = graph.num_vertices
+    if graph.weighted:
+        dist = graph.matrix.copy()
+    else:
+        dist = np.where(graph.matrix, 1.0, np.inf)
+    np.fill_diagonal(dist, np.minimum(np.diag(dist), 0.0))
+
+    # parent[i, j] = i onde existe aresta direta
+    parent = np.where(np.isfinite(dist), np.arange(n)[:, None], -1)
+
+    # Buffers reaproveitados em todos os pivôs: nenhum V x V novo por k
+    candidato = np.empty_like(dist)
+    melhora = np.empty(dist.shape, dtype=bool)
+    pais_k = np.empty(n, dtype=parent.dtype)
+
+    for k in range(n):
+        # Distância passando por k, para todos os pares de uma vez (broadcast)
+        np.add(dist[:, k, None], dist[k], out=candidato)
+        np.less(candidato, dist, out=melhora)
+        np.copyto(dist, candidato, where=melhora)
+        # Cópia da linha k antes de a própria linha k ser atualizada
+        np.copyto(pais_k, parent[k])
+        np.copyto(parent, pais_k, where=melhora)
+
+    return dist, parent
+
+# Complexidade:
+#   is_subgraph, is_topological → O(V²) operações em C
+#   floyd_warshall              → O(V³) operações, mas só V passos em Python;
+#                                 memória: dist, parent e dois buffers V x V (candidato, melhora)
@@ -3,23 +3,54 @@ class GraphMatrix:
         self.num_vertices = num_vertices
         self.num_edges = 0
 
-        #Criando a matriz nxn
-        self.edges = [[False for _ in range(num_vertices)] for _ in range(num_vertices)] 
+        # Matriz nxn guardada como bitset: cada linha é um inteiro Python
+        # em que o bit j de rows[i] vale 1 se existe a aresta (i, j).
+        # Ocupa ~V/8 bytes por linha, em vez de V referências para bool.
+        # Operações de linha inteira (|, &, ~, bit_count) rodam em C sobre
+        # o inteiro. A variante em array NumPy é WeightedGraphMatrix.
+        self.rows = [0] * num_vertices
 
     
     def has_edge(self, v1: int, v2: int) -> bool:
-        return self.edges[v1][v2]
+        return (self.rows[v1] >> v2) & 1 == 1
         
     def add_edge(self, v1: int, v2: int):
         if not self.has_edge(v1, v2):
-            self.edges[v1][v2] = True
+            self.rows[v1] |= 1 << v2
             self.num_edges +=1
 
     def remove_edges(self, v1: int, v2: int):
         if self.has_edge(v1,v2):
-            self.edges[v1][v2] = False
+            self.rows[v1] &= ~(1 << v2)
             self.num_edges -= 1       
 
+    def neighbors(self, v: int):
+        """Gera os vizinhos de v em ordem crescente, pulando as regiões zeradas da linha."""
+        # bin() converte a linha inteira em C; str.find salta direto para o próximo bit 1
+        bits = bin(self.rows[v])[:1:-1]   # bit menos significativo primeiro
+        u = bits.find("1")
+        while u != -1:
+            yield u
+            u = bits.find("1", u + 1)
+
+    def out_degree(self, v: int) -> int:
+        return self.rows[v].bit_count()
+
+    def transpose(self) -> "GraphMatrix":
+        # Linhas do transposto = colunas do original.
+        # Monta cada coluna num bytearray (O(1) por aresta) e converte no final.
+        n = self.num_vertices
+        columns = [bytearray((n + 7) // 8) for _ in range(n)]
+        for v in range(n):
+            byte, mask = v >> 3, 1 << (v & 7)
+            for u in self.neighbors(v):
+                columns[u][byte] |= mask
+
+        transposed = GraphMatrix(n)
+        transposed.rows = [int.from_bytes(col, "little") for col in columns]
+        transposed.num_edges = self.num_edges
+        return transposed
+
     def print_edges(self):
         for i in range(self.num_vertices):
             for j in range(self.num_vertices):
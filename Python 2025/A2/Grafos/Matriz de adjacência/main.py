@@ -95,7 +95,7 @@ g6.add_edge(1, 3)
 g6.add_edge(3, 4)
 
 print("DFS on g6 (default start):")
-dfs(g6)
+dfs(g6, verbose=True)
 
 # DFS with specific start vertex
 g7 = GraphMatrix(3)
@@ -103,7 +103,7 @@ g7.add_edge(0, 1)
 g7.add_edge(1, 2)
 
 print("\nDFS on g7 (starting at vertex 1):")
-dfs(g7, start_vertex=1)
+dfs(g7, start_vertex=1, verbose=True)
 
 # DFS on cyclic graph
 g8 = GraphMatrix(6)
@@ -115,7 +115,7 @@ g8.add_edge(4, 5)
 g8.add_edge(5, 0)  # Creates cycle
 
 print("\nDFS on g8 (graph with cycle):")
-dfs(g8)
+dfs(g8, verbose=True)
 
 # ======================
 # 5. TOPOLOGICAL SORTING TESTS
@@ -0,0 +1,73 @@
+import numpy as np
+
+
+class WeightedGraphMatrix:
+    """
+    Variante de GraphMatrix guardada num array 2-D do NumPy.
+
+    - weighted=True  → float64; matrix[i, j] = peso da aresta ou inf se não existe
+    - weighted=False → bool;    matrix[i, j] = True se existe a aresta
+
+    As operações sobre o grafo inteiro (graus, transposta, funções em
+    funcoes_numpy.py) trabalham na matriz toda de uma vez, em C.
+    """
+
+    def __init__(self, num_vertices: int, weighted: bool = True):
+        self.num_vertices = num_vertices
+        self.num_edges = 0
+        self.weighted = weighted
+
+        if weighted:
+            self.matrix = np.full((num_vertices, num_vertices), np.inf)
+        else:
+            self.matrix = np.zeros((num_vertices, num_vertices), dtype=bool)
+
+    def has_edge(self, v1: int, v2: int) -> bool:
+        if self.weighted:
+            return bool(np.isfinite(self.matrix[v1, v2]))
+        return bool(self.matrix[v1, v2])
+
+    def add_edge(self, v1: int, v2: int, peso: float = 1.0):
+        if not self.has_edge(v1, v2):
+            self.matrix[v1, v2] = peso if self.weighted else True
+            self.num_edges += 1
+
+    def remove_edges(self, v1: int, v2: int):
+        if self.has_edge(v1, v2):
+            self.matrix[v1, v2] = np.inf if self.weighted else False
+            self.num_edges -= 1
+
+    def mask(self) -> np.ndarray:
+        # Matriz booleana de adjacência (sem pesos)
+        if self.weighted:
+            return np.isfinite(self.matrix)
+        return self.matrix
+
+    def out_degrees(self) -> np.ndarray:
+        return self.mask().sum(axis=1)
+
+    def in_degrees(self) -> np.ndarray:
+        return self.mask().sum(axis=0)
+
+    def transpose(self) -> "WeightedGraphMatrix":
+        transposed = WeightedGraphMatrix(self.num_vertices, self.weighted)
+        transposed.matrix = self.matrix.T.copy()
+        transposed.num_edges = self.num_edges
+        return transposed
+
+    def print_edges(self):
+        for i, j in zip(*np.nonzero(self.mask())):
+            if self.weighted:
+                print(f"({i}, {j}, peso = {self.matrix[i, j]})", end=" ")
+            else:
+                print(f"({i}, {j})", end=" ")
+        print()
+
+    def print_matriz(self):
+        for linha in self.mask():
+            print(" ".join("1" if x else "0" for x in linha))
+
+# Complexidade:
+#   has_edge, add_edge, remove_edges → O(1)
+#   out_degrees, in_degrees, transpose → O(V²), vetorizado
+#   Espaço: 8·V² bytes (float64) ou V² bytes (bool)